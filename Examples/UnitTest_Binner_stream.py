@@ -0,0 +1,50 @@
+import sys
+from typing import List
+
+import numpy
+import pandas
+
+from pydggrid.Binner import Binner
+from pydggrid.Queries import PointValue
+from pydggrid.Types import DGGSType, OutputAddress, OutputControl
+
+if __name__ == "__main__":
+    #
+    files: List[str] = ["../DGGRID/examples/binvals/inputfiles/20k.txt",
+                        "../DGGRID/examples/binvals/inputfiles/50k.txt",
+                        "../DGGRID/examples/binvals/inputfiles/100k.txt",
+                        "../DGGRID/examples/binvals/inputfiles/200k.txt"]
+    document: PointValue = PointValue()
+    document.Meta.save("dggs_type", DGGSType.ISEA3H)
+    document.Meta.save("dggs_res_spec", 9)
+    document.Meta.save("output_address_type", OutputAddress.SEQNUM)
+    document.Meta.save("cell_output_control", OutputControl.OUTPUT_OCCUPIED)
+    #
+    print("-> REPLAY STREAM ON TWO WORKERS")
+    workers: List[Binner] = [Binner(document), Binner(document)]
+    for index, file in enumerate(files):
+        rows: numpy.ndarray = numpy.loadtxt(file, usecols=(0, 1, 2))
+        # batches of 8 points, round-robin over the workers
+        for start in range(0, len(rows), 8):
+            batch: numpy.ndarray = rows[start:start + 8]
+            workers[(start // 8) % 2].update(batch[:, 0:2], batch[:, 2])
+    #
+    print("-> SHIP AND MERGE PARTIALS")
+    binner: Binner = Binner.from_bytes(workers[0].to_bytes(), document)
+    binner.merge(Binner.from_bytes(workers[1].to_bytes(), document))
+    streamed: pandas.DataFrame = binner.result().get_frame()
+    print(f"---[STREAMED RECORDS]---\n{streamed}")
+    #
+    print("-> BIN IN ONE PAYLOAD")
+    for file in files:
+        document.input_points(file)
+    document.run()
+    batch: pandas.DataFrame = document.records.get_frame()
+    print(f"---[BATCH RECORDS]---\n{batch}")
+    [n.close() for n in workers + [binner]]
+    expected: pandas.DataFrame = batch.sort_values("point", key=lambda n: n.astype(int)).reset_index(drop=True)
+    matched: bool = (numpy.array_equal(expected["point"].to_numpy(), streamed["point"].to_numpy()) and
+                     numpy.allclose(expected["count"].to_numpy(), streamed["count"].to_numpy()) and
+                     numpy.allclose(expected["total"].to_numpy(), streamed["total"].to_numpy()))
+    print(f"---[MATCHED]--- {matched}")
+    sys.exit(0 if matched else 1)
@@ -0,0 +1,39 @@
+import time
+from typing import List
+
+from pydggrid.Executor import Executor
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+
+def clip_query(cell: int) -> Generate:
+    """
+    Generates the res 6 cells of a coarse res 2 cell
+    :param cell: Coarse cell SEQNUM
+    :return: Configured query
+    """
+    query: Generate = Generate()
+    query.Meta.save("dggs_type", DGGSType.ISEA7H)
+    query.Meta.save("dggs_res_spec", 6)
+    query.Meta.save("clip_cell_res", 2)
+    query.Meta.save("cell_output_type", CellOutput.ARROW)
+    query.Meta.save("point_output_type", PointOutput.NONE)
+    query.address_type(OutputAddress.SEQNUM)
+    query.clip_cells(list([cell]))
+    return query
+
+
+if __name__ == "__main__":
+    #
+    print("-> RUN BATCH")
+    queries: List[Generate] = [clip_query(n) for n in range(1, 101)]
+    with Executor(workers=4, max_pending=8) as executor:
+        started: float = time.perf_counter()
+        for query in executor.map(queries):
+            print(f"{query.Meta.get('clip_cell_addresses')}: {len(query.cells.get_arrow_ids())} cells")
+        print(f"---[ORDERED: {time.perf_counter() - started:.3f}s]---")
+        started = time.perf_counter()
+        completed: int = sum([1 for _ in executor.map([clip_query(n) for n in range(1, 101)], ordered=False)])
+        print(f"---[AS COMPLETED ({completed}): {time.perf_counter() - started:.3f}s]---")
+        future = executor.submit(clip_query(1))
+        print(f"---[SUBMIT]---\n{future.result().cells.get_geoframe().head()}")
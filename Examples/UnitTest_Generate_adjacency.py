@@ -0,0 +1,44 @@
+import numpy
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+
+def make_query() -> Generate:
+    query: Generate = Generate()
+    query.Meta.save("dggs_type", DGGSType.ISEA4H)
+    query.Meta.save("dggs_res_spec", 3)
+    query.Meta.save("cell_output_type", CellOutput.ARROW)
+    query.Meta.save("point_output_type", PointOutput.NONE)
+    query.address_type(OutputAddress.SEQNUM)
+    query.adjacency(neighbors=True, children=True)
+    return query
+
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: Generate = make_query()
+
+    print(f"---QUERY REQUEST---\n{document}")
+    document.run()
+    neighbors = document.neighbors
+    children = document.children
+    print(f"---[NEIGHBORS]---\n{neighbors}")
+    print(f"---[CHILDREN]---\n{children}")
+    # the arrays follow the generated cells
+    assert numpy.array_equal(neighbors["seqnum"], document.cells.get_arrow_ids().to_numpy())
+    assert len(neighbors["offsets"]) == len(neighbors["seqnum"]) + 1
+    assert neighbors["offsets"][-1] == len(neighbors["indices"])
+    # the neighbor relation is symmetric
+    sources = numpy.repeat(neighbors["seqnum"], numpy.diff(neighbors["offsets"]))
+    edges = set(zip(sources.tolist(), neighbors["indices"].tolist()))
+    assert all((target, source) in edges for source, target in edges)
+    print(f"---[EDGES]---\n{len(edges)}")
+    # a sharded run returns the same arrays
+    sharded: Generate = make_query()
+    sharded.run(workers=2)
+    for name in ["seqnum", "offsets", "indices"]:
+        assert numpy.array_equal(sharded.neighbors[name], neighbors[name])
+        assert numpy.array_equal(sharded.children[name], children[name])
+    print("---[SHARDED]---\nOK")
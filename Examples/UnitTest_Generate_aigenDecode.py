@@ -0,0 +1,27 @@
+import time
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: Generate = Generate()
+
+    document.Meta.save("dggs_type", DGGSType.ISEA7H)
+    document.Meta.save("dggs_res_spec", 6)
+    document.Meta.save("cell_output_type", CellOutput.AIGEN)
+    document.Meta.save("point_output_type", PointOutput.AIGEN)
+
+    print(f"---QUERY REQUEST---\n{document}")
+    started: float = time.perf_counter()
+    document.run()
+    print(f"---QUERY RUN + AIGEN DECODE: {time.perf_counter() - started:.3f}s---\n")
+    cells = document.cells.get_geoframe()
+    points = document.points.get_geoframe()
+    print(f"---[CELLS (GeoDataFrame)]---\n{cells.head()}")
+    print(f"---[POINTS (GeoDataFrame)]---\n{points.head()}")
+    # rings hold the cell vertices only (the center is not a vertex) and are closed
+    print(f"CELLS: {len(cells)}, POINTS: {len(points)}")
+    # cells crossing the anti-meridian are not contained in lon / lat space
+    print(f"CENTERS INSIDE CELLS: {int(cells.geometry.contains(points.geometry).sum())} / {len(cells)}")
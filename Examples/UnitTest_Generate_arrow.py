@@ -0,0 +1,26 @@
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: Generate = Generate()
+
+    document.Meta.save("dggs_type", DGGSType.ISEA7H)
+    document.Meta.save("dggs_res_spec", 5)
+    document.Meta.save("cell_output_type", CellOutput.ARROW)
+    document.Meta.save("point_output_type", PointOutput.ARROW)
+    document.address_type(OutputAddress.SEQNUM)
+    document.clip_cells(list([4, 3, 4, 3, 3]))
+
+    print(f"---QUERY REQUEST---\n{document}")
+    document.run()
+    print("---QUERY RESPONSE [CELLS]---\n")
+    print(f"---[CELLS (IDs)]---\n{document.cells.get_arrow_ids()}")
+    print(f"---[CELLS (Arrow)]---\n{document.cells.get_arrow()}")
+    print(f"---[CELLS (DataFrame)]---\n{document.cells.get_frame()}")
+    print(f"---[CELLS (GeoDataFrame)]---\n{document.cells.get_geoframe()}")
+    print("\n---QUERY RESPONSE [POINTS]---\n")
+    print(f"---[POINTS (IDs)]---\n{document.points.get_arrow_ids()}")
+    print(f"---[POINTS (Arrow)]---\n{document.points.get_arrow()}")
+    print(f"---[POINTS (GeoDataFrame)]---\n{document.points.get_geoframe()}")
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from pydggrid.Executor import Executor
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+
+def clip_query(cell: int, resolution: int = 6) -> Generate:
+    """
+    Generates the cells of a coarse res 2 cell
+    :param cell: Coarse cell SEQNUM
+    :param resolution: Generated cells resolution
+    :return: Configured query
+    """
+    query: Generate = Generate()
+    query.Meta.save("dggs_type", DGGSType.ISEA7H)
+    query.Meta.save("dggs_res_spec", resolution)
+    query.Meta.save("clip_cell_res", 2)
+    query.Meta.save("cell_output_type", CellOutput.ARROW)
+    query.Meta.save("point_output_type", PointOutput.NONE)
+    query.address_type(OutputAddress.SEQNUM)
+    query.clip_cells(list([cell]))
+    return query
+
+
+async def main() -> None:
+    print("-> RUN ASYNC (THREADS)")
+    with ThreadPoolExecutor(max_workers=4) as threads:
+        started: float = time.perf_counter()
+        queries: List[Generate] = list(await asyncio.gather(*[clip_query(n).run_async(executor=threads)
+                                                              for n in range(1, 21)]))
+        print(f"---[{len(queries)} QUERIES: {time.perf_counter() - started:.3f}s]---")
+        started = time.perf_counter()
+        try:
+            await clip_query(1, 12).run_async(timeout=0.5, executor=threads)
+        except asyncio.TimeoutError:
+            print(f"---[TIMED OUT, INTERRUPTED IN {time.perf_counter() - started:.3f}s]---")
+    print("-> RUN ASYNC (PROCESSES)")
+    with Executor(workers=4) as executor:
+        started = time.perf_counter()
+        queries = await executor.map_async([clip_query(n) for n in range(1, 21)])
+        for query in queries[:5]:
+            print(f"{query.Meta.get('clip_cell_addresses')}: {len(query.cells.get_arrow_ids())} cells")
+        print(f"---[{len(queries)} QUERIES: {time.perf_counter() - started:.3f}s]---")
+        started = time.perf_counter()
+        task: asyncio.Task = asyncio.ensure_future(clip_query(1, 12).run_async(executor=executor))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            print(f"---[CANCELLED, INTERRUPTED IN {time.perf_counter() - started:.3f}s]---")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
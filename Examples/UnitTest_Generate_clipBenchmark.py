@@ -0,0 +1,80 @@
+import time
+
+import geopandas
+import numpy
+import shapely
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput
+
+
+def clip_query(resolution: int, clip, hierarchical: bool = False) -> Generate:
+    """
+    Configures a clipped ISEA7H grid with ARROW cells so the timing is dominated by the clipping
+    :param resolution: Grid resolution
+    :param clip: Clip geometry, any type accepted by Generate.clip_geometry
+    :param hierarchical: Clip the quads coarse to fine (clip_hierarchical)
+    :return: Configured query
+    """
+    query: Generate = Generate()
+    query.Meta.save("dggs_type", DGGSType.ISEA7H)
+    query.Meta.save("dggs_res_spec", resolution)
+    query.Meta.save("clip_hierarchical", hierarchical)
+    query.Meta.save("cell_output_type", CellOutput.ARROW)
+    query.Meta.save("point_output_type", PointOutput.NONE)
+    query.clip_geometry(clip)
+    return query
+
+
+def tiles(count: int) -> geopandas.GeoDataFrame:
+    """
+    Tiles the 10 x 10 degree box of Corvallis into count x count square polygons
+    :param count: Tiles per side
+    :return: Tile polygons
+    """
+    edges: numpy.ndarray = numpy.linspace(0.0, 10.0, count + 1)
+    boxes = shapely.box(-128.0 + edges[:-1][None, :], 39.0 + edges[:-1][:, None],
+                        -128.0 + edges[1:][None, :], 39.0 + edges[1:][:, None]).ravel()
+    return geopandas.GeoDataFrame(geometry=boxes, crs="EPSG:4326")
+
+
+def benchmark(name: str, query: Generate) -> None:
+    """
+    Runs a query and prints its time and cell count
+    :param name: Case name
+    :param query: Configured query
+    :return: None
+    """
+    started: float = time.perf_counter()
+    query.run()
+    print(f"---[{name}: {len(query.cells.get_arrow_ids())} cells, {time.perf_counter() - started:.3f}s]---")
+
+
+if __name__ == "__main__":
+    #
+    print("-> SHAPEFILE CLIP CASES")
+    benchmark("gdalExample", clip_query(9, "../DGGRID/examples/gdalExample/inputfiles/corvallis.shp"))
+    benchmark("gridgenMixedSHP", clip_query(9, "../DGGRID/examples/gridgenMixedSHP/inputfiles/benton.gen"))
+    # the clip polygons are indexed per quad, the time grows with the cells tested rather than with
+    # cells x polygons
+    print("-> MANY POLYGON CLIP LAYERS")
+    for side in [10, 50, 100, 250]:
+        benchmark(f"{side * side} polygons", clip_query(8, tiles(side)))
+    # cells inside or outside a large polygon skip the clipper intersection, only the cells crossing its
+    # boundary are intersected
+    print("-> LARGE POLYGON CLIP")
+    outline = geopandas.GeoDataFrame(geometry=[shapely.Point(-120.0, 44.0).buffer(6.0, quad_segs=2048)],
+                                     crs="EPSG:4326")
+    for resolution in [8, 9, 10]:
+        benchmark(f"res {resolution}", clip_query(resolution, outline))
+    # a thin diagonal corridor tests every cell of its bounding box when scanned, coarse to fine clipping only
+    # descends along the corridor
+    print("-> CORRIDOR CLIP (SCAN / HIERARCHICAL)")
+    corridor = geopandas.GeoDataFrame(geometry=[shapely.LineString([(-124.0, 40.0), (-114.0, 48.0)]).buffer(0.05)],
+                                      crs="EPSG:4326")
+    for resolution in [9, 10, 11]:
+        scan: Generate = clip_query(resolution, corridor)
+        benchmark(f"res {resolution} scan", scan)
+        hierarchical: Generate = clip_query(resolution, corridor, True)
+        benchmark(f"res {resolution} hierarchical", hierarchical)
+        print(f"EQUAL: {numpy.array_equal(scan.cells.get_arrow_ids(), hierarchical.cells.get_arrow_ids())}")
@@ -0,0 +1,49 @@
+import time
+from typing import Any, Dict, List
+
+import numpy
+import pandas
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput
+
+
+def per_vertex_frame(geoframe) -> pandas.DataFrame:
+    """
+    Reference id / vertex table built vertex by vertex from the geometries
+    :param geoframe: Cells GeoDataFrame
+    :return: Pandas DataFrame
+    """
+    elements: List[Dict[str, Any]] = list([])
+    for data_node in geoframe.itertuples():
+        x, y = data_node.geometry.exterior.coords.xy
+        [elements.append({"id": str(data_node.id), "lat": n[0], "long": n[1]}) for n in zip(x, y)]
+    return pandas.DataFrame(elements)
+
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: Generate = Generate()
+
+    document.Meta.save("dggs_type", DGGSType.ISEA7H)
+    document.Meta.save("dggs_res_spec", 7)
+    document.Meta.save("cell_output_type", CellOutput.AIGEN)
+    document.Meta.save("point_output_type", PointOutput.NONE)
+
+    print(f"---QUERY REQUEST---\n{document}")
+    document.run()
+    cells = document.cells.get_geoframe()
+    print(f"CELLS: {len(cells)}")
+    #
+    started: float = time.perf_counter()
+    reference: pandas.DataFrame = per_vertex_frame(cells)
+    print(f"---[PER VERTEX: {time.perf_counter() - started:.3f}s]---")
+    started = time.perf_counter()
+    frame: pandas.DataFrame = document.cells.get_frame()
+    print(f"---[VECTORIZED: {time.perf_counter() - started:.3f}s]---")
+    started = time.perf_counter()
+    array: numpy.ndarray = document.cells.get_numpy()
+    print(f"---[VECTORIZED NUMPY: {time.perf_counter() - started:.3f}s]---")
+    print(f"VERTICES: {len(frame)}, EQUAL: {reference.equals(frame)}")
+    print(frame.head())
@@ -0,0 +1,18 @@
+from pydggrid.Queries import Generate
+from pydggrid.Types import DGGSType, OutputAddress
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: Generate = Generate()
+
+    document.Meta.save("dggs_type", DGGSType.ISEA7H)
+    document.Meta.save("dggs_res_spec", 4)
+    document.address_type(OutputAddress.SEQNUM)
+
+    print(f"---QUERY REQUEST---\n{document}")
+    cells: int = 0
+    for batch in document.iter_cells(chunk_size=1000, capacity=2):
+        cells += batch.num_rows
+        print(f"---[BATCH]--- {batch.num_rows} cells, {cells} total")
+    print(f"---[FIRST BATCH (GeoDataFrame)]---\n{next(document.iter_cells(chunk_size=10, as_frame=True))}")
@@ -0,0 +1,37 @@
+import time
+
+import libpydggrid
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+
+def range_query(first: int, last: int) -> Generate:
+    """
+    Generates a SEQNUM range of a res 12 ISEA7H grid
+    :param first: First cell
+    :param last: Last cell
+    :return: Configured query
+    """
+    query: Generate = Generate()
+    query.Meta.save("dggs_type", DGGSType.ISEA7H)
+    query.Meta.save("dggs_res_spec", 12)
+    query.Meta.save("cell_output_type", CellOutput.ARROW)
+    query.Meta.save("point_output_type", PointOutput.NONE)
+    query.address_type(OutputAddress.SEQNUM)
+    query.seqnum_range(first, last)
+    return query
+
+
+if __name__ == "__main__":
+    #
+    size: int = libpydggrid.grid_size(range_query(1, 1).Meta.dict())
+    print(f"-> GRID SIZE: {size}")
+    # the last cells cost as much as the first ones, DGGRID does not walk the grid up to the range
+    for first in [1, size // 2, size - 9999]:
+        query: Generate = range_query(first, first + 9999)
+        started: float = time.perf_counter()
+        query.run()
+        ids = query.cells.get_arrow_ids()
+        print(f"---[{first}-{first + 9999}: {len(ids)} cells, {ids[0]}..{ids[-1]}, "
+              f"{time.perf_counter() - started:.3f}s]---")
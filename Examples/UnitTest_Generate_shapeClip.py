@@ -0,0 +1,40 @@
+import sys
+
+import numpy
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+
+def clip_query() -> Generate:
+    """
+    Configures an ISEA4T resolution 7 grid with ARROW cells
+    :return: Configured query
+    """
+    query: Generate = Generate()
+    query.Meta.save("dggs_type", DGGSType.ISEA4T)
+    query.Meta.save("dggs_res_spec", 7)
+    query.Meta.save("cell_output_type", CellOutput.ARROW)
+    query.Meta.save("point_output_type", PointOutput.NONE)
+    query.address_type(OutputAddress.SEQNUM)
+    return query
+
+
+if __name__ == "__main__":
+    #
+    print("-> CLIP WITH AN IN-MEMORY SHAPEFILE (SHAPEFILE)")
+    shape: Generate = clip_query()
+    shape.clip_shape("../DGGRID/examples/isea4t/inputfiles/orbuff.shp")
+    shape.run()
+    shape_ids: numpy.ndarray = numpy.sort(shape.cells.get_arrow_ids().to_numpy(zero_copy_only=False))
+    print(f"---[SHAPEFILE CELLS]--- {len(shape_ids)}")
+    #
+    print("-> CLIP WITH THE SAME POLYGONS (GDAL)")
+    gdal: Generate = clip_query()
+    gdal.clip_geometry("../DGGRID/examples/isea4t/inputfiles/orbuff.shp")
+    gdal.run()
+    gdal_ids: numpy.ndarray = numpy.sort(gdal.cells.get_arrow_ids().to_numpy(zero_copy_only=False))
+    print(f"---[GDAL CELLS]--- {len(gdal_ids)}")
+    matched: bool = len(shape_ids) > 0 and numpy.array_equal(shape_ids, gdal_ids)
+    print(f"---[MATCHED]--- {matched}")
+    sys.exit(0 if matched else 1)
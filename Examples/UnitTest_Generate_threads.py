@@ -0,0 +1,46 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import pandas
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+GRIDS: List[Tuple[DGGSType, int]] = list([(DGGSType.ISEA3H, 5),
+                                          (DGGSType.ISEA4T, 4),
+                                          (DGGSType.ISEA7H, 4),
+                                          (DGGSType.FULLER4D, 4)])
+
+
+def generate(dggs_type: DGGSType, resolution: int) -> pandas.DataFrame:
+    """
+    Generates the cells of a whole earth grid, DGGRID runs with the GIL released
+    :param dggs_type: DGGS Type
+    :param resolution: DGGS Resolution
+    :return: Cells frame
+    """
+    document: Generate = Generate()
+    document.Meta.save("dggs_type", dggs_type)
+    document.Meta.save("dggs_res_spec", resolution)
+    document.Meta.save("cell_output_type", CellOutput.ARROW)
+    document.Meta.save("point_output_type", PointOutput.NONE)
+    document.address_type(OutputAddress.SEQNUM)
+    document.run()
+    return document.cells.get_frame()
+
+
+if __name__ == "__main__":
+    #
+    print("-> RUN SERIAL")
+    serial: List[pandas.DataFrame] = [generate(*n) for n in GRIDS]
+    #
+    print("-> RUN CONCURRENT (THREADS)")
+    arguments: List[Tuple[DGGSType, int]] = GRIDS * 4
+    with ThreadPoolExecutor(max_workers=8) as threads:
+        concurrent: List[pandas.DataFrame] = list(threads.map(lambda n: generate(*n), arguments))
+    matched: bool = all([concurrent[n].equals(serial[n % len(GRIDS)]) for n in range(0, len(arguments))])
+    for index, (dggs_type, resolution) in enumerate(GRIDS):
+        print(f"---[{dggs_type.name} {resolution}]--- {len(serial[index])} cells")
+    print(f"---[MATCHED]--- {matched}")
+    sys.exit(0 if matched else 1)
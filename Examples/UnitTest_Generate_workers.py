@@ -0,0 +1,19 @@
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: Generate = Generate()
+
+    document.Meta.save("dggs_type", DGGSType.ISEA7H)
+    document.Meta.save("dggs_res_spec", 4)
+    document.Meta.save("cell_output_type", CellOutput.ARROW)
+    document.Meta.save("point_output_type", PointOutput.NONE)
+    document.address_type(OutputAddress.SEQNUM)
+
+    print(f"---QUERY REQUEST---\n{document}")
+    document.run(workers=4)
+    print("---QUERY RESPONSE [CELLS, 4 WORKERS]---\n")
+    print(f"---[CELLS (IDs)]---\n{document.cells.get_arrow_ids()}")
+    print(f"---[CELLS (GeoDataFrame)]---\n{document.cells.get_geoframe()}")
@@ -0,0 +1,40 @@
+import sys
+from typing import Dict
+
+import libpydggrid
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput, OutputAddress
+
+
+def generate() -> None:
+    """
+    Generates the cells of an ISEA7H resolution 4 whole earth grid
+    :return: None
+    """
+    document: Generate = Generate()
+    document.Meta.save("dggs_type", DGGSType.ISEA7H)
+    document.Meta.save("dggs_res_spec", 4)
+    document.Meta.save("cell_output_type", CellOutput.ARROW)
+    document.Meta.save("point_output_type", PointOutput.NONE)
+    document.address_type(OutputAddress.SEQNUM)
+    document.run()
+
+
+if __name__ == "__main__":
+    #
+    print("-> CLEAR GRID CACHE")
+    libpydggrid.clear_grid_cache()
+    print(f"---[GRID CACHE]--- {libpydggrid.grid_cache_info()}")
+    #
+    print("-> RUN TWO QUERIES ON THE SAME GRID")
+    generate()
+    first: Dict[str, int] = libpydggrid.grid_cache_info()
+    print(f"---[GRID CACHE, FIRST RUN]--- {first}")
+    generate()
+    second: Dict[str, int] = libpydggrid.grid_cache_info()
+    print(f"---[GRID CACHE, SECOND RUN]--- {second}")
+    hit: bool = (first["hits"] == 0 and first["misses"] == 1 and first["size"] == 1 and
+                 second["hits"] == 1 and second["misses"] == 1 and second["size"] == 1)
+    print(f"---[CACHE HIT]--- {hit}")
+    sys.exit(0 if hit else 1)
@@ -0,0 +1,28 @@
+import time
+
+from pydggrid.Queries import Generate
+from pydggrid.Types import CellOutput, DGGSType, PointOutput
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: Generate = Generate()
+
+    document.Meta.save("dggs_type", DGGSType.ISEA7H)
+    document.Meta.save("dggs_res_spec", 6)
+    document.Meta.save("cell_output_type", CellOutput.AIGEN)
+    document.Meta.save("point_output_type", PointOutput.AIGEN)
+
+    print(f"---QUERY REQUEST---\n{document}")
+    started: float = time.perf_counter()
+    document.run()
+    # the responses are kept as buffers, the unread points output is never decoded
+    print(f"---QUERY RUN: {time.perf_counter() - started:.3f}s---\n")
+    for attempt in ["FIRST", "CACHED"]:
+        started = time.perf_counter()
+        cells = document.cells.get_numpy()
+        print(f"---[CELLS (Numpy) {attempt}: {time.perf_counter() - started:.3f}s]---\n{cells[:5]}")
+    document.cells.release()
+    started = time.perf_counter()
+    cells = document.cells.get_numpy()
+    print(f"---[CELLS (Numpy) AFTER RELEASE: {time.perf_counter() - started:.3f}s]---\n{cells[:5]}")
@@ -0,0 +1,35 @@
+import sys
+
+from pydggrid.Queries import PointValue
+from pydggrid.Types import DGGSType, BinCoverage, OutputAddress, OutputControl
+
+if __name__ == "__main__":
+    #
+    print("-> READ QUERY")
+    document: PointValue = PointValue()
+    document.Meta.save("dggs_type", DGGSType.ISEA3H)
+    document.Meta.save("dggs_res_spec", 21)
+    document.Meta.save("bin_coverage", BinCoverage.SPARSE)
+    document.Meta.save("output_address_type", OutputAddress.SEQNUM)
+    document.Meta.save("cell_output_control", OutputControl.OUTPUT_OCCUPIED)
+    document.input_points("../DGGRID/examples/binvals/inputfiles/20k.txt")
+    document.input_points("../DGGRID/examples/binvals/inputfiles/50k.txt")
+    document.input_points("../DGGRID/examples/binvals/inputfiles/100k.txt")
+    document.input_points("../DGGRID/examples/binvals/inputfiles/200k.txt")
+
+    print(f"---QUERY REQUEST---\n{document}")
+    document.run()
+    print("\n---QUERY RESPONSE [RECORDS]---\n")
+    print(f"COLUMNS: {document.records.get_columns()}\n")
+    print(f"---[RECORDS (DataFrame)]---\n{document.records.get_frame()}")
+
+    # the sparse bins hold the same cells as the partial bins, at a memory cost of the occupied cells only
+    document.Meta.save("bin_coverage", BinCoverage.PARTIAL)
+    document.Meta.save("dggs_res_spec", 9)
+    document.run()
+    partial: int = len(document.records.get_frame())
+    document.Meta.save("bin_coverage", BinCoverage.SPARSE)
+    document.run()
+    sparse: int = len(document.records.get_frame())
+    print(f"---[PARTIAL / SPARSE CELLS]---\n{partial} / {sparse}")
+    sys.exit(0 if partial == sparse else 1)
@@ -0,0 +1,35 @@
+import sys
+import time
+
+import numpy
+import pandas
+
+from pydggrid.Queries import PointValue
+from pydggrid.Types import DGGSType, OutputAddress, OutputControl
+
+if __name__ == "__main__":
+    #
+    generator: numpy.random.Generator = numpy.random.default_rng(0)
+    points: numpy.ndarray = numpy.column_stack([generator.uniform(-180.0, 180.0, 200000),
+                                                generator.uniform(-90.0, 90.0, 200000),
+                                                generator.uniform(0.0, 100.0, 200000)])
+    frames = dict({})
+    for packed in [True, False]:
+        document: PointValue = PointValue()
+        document.Meta.save("dggs_type", DGGSType.ISEA3H)
+        document.Meta.save("dggs_res_spec", 6)
+        document.Meta.save("output_address_type", OutputAddress.SEQNUM)
+        document.Meta.save("cell_output_control", OutputControl.OUTPUT_OCCUPIED)
+        # noinspection PyProtectedMember
+        document._input.packed = packed
+        start: float = time.perf_counter()
+        document.input_points(points)
+        document.run()
+        print(f"---[{'PACKED' if packed else 'TEXT'} ({(time.perf_counter() - start) * 1000:.1f} ms)]---")
+        frames[packed] = document.records.get_frame()
+        print(frames[packed])
+    matched: bool = len(frames[True]) == len(frames[False]) and \
+        numpy.allclose(frames[True]["count"].to_numpy(), frames[False]["count"].to_numpy()) and \
+        numpy.allclose(frames[True]["total"].to_numpy(), frames[False]["total"].to_numpy(), rtol=1e-5)
+    print(f"---[MATCHED]--- {matched}")
+    sys.exit(0 if matched else 1)
@@ -0,0 +1,45 @@
+import sys
+from typing import List
+
+import pandas
+
+from pydggrid.Queries import PointValue
+from pydggrid.Types import DGGSType, BinCoverage, OutputAddress, OutputControl
+
+
+def binvals(workers: int) -> pandas.DataFrame:
+    """
+    Bins the binvals example cities into Q2DI cells
+    :param workers: Number of worker processes
+    :return: Records frame, rows sorted
+    """
+    document: PointValue = PointValue()
+    document.Meta.save("dggs_type", DGGSType.ISEA3H)
+    document.Meta.save("dggs_res_spec", 9)
+    document.Meta.save("bin_coverage", BinCoverage.PARTIAL)
+    document.Meta.save("output_address_type", OutputAddress.Q2DI)
+    document.Meta.save("cell_output_control", OutputControl.OUTPUT_OCCUPIED)
+    for file in files:
+        document.input_points(file)
+    document.run(workers=workers)
+    frame: pandas.DataFrame = document.records.get_frame()
+    return frame.sort_values(list(frame.columns)).reset_index(drop=True)
+
+
+files: List[str] = ["../DGGRID/examples/binvals/inputfiles/20k.txt",
+                    "../DGGRID/examples/binvals/inputfiles/50k.txt",
+                    "../DGGRID/examples/binvals/inputfiles/100k.txt",
+                    "../DGGRID/examples/binvals/inputfiles/200k.txt"]
+
+if __name__ == "__main__":
+    #
+    print("-> BIN ON ONE WORKER")
+    single: pandas.DataFrame = binvals(1)
+    print(f"---[RECORDS, 1 WORKER]---\n{single}")
+    #
+    print("-> BIN ON FOUR WORKERS")
+    parallel: pandas.DataFrame = binvals(4)
+    print(f"---[RECORDS, 4 WORKERS]---\n{parallel}")
+    matched: bool = single.equals(parallel)
+    print(f"---[MATCHED]--- {matched}")
+    sys.exit(0 if matched else 1)
@@ -0,0 +1,53 @@
+import sys
+import time
+from typing import Dict
+
+import libpydggrid
+import numpy
+
+from pydggrid.Queries import PointValue, Transform
+from pydggrid.Session import Session
+from pydggrid.Types import DGGSType
+
+
+def benchmark(name: str, session: Session, points: numpy.ndarray) -> float:
+    """
+    Runs a session on a point set and prints the free list counters per point
+    :param name: Benchmark name
+    :param session: Session to run
+    :param points: (n, 2) or (n, 3) point array
+    :return: System allocations per point
+    """
+    before: Dict[str, int] = libpydggrid.allocation_info()
+    start: float = time.perf_counter()
+    session.transform(points) if name == "TRANSFORM" else session.bin(points)
+    elapsed: float = (time.perf_counter() - start) * 1000
+    after: Dict[str, int] = libpydggrid.allocation_info()
+    requests: float = (after["requests"] - before["requests"]) / len(points)
+    allocations: float = (after["allocations"] - before["allocations"]) / len(points)
+    print(f"---[{name} {len(points)} points ({elapsed:.1f} ms)]--- "
+          f"{requests:.2f} location allocations / point, {allocations:.4f} system allocations / point")
+    return allocations
+
+
+if __name__ == "__main__":
+    #
+    generator: numpy.random.Generator = numpy.random.default_rng(0)
+    size: int = 500000
+    points: numpy.ndarray = numpy.column_stack([generator.uniform(-180.0, 180.0, size),
+                                                generator.uniform(-90.0, 90.0, size),
+                                                generator.uniform(0.0, 100.0, size)])
+    transform: Transform = Transform()
+    transform.Meta.save("dggs_type", DGGSType.ISEA3H)
+    transform.Meta.save("dggs_res_spec", 9)
+    values: PointValue = PointValue()
+    values.Meta.save("dggs_type", DGGSType.ISEA3H)
+    values.Meta.save("dggs_res_spec", 9)
+    with Session(transform) as session:
+        # the first run warms up the free lists
+        benchmark("TRANSFORM", session, points[0:1000, 0:2])
+        rate: float = benchmark("TRANSFORM", session, points[:, 0:2])
+    with Session(values) as session:
+        benchmark("BIN", session, points[0:1000])
+        rate = max(rate, benchmark("BIN", session, points))
+    sys.exit(0 if rate < 0.01 else 1)
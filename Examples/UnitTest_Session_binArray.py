@@ -0,0 +1,28 @@
+import time
+
+import numpy
+
+from pydggrid.Queries import PointValue
+from pydggrid.Session import Session
+from pydggrid.Types import DGGSType
+
+if __name__ == "__main__":
+    #
+    print("-> OPEN SESSION")
+    document: PointValue = PointValue()
+    document.Meta.save("dggs_type", DGGSType.ISEA3H)
+    document.Meta.save("dggs_res_spec", 9)
+    #
+    generator: numpy.random.Generator = numpy.random.default_rng(0)
+    lon: numpy.ndarray = generator.uniform(-180.0, 180.0, 1000000)
+    lat: numpy.ndarray = generator.uniform(-90.0, 90.0, 1000000)
+    values: numpy.ndarray = generator.uniform(0.0, 100.0, 1000000)
+    classes: numpy.ndarray = generator.integers(0, 3, 1000000)
+    with Session(document) as session:
+        start: float = time.perf_counter()
+        cells = session.bin_array(lon, lat, values)
+        print(f"---[BIN VALUES ({(time.perf_counter() - start) * 1000:.1f} ms)]---")
+        print(f"{cells['seqnum']}\n{cells['count']}\n{cells['total']}\n{cells['mean']}")
+        print(f"---[TOTAL COUNT]--- {cells['count'].sum()}")
+        presence = session.bin_array(lon, lat, classes=classes)
+        print(f"---[BIN PRESENCE]---\n{presence['seqnum']}\n{presence['classes']}\n{presence['presence']}")
@@ -0,0 +1,37 @@
+import sys
+from typing import Dict
+
+import pandas
+
+from pydggrid.Queries import Transform, PointValue
+from pydggrid.Session import Session
+from pydggrid.Types import DGGSType, OutputAddress, OutputControl
+
+if __name__ == "__main__":
+    #
+    print("-> TRANSFORM THE SAME BATCH TWICE")
+    transform: Transform = Transform()
+    transform.Meta.save("dggs_type", DGGSType.ISEA3H)
+    transform.Meta.save("dggs_res_spec", 9)
+    transform_meta: Dict[str, str] = transform.Meta.dict()
+    with Session(transform) as session:
+        first: pandas.DataFrame = session.transform("../DGGRID/examples/transform/inputfiles/20k.txt").get_frame()
+        second: pandas.DataFrame = session.transform("../DGGRID/examples/transform/inputfiles/20k.txt").get_frame()
+    print(f"---[TRANSFORM RECORDS]---\n{second}")
+    transformed: bool = first.equals(second) and transform.Meta.dict() == transform_meta
+    print(f"---[TRANSFORM MATCHED]--- {transformed}")
+    #
+    print("-> BIN THE SAME BATCH TWICE")
+    binvals: PointValue = PointValue()
+    binvals.Meta.save("dggs_type", DGGSType.ISEA3H)
+    binvals.Meta.save("dggs_res_spec", 9)
+    binvals.Meta.save("output_address_type", OutputAddress.SEQNUM)
+    binvals.Meta.save("cell_output_control", OutputControl.OUTPUT_OCCUPIED)
+    binvals_meta: Dict[str, str] = binvals.Meta.dict()
+    with Session(binvals) as session:
+        first: pandas.DataFrame = session.bin("../DGGRID/examples/binvals/inputfiles/20k.txt").get_frame()
+        second: pandas.DataFrame = session.bin("../DGGRID/examples/binvals/inputfiles/20k.txt").get_frame()
+    print(f"---[BIN RECORDS]---\n{second}")
+    binned: bool = first.equals(second) and binvals.Meta.dict() == binvals_meta
+    print(f"---[BIN MATCHED]--- {binned}")
+    sys.exit(0 if transformed and binned else 1)
@@ -0,0 +1,21 @@
+import time
+
+from pydggrid.Queries import Transform
+from pydggrid.Session import Session
+from pydggrid.Types import DGGSType
+
+if __name__ == "__main__":
+    #
+    print("-> OPEN SESSION")
+    document: Transform = Transform()
+    document.Meta.save("dggs_type", DGGSType.ISEA3H)
+    document.Meta.save("dggs_res_spec", 9)
+    #
+    with Session(document) as session:
+        for run in range(0, 3):
+            start: float = time.perf_counter()
+            records = session.transform("../DGGRID/examples/transform/inputfiles/20k.txt")
+            print(f"---[RUN {run + 1} ({(time.perf_counter() - start) * 1000:.1f} ms)]---")
+            print(f"COLUMNS: {records.get_columns()}\n")
+            print(f"{records.get_frame()}")
+        print(f"RUNS: {session.runs()}")
@@ -0,0 +1,30 @@
+import time
+
+import numpy
+
+from pydggrid.Queries import Transform
+from pydggrid.Session import Session
+from pydggrid.Types import DGGSType, InputAddress, OutputAddress
+
+if __name__ == "__main__":
+    #
+    print("-> OPEN SESSION")
+    document: Transform = Transform()
+    document.Meta.save("dggs_type", DGGSType.ISEA3H)
+    document.Meta.save("dggs_res_spec", 9)
+    #
+    generator: numpy.random.Generator = numpy.random.default_rng(0)
+    lon: numpy.ndarray = generator.uniform(-180.0, 180.0, 1000000)
+    lat: numpy.ndarray = generator.uniform(-90.0, 90.0, 1000000)
+    with Session(document) as session:
+        start: float = time.perf_counter()
+        cells = session.transform_array(lon, lat, output_address=OutputAddress.SEQNUM)
+        print(f"---[GEO -> SEQNUM ({(time.perf_counter() - start) * 1000:.1f} ms)]---\n{cells['seqnum']}")
+        q2di = session.transform_array(cells["seqnum"],
+                                       input_address=InputAddress.SEQNUM,
+                                       output_address=OutputAddress.Q2DI)
+        print(f"---[SEQNUM -> Q2DI]---\n{q2di['quad']}\n{q2di['i']}\n{q2di['j']}")
+        centers = session.transform_array(q2di["quad"], q2di["i"], q2di["j"],
+                                          input_address=InputAddress.Q2DI,
+                                          output_address=OutputAddress.GEO)
+        print(f"---[Q2DI -> GEO]---\n{centers['lon']}\n{centers['lat']}")
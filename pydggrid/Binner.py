@@ -0,0 +1,231 @@
+import io
+import json
+from typing import Dict, List, Tuple
+
+import geopandas
+import numpy
+import pandas
+import shapely
+
+from pydggrid.Objects import Attributes
+from pydggrid.Output import Records
+from pydggrid.Queries._Template import Template
+from pydggrid.Session import Session
+from pydggrid.Types import Operation, ReadMode
+
+
+class Binner:
+    """
+    Incremental point binner with BIN_POINT_VALS semantics, points are binned batch by batch with the session grid
+    into a partial aggregate of the occupied cells (count, total and presence flags), partial aggregates can be
+    merged and shipped between workers as bytes. Batches are binned sparsely and their cells are buffered, they are
+    reduced into the aggregate once they outnumber it or when the aggregate is read
+    - session: Session used to bin the batches
+    """
+
+    # minimum number of buffered batch cells before a reduction
+    _pending_cells: int = 65536
+
+    def __init__(self, source: [Template, Attributes]):
+        """
+        Default constructor
+        :param source: A configured PointValue or PointPresence query, or the Attributes (query.Meta) of one
+        """
+        self.session: Session = Session(source)
+        if self.session.query.type() not in [Operation.BIN_POINT_VALS, Operation.BIN_POINT_PRESENCE]:
+            self.session.close()
+            raise ValueError(f"Binner requires a BIN_POINT_VALS or BIN_POINT_PRESENCE query, "
+                             f"not {self.session.query.type().name}")
+        self._seqnum: numpy.ndarray = numpy.array([], dtype=numpy.uint64)
+        self._count: numpy.ndarray = numpy.array([], dtype=numpy.uint64)
+        self._total: numpy.ndarray = numpy.array([], dtype=numpy.float64)
+        self._presence: numpy.ndarray = numpy.zeros((0, 0), dtype=numpy.uint8)
+        self._pending: List[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]] = list([])
+        self._pending_size: int = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        self._reduce()
+        return len(self._seqnum)
+
+    def update(self,
+               points: [numpy.ndarray, geopandas.GeoSeries, geopandas.GeoDataFrame],
+               values: [numpy.ndarray, None] = None,
+               classes: [numpy.ndarray, int, None] = None) -> None:
+        """
+        Bins a batch of points into the aggregate
+        :param points: Batch points, a (n, 2) array of lon, lat coordinates or a GeoSeries / GeoDataFrame of points
+        :param values: Point values, summed into the cell totals, optional
+        :param classes: Point class indexes from 0, or a single class index for the whole batch (the input file
+        index in DGGRID terms), sets the presence flags of the cells, optional
+        :return: None
+        """
+        lon, lat = Binner._coordinates(points)
+        if isinstance(classes, int):
+            classes = numpy.full(len(lon), classes, dtype=numpy.int64)
+        cells: Dict[str, numpy.ndarray] = self.session.bin_array(lon, lat, values, classes, sparse=True)
+        presence: numpy.ndarray = cells.get("presence", numpy.zeros((len(cells["seqnum"]), 0), dtype=numpy.uint8))
+        self._combine(cells["seqnum"], cells["count"], cells["total"], presence)
+
+    def merge(self, other: "Binner") -> None:
+        """
+        Merges the partial aggregate of another binner into this one, counts and totals are summed and presence flags
+        are or-ed
+        :param other: Binner over the same grid
+        :return: None
+        """
+        if other.session.query.Meta.dict() != self.session.query.Meta.dict():
+            raise ValueError("Cannot merge binners with different query attributes")
+        other._reduce()
+        self._combine(other._seqnum, other._count, other._total, other._presence)
+
+    def result(self) -> Records:
+        """
+        Returns the binned cells in SEQNUM order as PointValue.run() records, only the occupied cells are returned.
+        The presence vector is a "0101..." string with one character per class, exact for any number of classes
+        :return: Binned records
+        """
+        self._reduce()
+        count: numpy.ndarray = self._count.astype(numpy.float64)
+        frame: Dict[str, numpy.ndarray] = dict({"point": self._seqnum.astype(str),
+                                                "count": count,
+                                                "total": self._total,
+                                                "mean": numpy.divide(self._total, count,
+                                                                     out=numpy.zeros(len(count)),
+                                                                     where=count > 0)})
+        if self._presence.shape[1] > 0:
+            # the presence vector as DGGRID prints it, e.g. "0101", one character per class
+            flags: numpy.ndarray = numpy.ascontiguousarray(self._presence + ord("0"), dtype=numpy.uint8)
+            frame["classes"] = self._presence.sum(axis=1).astype(numpy.float64)
+            frame["vector"] = flags.view(f"S{flags.shape[1]}").ravel().astype(str)
+        else:
+            frame["classes"] = numpy.zeros(len(count))
+            frame["vector"] = numpy.full(len(count), "")
+        records: Records = Records()
+        records.save(pandas.DataFrame(frame), ReadMode.FRAME)
+        return records
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the partial aggregate
+        :return: Aggregate bytes
+        """
+        self._reduce()
+        buffer: io.BytesIO = io.BytesIO()
+        meta: bytes = json.dumps(self.session.query.Meta.dict(), sort_keys=True).encode("utf-8")
+        numpy.savez(buffer,
+                    meta=numpy.frombuffer(meta, dtype=numpy.uint8),
+                    seqnum=self._seqnum,
+                    count=self._count,
+                    total=self._total,
+                    presence=self._presence)
+        return buffer.getvalue()
+
+    @staticmethod
+    def from_bytes(byte_data: bytes, source: [Template, Attributes]) -> "Binner":
+        """
+        Deserializes a partial aggregate
+        :param byte_data: Aggregate bytes, see to_bytes()
+        :param source: The query or query attributes the aggregate was binned with
+        :return: Binner holding the aggregate
+        """
+        binner: Binner = Binner(source)
+        with numpy.load(io.BytesIO(byte_data), allow_pickle=False) as arrays:
+            meta: Dict[str, str] = json.loads(arrays["meta"].tobytes().decode("utf-8"))
+            if meta != binner.session.query.Meta.dict():
+                binner.close()
+                raise ValueError("Aggregate was binned with different query attributes")
+            binner._combine(arrays["seqnum"], arrays["count"], arrays["total"], arrays["presence"])
+        return binner
+
+    def close(self) -> None:
+        """
+        Closes the binner session, the aggregate stays readable
+        :return: None
+        """
+        self.session.close()
+
+    # INTERNAL
+
+    def _combine(self,
+                 seqnum: numpy.ndarray,
+                 count: numpy.ndarray,
+                 total: numpy.ndarray,
+                 presence: numpy.ndarray) -> None:
+        """
+        Buffers cell columns to be combined into the aggregate
+        :param seqnum: Cell SEQNUMs
+        :param count: Cell point counts
+        :param total: Cell value totals
+        :param presence: Cell presence flags, (cells x classes)
+        :return: None
+        """
+        if len(seqnum) == 0:
+            return
+        self._pending.append((seqnum.astype(numpy.uint64), count, total, presence.astype(numpy.uint8)))
+        self._pending_size += len(seqnum)
+        if self._pending_size >= max(len(self._seqnum), Binner._pending_cells):
+            self._reduce()
+
+    def _reduce(self) -> None:
+        """
+        Combines the buffered cell columns into the aggregate, the cells of a SEQNUM are summed in a single pass
+        :return: None
+        """
+        if len(self._pending) == 0:
+            return
+        pending: List[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]] = self._pending
+        self._pending = list([])
+        self._pending_size = 0
+        cells, inverse = numpy.unique(numpy.concatenate([self._seqnum] + [n[0] for n in pending]),
+                                      return_inverse=True)
+        size: int = len(cells)
+        # exact for counts up to 2^53
+        counts: numpy.ndarray = numpy.bincount(inverse,
+                                               weights=numpy.concatenate([self._count] + [n[1] for n in pending])
+                                               .astype(numpy.float64),
+                                               minlength=size)
+        totals: numpy.ndarray = numpy.bincount(inverse,
+                                               weights=numpy.concatenate([self._total] + [n[2] for n in pending]),
+                                               minlength=size)
+        num_classes: int = max([self._presence.shape[1]] + [n[3].shape[1] for n in pending])
+        flags: numpy.ndarray = numpy.concatenate([Binner._widen(self._presence, num_classes)] +
+                                                 [Binner._widen(n[3], num_classes) for n in pending])
+        merged: numpy.ndarray = numpy.zeros((size, num_classes), dtype=numpy.uint8)
+        for index in range(0, num_classes):
+            merged[:, index] = numpy.bincount(inverse, weights=flags[:, index], minlength=size) > 0
+        self._seqnum = cells
+        self._count = numpy.rint(counts).astype(numpy.uint64)
+        self._total = totals
+        self._presence = merged
+
+    @staticmethod
+    def _widen(presence: numpy.ndarray, num_classes: int) -> numpy.ndarray:
+        """
+        Pads presence flags with empty classes
+        :param presence: Presence flags, (cells x classes)
+        :param num_classes: Number of classes
+        :return: (cells x num_classes) presence flags
+        """
+        return numpy.pad(presence, ((0, 0), (0, num_classes - presence.shape[1])))
+
+    @staticmethod
+    def _coordinates(points: [numpy.ndarray,
+                              geopandas.GeoSeries,
+                              geopandas.GeoDataFrame]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the coordinate columns of a batch of points
+        :param points: Batch points
+        :return: lon, lat columns
+        """
+        if isinstance(points, geopandas.GeoDataFrame):
+            points = points.geometry
+        if isinstance(points, geopandas.GeoSeries):
+            points = shapely.get_coordinates(points.values)
+        coordinates: numpy.ndarray = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 2)
+        return numpy.ascontiguousarray(coordinates[:, 0]), numpy.ascontiguousarray(coordinates[:, 1])
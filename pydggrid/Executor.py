@@ -0,0 +1,236 @@
+import asyncio
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Deque, Dict, Iterable, Iterator, List, Set
+
+import libpydggrid
+import numpy
+
+from pydggrid.Queries._Template import Template
+
+
+class Executor:
+    """
+    Process pool executor of independent queries, each query is run by libpydggrid.RunQuery in a worker process
+    and its response is read back into the submitted query object. Payloads are handed to the workers through
+    shared memory blocks instead of being pickled, and every worker keeps its own grid cache across the queries
+    it runs. The first byte of each block is the interrupt flag of the query, see run_async()
+    - workers: Number of worker processes
+    - max_pending: Maximum number of queries in flight, submit() blocks until a query completes beyond it
+    """
+
+    def __init__(self,
+                 workers: [int, None] = None,
+                 max_pending: [int, None] = None,
+                 grid_cache_size: [int, None] = None):
+        """
+        Default constructor
+        :param workers: Number of worker processes, the number of CPUs by default
+        :param max_pending: Maximum number of queries in flight, twice the number of workers by default
+        :param grid_cache_size: Number of grids cached by each worker, the library default if not set
+        """
+        self.workers: int = max(1, workers if workers is not None else (os.cpu_count() or 1))
+        self.max_pending: int = max(1, max_pending if max_pending is not None else 2 * self.workers)
+        self._slots: threading.BoundedSemaphore = threading.BoundedSemaphore(self.max_pending)
+        self._lock: threading.Lock = threading.Lock()
+        self._flags: Dict[Future, SharedMemory] = dict({})
+        self._pool: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=self.workers,
+                                                              initializer=_initialize_worker,
+                                                              initargs=(grid_cache_size,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def submit(self, query: Template) -> Future:
+        """
+        Submits a query, blocks while max_pending queries are in flight
+        :param query: Configured query
+        :return: Future of the query, resolved once its response is read into the query outputs
+        """
+        dictionary, payload = query.prepare()
+        self._slots.acquire()
+        try:
+            memory: SharedMemory = Executor._share(payload)
+        except BaseException:
+            self._slots.release()
+            raise
+        result: Future = Future()
+        with self._lock:
+            self._flags[result] = memory
+        try:
+            task: Future = self._pool.submit(_run_shared, dictionary, memory.name, len(payload))
+        except BaseException:
+            self._free(memory, result)
+            raise
+        task.add_done_callback(lambda done: self._complete(done, query, memory, result))
+        return result
+
+    def map(self, queries: Iterable[Template], ordered: bool = True) -> Iterator[Template]:
+        """
+        Runs queries in the pool, queries are submitted as the pending ones complete
+        :param queries: Configured queries
+        :param ordered: Yield the queries in submission order, otherwise as they complete
+        :return: Iterator of the queries with their outputs read
+        """
+        pending: Deque[Future] = deque()
+        for query in queries:
+            pending.append(self.submit(query))
+            while Executor._ready(pending, ordered):
+                yield Executor._take(pending, ordered)
+        while len(pending) > 0:
+            yield Executor._take(pending, ordered)
+
+    async def run_async(self, query: Template, timeout: [float, None] = None) -> Template:
+        """
+        Runs a query in the pool without blocking the event loop, the query is interrupted in its worker if the
+        call is cancelled or times out
+        :param query: Configured query
+        :param timeout: Seconds to wait for the query, no timeout if None
+        :return: The query with its outputs read
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # submit() blocks while max_pending queries are in flight
+        result: Future = await loop.run_in_executor(None, self.submit, query)
+        future: asyncio.Future = asyncio.wrap_future(result)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            self._interrupt(result)
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            raise
+
+    async def map_async(self, queries: Iterable[Template], timeout: [float, None] = None) -> List[Template]:
+        """
+        Runs queries in the pool without blocking the event loop
+        :param queries: Configured queries
+        :param timeout: Seconds to wait for each query, no timeout if None
+        :return: The queries with their outputs read, in submission order
+        """
+        return list(await asyncio.gather(*[self.run_async(query, timeout) for query in queries]))
+
+    def close(self, wait_pending: bool = True) -> None:
+        """
+        Shuts the worker processes down
+        :param wait_pending: Wait for the queries in flight to complete
+        :return: None
+        """
+        self._pool.shutdown(wait=wait_pending, cancel_futures=not wait_pending)
+
+    # INTERNAL
+
+    def _complete(self, task: Future, query: Template, memory: SharedMemory, result: Future) -> None:
+        """
+        Reads a completed query response into its query, called by the pool once the worker is done
+        :param task: Worker future
+        :param query: Submitted query
+        :param memory: Payload shared memory block
+        :param result: Query future
+        :return: None
+        """
+        self._free(memory, result)
+        try:
+            if task.cancelled():
+                result.cancel()
+                return
+            query.read(task.result())
+            result.set_result(query)
+        except BaseException as exception:
+            result.set_exception(exception)
+
+    def _free(self, memory: SharedMemory, result: Future) -> None:
+        """
+        Releases a payload shared memory block and its pending slot
+        :param memory: Payload shared memory block
+        :param result: Query future
+        :return: None
+        """
+        with self._lock:
+            self._flags.pop(result, None)
+            memory.close()
+        memory.unlink()
+        self._slots.release()
+
+    def _interrupt(self, result: Future) -> None:
+        """
+        Sets the interrupt flag of a submitted query, DGGRID stops at the next cell or point of its main loops
+        :param result: Query future
+        :return: None
+        """
+        with self._lock:
+            memory: [SharedMemory, None] = self._flags.get(result)
+            if memory is not None:
+                memory.buf[0] = 1
+
+    @staticmethod
+    def _share(payload: bytes) -> SharedMemory:
+        """
+        Copies a payload into a new shared memory block, after a cleared interrupt flag byte
+        :param payload: Payload bytes
+        :return: Shared memory block
+        """
+        memory: SharedMemory = SharedMemory(create=True, size=len(payload) + 1)
+        memory.buf[0] = 0
+        memory.buf[1:len(payload) + 1] = payload
+        return memory
+
+    @staticmethod
+    def _ready(pending: Deque[Future], ordered: bool) -> bool:
+        """
+        Returns true if a pending query can be yielded without waiting
+        :param pending: Pending query futures
+        :param ordered: Queries are yielded in submission order
+        :return: True if a query is ready
+        """
+        if len(pending) == 0:
+            return False
+        return pending[0].done() if ordered else any(n.done() for n in pending)
+
+    @staticmethod
+    def _take(pending: Deque[Future], ordered: bool) -> Template:
+        """
+        Removes the next query from the pending queue, waiting for it to complete
+        :param pending: Pending query futures
+        :param ordered: Take the first submitted query instead of the first completed one
+        :return: Completed query
+        """
+        if ordered:
+            return pending.popleft().result()
+        done: Set[Future] = wait(pending, return_when=FIRST_COMPLETED).done
+        completed: Future = next(n for n in pending if n in done)
+        pending.remove(completed)
+        return completed.result()
+
+
+def _initialize_worker(grid_cache_size: [int, None]) -> None:
+    """
+    Configures the grid cache of a worker process
+    :param grid_cache_size: Number of grids cached by the worker, the library default if None
+    :return: None
+    """
+    if grid_cache_size is not None:
+        libpydggrid.set_grid_cache_size(grid_cache_size)
+
+
+def _run_shared(dictionary: Dict[str, str], name: str, size: int) -> Dict[str, numpy.ndarray]:
+    """
+    Runs a query with a payload read in place from a shared memory block, used as a process pool callback
+    :param dictionary: Query attributes
+    :param name: Payload shared memory block name, the interrupt flag byte followed by the payload
+    :param size: Payload size
+    :return: DGGRID Response dictionary
+    """
+    memory: SharedMemory = SharedMemory(name=name)
+    interrupt: memoryview = memory.buf[0:1]
+    payload: memoryview = memory.buf[1:size + 1]
+    try:
+        return libpydggrid.RunQuery(dictionary, payload, interrupt)
+    finally:
+        payload.release()
+        interrupt.release()
+        memory.close()
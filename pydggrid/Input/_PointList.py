@@ -21,7 +21,7 @@ from pydggrid.Types import DataType, PointDataType
 
 class Input(Dataset):
 
-    def __init__(self, extended_fields: bool = True):
+    def __init__(self, extended_fields: bool = True, packed: bool = True):
         super(Input, self).__init__()
         super().register_call(list, self._List)
         super().register_call(str, self._String)
@@ -30,6 +30,8 @@ class Input(Dataset):
         super().register_call(pandas.DataFrame, self._DataFrame)
         super().register_call(geopandas.GeoSeries, self._GeoSeries)
         super().register_call(geopandas.GeoDataFrame, self._GeoFrame)
+        super().register_call(numpy.ndarray, self._Numpy)
+        super().register_call(pyarrow.Table, self._ArrowTable)
         super().register_extension("csv", self._CsvFile)
         super().register_extension("txt", self._TextFile)
         super().register_extension("geo", self._TextFile)
@@ -43,6 +45,8 @@ class Input(Dataset):
                                           "label": "label"})
         self.type: PointDataType = PointDataType.TEXT
         self.extended_fields: bool = extended_fields
+        self.packed: bool = packed
+        self.packed_values: bool = False
 
     def save(self, records: [Any], definition: Any) -> None:
         """
@@ -270,8 +274,10 @@ class Input(Dataset):
             if columns[column_name] != column_name and column_name in records.columns:
                 records.rename(columns={columns[column_name]: column_name}, inplace=True)
         if self.extended_fields is False:
-            records.drop('id', axis=1, inplace=True)
-            records.drop('label', axis=1, inplace=True)
+            records.drop('id', axis=1, inplace=True, errors="ignore")
+            records.drop('label', axis=1, inplace=True, errors="ignore")
+        if self._is_packable(records):
+            return self.write(self.pack(records.to_numpy(dtype=numpy.float64)), DataType.DOUBLE)
         return self.write(str(records.to_csv(sep=' ', index=False, header=False)), DataType.STRING)
 
     def _List(self,
@@ -356,11 +362,13 @@ class Input(Dataset):
                     definition: [str, None] = None) -> None:
         """
         Arrow Table processor
-        :param records: Arrow Table object
+        :param records: Arrow Table object, either with a geometry column or with x, y and optional value columns
         :param definition: Column definition for geometry field, by default this is set to "geometry"
         :return: None
         """
         column: str = "geometry" if definition is None else str(definition)
+        if column not in records.column_names:
+            return self._DataFrame(records.to_pandas(), definition)
         return self._ArrowArray(records.column(column))
 
     def _Numpy(self,
@@ -368,12 +376,25 @@ class Input(Dataset):
                definition: None = None):
         """
         Numpy array processor
-        :param records: Numpy array of geometries
+        :param records: Numpy array of geometries, or a (n, 2) / (n, 3) array of x, y and optional value columns
         :param definition: None
         :return: None
         """
+        if records.ndim == 2:
+            return self._DataFrame(pandas.DataFrame(records), definition)
         return self._List(list([records]), None)
 
+    def _is_packable(self, records: pandas.DataFrame) -> bool:
+        """
+        Returns true if the records can be sent as a packed point packet, DGGRID reads the first columns of a text
+        row as x, y and value so the frame must hold only those, as numbers. The value column is packed only when
+        packed_values is set, other operations read the third column as the point id
+        :param records: Point records
+        :return: True if packable
+        """
+        return self.packed and 2 <= len(records.columns) <= (3 if self.packed_values else 2) and \
+            all([pandas.api.types.is_numeric_dtype(records[n]) for n in records.columns])
+
     def _GetColumns(self, definition: [Dict[str, Any], List[str], List[int]],
                     as_integer: bool = False) -> Dict[str, Any]:
         """
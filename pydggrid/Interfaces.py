@@ -849,6 +849,54 @@ class Dataset(ABC):
         """
         return len(self.data)
 
+    def shards(self, count: int) -> List[bytes]:
+        """
+        Splits the text or packed point records of the dataset into payloads of about equal size, every payload keeps
+        all the files of the dataset so file indexes (presence classes) are preserved
+        :param count: Number of payloads
+        :return: Payload bytes of each shard, empty if the dataset holds other records
+        """
+        if self.size() == 0 or any([n not in [DataType.STRING, DataType.DOUBLE] for n in self.types]):
+            return list([])
+        files: List[Any] = [self.data[n][4:].decode().splitlines(keepends=True) if self.types[n] == DataType.STRING
+                            else Dataset._unpack(self.data[n]) for n in range(0, self.size())]
+        payloads: List[bytes] = list([])
+        for shard in range(0, count):
+            byte_array: List[bytes] = list([DataType.INT.convert_bytes(self.size())])
+            for index in range(0, self.size()):
+                rows: [List[str], numpy.ndarray] = files[index]
+                start, end = (len(rows) * shard) // count, (len(rows) * (shard + 1)) // count
+                byte_data: bytes = DataType.STRING.convert_bytes("".join(rows[start:end])) \
+                    if self.types[index] == DataType.STRING else Dataset.pack(rows[start:end])
+                byte_array.append(DataType.INT.convert_bytes(int(self.types[index])))
+                byte_array.append(DataType.INT.convert_bytes(len(byte_data)))
+                byte_array.append(byte_data)
+            payloads.append(b''.join(byte_array))
+        return payloads
+
+    @staticmethod
+    def pack(columns: numpy.ndarray) -> bytes:
+        """
+        Packs point columns into a DOUBLE packet: <rows> <columns> followed by each float64 column
+        :param columns: (rows, columns) array of x, y and an optional value column
+        :return: Packet bytes
+        """
+        columns = numpy.asarray(columns, dtype="<f8")
+        return b''.join([DataType.INT.convert_bytes(columns.shape[0]),
+                         DataType.INT.convert_bytes(columns.shape[1]),
+                         numpy.ascontiguousarray(columns.T).tobytes()])
+
+    @staticmethod
+    def _unpack(byte_data: bytes) -> numpy.ndarray:
+        """
+        Unpacks a DOUBLE packet
+        :param byte_data: Packet bytes
+        :return: (rows, columns) array
+        """
+        rows: int = int.from_bytes(byte_data[0:4], Constants.ENDIAN_TYPE)
+        columns: int = int.from_bytes(byte_data[4:8], Constants.ENDIAN_TYPE)
+        return numpy.frombuffer(byte_data, dtype="<f8", count=rows * columns, offset=8).reshape(columns, rows).T
+
     # Override
     def __bytes__(self) -> bytes:
         """
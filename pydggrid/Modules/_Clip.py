@@ -7,7 +7,7 @@ import numpy
 import pandas
 import pyarrow
 
-from pydggrid.Input import Auto, Geometry, ArrayList
+from pydggrid.Input import Auto, Geometry, ArrayList, PointBinary
 from pydggrid.Types import InputAddress
 
 
@@ -100,6 +100,16 @@ class Module:
         if not isinstance(self.object, ArrayList): self.object: ArrayList = ArrayList()
         return self.object.save(records, definition) if records is not None else None
 
+    def shape(self, records: [str, pathlib.Path]) -> None:
+        """
+        Loads a shape binary, the shapefile is sent as is and read by DGGRID from memory
+        :param records: A path string or a pathlib.Path object pointing to a .shp file, its .shx, .dbf and .prj
+        siblings are sent along
+        :return: None
+        """
+        if not isinstance(self.object, PointBinary): self.object: PointBinary = PointBinary()
+        return self.object.save(records, None) if records is not None else None
+
     def __bytes__(self) -> bytes:
         """
         Return clip bytes
@@ -19,6 +19,8 @@ class Module:
         """
         self.type: InputAddress = InputAddress.GEO
         self.extended_fields: bool = extended_fields
+        self.packed: bool = True
+        self.packed_values: bool = False
         self.object: [Auto, PointList, PointBinary, ArrayList] = Auto()
 
     def auto(self) -> None:
@@ -58,6 +60,8 @@ class Module:
             - A pyarrow geometry Array containing x, y coordinates
             - a pyarrow table with x, y coordinate columns with optional id and label columns
             field is assumed as `geometry`.
+            Numeric NumPy, Arrow and pandas records holding only x, y, and a value column when packed_values is set,
+            are sent as a packed binary packet, read by DGGRID without any text parsing, unless packed is disabled
         :param definition: Columns definition data, for most items this is a string declaring the geometry columns used.
             Example:
                 {
@@ -73,6 +77,8 @@ class Module:
         """
         if not isinstance(self.object, PointList):
             self.object: PointList = PointList(self.extended_fields)
+        self.object.packed = self.packed
+        self.object.packed_values = self.packed_values
         return self.object.save(records, definition) if records is not None else None
 
     def shape(self, records: [str, pathlib.Path], definition: str = None) -> None:
@@ -121,6 +127,14 @@ class Module:
         self.object: ArrayList = ArrayList()
         return self.object.save(records, definition) if records is not None else None
 
+    def shards(self, count: int) -> List[bytes]:
+        """
+        Splits the input records into payloads of about equal size
+        :param count: Number of payloads
+        :return: Payload bytes of each shard, empty if the input cannot be split
+        """
+        return self.object.shards(count) if hasattr(self.object, "shards") else list([])
+
     def __bytes__(self) -> bytes:
         """
         Return clip bytes
@@ -114,6 +114,17 @@ class Object:
         if name in self._on_save:
             self._on_save[name]()
 
+    def update(self, source: "Object") -> None:
+        """
+        Copies the modified parameters of another attributes set, the values are copied as saved so the save
+        callbacks are not replayed
+        :param source: Source attributes set
+        :return: None
+        """
+        for name in source.names():
+            if source.modified(name) and self.exists(name):
+                self._data[name] = source.get(name)
+
     def names(self) -> List[str]:
         """
         Returns an array of parameter names
@@ -1,6 +1,4 @@
-import os
-import tempfile
-from typing import List, Any, Dict, Tuple
+from typing import List, Any
 
 import fiona
 import geopandas
@@ -29,8 +27,25 @@ class Output(OutputTemplate):
         Returns data as pyarrow array
         :return: PyArrow Coordinate Array
         """
+        if self._type == dict:
+            return self._arrow_geometry()
         return arrow.as_geoarrow(self.get_geoframe().geometry) if self._data is not None else pyarrow.null()
 
+    def get_arrow_ids(self) -> pyarrow.Array:
+        """
+        Returns the cell ids of an ARROW output, sequence numbers as uint64 or labels as strings
+        :return: PyArrow Array
+        """
+        if self._type != dict:
+            raise NotImplementedError("Cell ids are only available for ARROW outputs")
+        if "id" in self._data:
+            return pyarrow.array(self._data["id"])
+        offsets: numpy.ndarray = self._data.get("label_offsets", numpy.zeros(1, dtype=numpy.int32))
+        return pyarrow.StringArray.from_buffers(len(offsets) - 1,
+                                                pyarrow.py_buffer(offsets),
+                                                pyarrow.py_buffer(self._data.get("label_data",
+                                                                                 numpy.array([], dtype=numpy.uint8))))
+
     # Override
     def get_frame(self) -> [pandas.DataFrame, None]:
         """
@@ -41,18 +56,10 @@ class Output(OutputTemplate):
             return pandas.DataFrame()
         elif self._type == pandas.DataFrame:
             return self._data
+        elif self._type == dict:
+            return self._view("frame", self._arrow_frame)
         elif self._type == geopandas.GeoDataFrame:
-            elements: List[Dict[str, Any]] = list([])
-            frame: pandas.DataFrame({"id": [], "lat": [], "long": []})
-            for data_node in self._data.itertuples():
-                points: List[Tuple[float, float]] = self._list_points(data_node.geometry)
-                index_id = data_node.id if hasattr(data_node, "id") else data_node.Name
-                [elements.append({
-                    self._cols[0]: str(index_id),
-                    self._cols[1]: n[0],
-                    self._cols[2]: n[1]
-                }) for n in points]
-            return pandas.DataFrame(elements)
+            return self._view("frame", self._geometry_frame)
         else:
             raise NotImplementedError(f"This collection cannot be exported as a DataFrame [ {self._type} ]")
 
@@ -66,6 +73,11 @@ class Output(OutputTemplate):
             return geopandas.GeoDataFrame()
         elif self._type == pandas.DataFrame:
             return geopandas.GeoDataFrame(self._data)
+        elif self._type == dict:
+            return self._view("geoframe", lambda: geopandas.GeoDataFrame(
+                {"id": self.get_arrow_ids().to_numpy(zero_copy_only=False)},
+                geometry=OutputTemplate._arrow_shapely(self._data),
+                crs=self._crs))
         elif self._type == geopandas.GeoDataFrame:
             return self._data
         else:
@@ -87,15 +99,7 @@ class Output(OutputTemplate):
         if self._type == pandas.DataFrame:
             return self._data.to_xml()
         elif self._type == geopandas.GeoDataFrame:
-            if "kml" in self._content:
-                return self._content["kml"]
-            temp_name = f"/tmp/{next(tempfile._get_candidate_names())}"
-            self._data.to_file(temp_name, driver="KML")
-            file = open(temp_name, "rt")
-            kml_string = file.read()
-            file.close()
-            os.remove(temp_name)
-            return kml_string
+            return self._view("kml", self._get_kml)
         else:
             return "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<kml></kml>"
 
@@ -109,7 +113,64 @@ class Output(OutputTemplate):
             return numpy.array([])
         if self._type == pandas.DataFrame:
             return self._data.to_numpy()
-        elif self._type == geopandas.GeoDataFrame:
-            return self.get_frame().to_numpy()
+        elif self._type == geopandas.GeoDataFrame or self._type == dict:
+            return self._view("numpy", lambda: self.get_frame().to_numpy())
         else:
-            raise NotImplementedError("This collection cannot be exported as Numpy NDArray")
\ No newline at end of file
+            raise NotImplementedError("This collection cannot be exported as Numpy NDArray")
+
+    # INTERNAL
+
+    def _arrow_frame(self) -> pandas.DataFrame:
+        """
+        Builds the id / vertex table of the ARROW output buffers
+        :return: Pandas DataFrame
+        """
+        ids: numpy.ndarray = self.get_arrow_ids().to_numpy(zero_copy_only=False)
+        if "ring_offsets" not in self._data:
+            return pandas.DataFrame({self._cols[0]: ids.astype(str),
+                                     self._cols[1]: self._data.get("x", numpy.array([])),
+                                     self._cols[2]: self._data.get("y", numpy.array([]))})
+        return pandas.DataFrame({
+            self._cols[0]: numpy.repeat(ids, numpy.diff(self._data["ring_offsets"])).astype(str),
+            self._cols[1]: self._data.get("vertex_x", numpy.array([])),
+            self._cols[2]: self._data.get("vertex_y", numpy.array([]))})
+
+    def _geometry_frame(self) -> pandas.DataFrame:
+        """
+        Builds the id / vertex table of the geometries, the vertices of every geometry are listed in one pass
+        :return: Pandas DataFrame
+        """
+        if not OutputTemplate._has_geometry(self._data):
+            return pandas.DataFrame(columns=self._cols)
+        coordinates, index = OutputTemplate._vertices(self._data.geometry.values)
+        ids: pandas.Series = self._data["id"] if "id" in self._data else self._data["Name"]
+        return pandas.DataFrame({self._cols[0]: ids.to_numpy().astype(str)[index],
+                                 self._cols[1]: coordinates[:, 0],
+                                 self._cols[2]: coordinates[:, 1]})
+
+    def _arrow_geometry(self) -> pyarrow.ExtensionArray:
+        """
+        Wraps the ARROW output buffers as a GeoArrow polygon (cells) or point (points) array, the coordinate
+        buffers are shared with the output and not copied
+        :return: GeoArrow Array
+        """
+        empty: numpy.ndarray = numpy.array([], dtype=numpy.float64)
+        if "ring_offsets" not in self._data:
+            point_type = arrow.point()
+            return point_type.wrap_array(pyarrow.StructArray.from_arrays(
+                [pyarrow.array(self._data.get("x", empty)), pyarrow.array(self._data.get("y", empty))],
+                fields=list(point_type.storage_type)))
+        polygon_type = arrow.polygon()
+        ring_type: pyarrow.ListType = polygon_type.storage_type.value_type
+        vertices: pyarrow.StructArray = pyarrow.StructArray.from_arrays(
+            [pyarrow.array(self._data.get("vertex_x", empty)), pyarrow.array(self._data.get("vertex_y", empty))],
+            fields=list(ring_type.value_type))
+        rings: pyarrow.ListArray = pyarrow.ListArray.from_arrays(pyarrow.array(self._data["ring_offsets"]),
+                                                                 vertices,
+                                                                 type=ring_type)
+        # DGGRID cells are single ring polygons
+        polygons: pyarrow.ListArray = pyarrow.ListArray.from_arrays(
+            pyarrow.array(numpy.arange(len(rings) + 1, dtype=numpy.int32)),
+            rings,
+            type=polygon_type.storage_type)
+        return polygon_type.wrap_array(polygons)
@@ -37,16 +37,9 @@ class Output(OutputTemplate):
         elif self._type == pandas.DataFrame:
             return self._data
         elif self._type == geopandas.GeoDataFrame:
-            elements: List[Dict[str, Any]] = list([])
-            frame: pandas.DataFrame({"id": [], "lat": [], "long": []})
-            for data_node in self._data.itertuples():
-                points: List[Tuple[float, float]] = self._list_points(data_node.geometry)
-                [elements.append({self._cols[index]: n[index] for index in range(0, len(self._cols))}) for n in points]
-            return pandas.DataFrame(elements)
+            return self._view("frame", self._geometry_frame)
         elif self._type == list:
-            elements: Dict[str, list] = {k: list([]) for k in self._cols}
-            elements[list(elements.keys())[0]] = self._data
-            return pandas.DataFrame(elements)
+            return self._view("frame", self._sequence_frame)
         else:
             raise NotImplementedError(f"This collection cannot be exported as a DataFrame [ {self._type} ]")
 
@@ -85,7 +78,7 @@ class Output(OutputTemplate):
         :return: XML String
         """
         if self._type == geopandas.GeoDataFrame:
-            return self._content["kml"]
+            return self._view("kml", self._get_kml)
         else:
             raise NotImplementedError("This collection cannot be exported as XML")
 
@@ -100,8 +93,29 @@ class Output(OutputTemplate):
         if self._type == pandas.DataFrame:
             return self._data.to_numpy()
         elif self._type == geopandas.GeoDataFrame:
-            return self.get_frame().to_numpy()
+            return self._view("numpy", lambda: self.get_frame().to_numpy())
         elif self._type == list:
-            return numpy.array(self._data)
+            return self._view("numpy", lambda: numpy.array(self._data))
         else:
             raise NotImplementedError("This collection cannot be exported as Numpy NDArray")
+
+    # INTERNAL
+
+    def _geometry_frame(self) -> pandas.DataFrame:
+        """
+        Builds the record table of the geometries, the vertex coordinates fill the first columns
+        :return: Pandas DataFrame
+        """
+        if not OutputTemplate._has_geometry(self._data):
+            return pandas.DataFrame(columns=self._cols)
+        coordinates, _ = OutputTemplate._vertices(self._data.geometry.values)
+        return pandas.DataFrame({self._cols[n]: coordinates[:, n] for n in range(0, min(len(self._cols), 2))})
+
+    def _sequence_frame(self) -> pandas.DataFrame:
+        """
+        Builds the record table of a sequence, the sequence fills the first column
+        :return: Pandas DataFrame
+        """
+        elements: Dict[str, list] = {k: list([]) for k in self._cols}
+        elements[list(elements.keys())[0]] = self._data
+        return pandas.DataFrame(elements)
@@ -19,9 +19,7 @@ class Output(OutputTemplate):
         :return: Pandas DataFrame or None if not available
         """
         if self._type == list:
-            elements: List[Dict[str, Any]] = list([])
-            [elements.append({"id": int(n)}) for n in self._data]
-            return pandas.DataFrame(elements)
+            return self._view("frame", lambda: pandas.DataFrame({"id": [int(n) for n in self._data]}))
         else:
             raise NotImplementedError(f"This collection cannot be exported as a DataFrame [ {self._type} ]")
 
@@ -41,7 +39,7 @@ class Output(OutputTemplate):
         :return: Numpy ND Array
         """
         if self._type is list:
-            return numpy.array(self._data)
+            return self._view("numpy", lambda: numpy.array(self._data))
         else:
             raise NotImplementedError("This collection cannot be exported as Numpy NDArray")
 
@@ -51,10 +49,7 @@ class Output(OutputTemplate):
         :return: XML String
         """
         if self._type == list:
-            root = xml.Element("points")
-            for point in self._data:
-                xml.SubElement(root, "point").text = str(point)
-            return bytes(xml.tostring(root, encoding="UTF8")).decode()
+            return self._view("kml", self._points_kml)
         else:
             raise NotImplementedError("This collection cannot be exported as XML")
 
@@ -66,3 +61,13 @@ class Output(OutputTemplate):
         pass
 
     # INTERNAL
+
+    def _points_kml(self) -> str:
+        """
+        Builds the XML string of the sequence
+        :return: XML String
+        """
+        root = xml.Element("points")
+        for point in self._data:
+            xml.SubElement(root, "point").text = str(point)
+        return bytes(xml.tostring(root, encoding="UTF8")).decode()
@@ -2,30 +2,99 @@ import sys
 import tempfile
 from abc import ABC, abstractmethod
 from io import StringIO
-from typing import List, Any, Dict, Tuple
+from typing import List, Any, Dict, Tuple, Callable
 
 import os
 
 import geojson
 import geopandas
+import libpydggrid
 import numpy
 import pandas
-from shapely import Polygon, Point, GeometryCollection, LineString
-from shapely.geometry import mapping, shape
+import shapely
 
+from pydggrid.System import Library
 from pydggrid.Types import ReadMode
 
 
 class Template(ABC):
 
+    # column types of the ARROW output buffers
+    _arrow_types: Dict[str, Any] = {"id": numpy.uint64,
+                                    "label_offsets": numpy.int32,
+                                    "label_data": numpy.uint8,
+                                    "x": numpy.float64,
+                                    "y": numpy.float64,
+                                    "ring_offsets": numpy.int32,
+                                    "vertex_x": numpy.float64,
+                                    "vertex_y": numpy.float64}
+
+    # data types of the read modes
+    _read_types: Dict[ReadMode, type] = {ReadMode.AIGEN: geopandas.GeoDataFrame,
+                                         ReadMode.KML: geopandas.GeoDataFrame,
+                                         ReadMode.GEOJSON: geopandas.GeoDataFrame,
+                                         ReadMode.GDAL_COLLECTION: geopandas.GeoDataFrame,
+                                         ReadMode.SHAPEFILE: geopandas.GeoDataFrame,
+                                         ReadMode.SEQUENCE: list,
+                                         ReadMode.FRAME: pandas.DataFrame,
+                                         ReadMode.ARROW: dict}
+
+    # maximum size in bytes of the views (frames, arrays, kml) cached by an output
+    view_cache_bytes: int = 256 * 1024 * 1024
+
     def __init__(self):
-        self._text: str = ""
-        self._data: [Any, None] = None
+        self._raw: [Any, None] = None
+        self._read_mode: ReadMode = ReadMode.NONE
+        self._loaded: bool = True
+        self._string: [str, None] = None
+        self._values: [Any, None] = None
         self._type: [type, None] = None
         self._cols: List[str] = list([])
-        self._content: Dict[str, str] = dict({})
+        self._content: Dict[str, Any] = dict({})
+        self._sizes: Dict[str, int] = dict({})
         self._crs: str = "EPSG:4326"
 
+    @property
+    def _data(self) -> Any:
+        """
+        Returns the decoded response data, the response buffer is decoded on first access
+        :return: Response data
+        """
+        if not self._loaded:
+            self._values, self._string = self._read(self._raw, self._read_mode)
+            self._loaded = True
+        return self._values
+
+    @_data.setter
+    def _data(self, values: Any) -> None:
+        """
+        Sets the response data, the response buffer and the cached views are dropped
+        :param values: Response data
+        :return: None
+        """
+        self._raw = None
+        self._loaded = True
+        self._string = None
+        self._values = values
+        self._clear_views()
+
+    @property
+    def _text(self) -> str:
+        """
+        Returns the response text, decoded text formats or the data as a string
+        :return: Response text
+        """
+        data: Any = self._data
+        if self._string is not None:
+            return self._string
+        if data is None:
+            self._string = ""
+        elif isinstance(data, list):
+            self._string = os.linesep.join([str(n) for n in data])
+        else:
+            self._string = str(data)
+        return self._string
+
     def set_crs(self, crs_type: [str, None] = None) -> None:
         """
         Sets the output crs, if set to none default `EPSG:4326` will be used
@@ -34,91 +103,60 @@ class Template(ABC):
         """
         self._crs = crs_type
 
-    def save(self, data: [bytes, pandas.DataFrame], read_mode: ReadMode) -> None:
+    def save(self, data: [bytes, numpy.ndarray, pandas.DataFrame], read_mode: ReadMode) -> None:
         """
-        Saves data into byte array
+        Saves the response buffer, it is only decoded when the output data or one of its views is requested
         :param data: Data Bytes
         :param read_mode: Data Interpreter
         :return: None
         """
-        if read_mode == ReadMode.AIGEN:
-            self._text = bytes(data).decode()
-            string_blocks: List[str] = self._text.split("END")
-            records: List[Dict[str, Any]] = list([])
-            record_set: List[List[Dict[str, Any]]] = list([])
-            [record_set.append(self._aigen_extract(n)) for n in string_blocks]
-            [[records.append(n) for n in d] for d in record_set]
-            frame: pandas.DataFrame = pandas.DataFrame(records)
-            unique_sets: List[int] = list(frame["id"].unique())
-            geometry_elements: List[Polygon, Point] = list([])
-            for unique_set in unique_sets:
-                coordinate_frame = frame[frame["id"] == unique_set]
-                if coordinate_frame.shape[0] > 2:
-                    geometry_elements.append(Polygon(zip(
-                        list(coordinate_frame["lat"]),
-                        list(coordinate_frame["long"]))))
-                else:
-                    geometry_elements.append(Point(
-                        list(coordinate_frame["lat"])[0],
-                        list(coordinate_frame["long"])[0]))
-            self._data = geopandas.GeoDataFrame({"id": unique_sets, "geometry": geometry_elements}, crs=self._crs)
-            self._type = geopandas.GeoDataFrame
-            self._content["kml"] = self._get_kml()
-        #
-        elif read_mode == ReadMode.KML:
-            self._text = bytes(data).decode()
-            self._type = geopandas.GeoDataFrame
-            payload: StringIO = StringIO(self._text)
-            self._data = geopandas.read_file(payload, driver="KML")
-            self._data = self._data.rename(columns={"Name": "id"})
-            self._content["kml"] = self._get_kml()
-        elif read_mode == ReadMode.GEOJSON or \
-                read_mode == ReadMode.GDAL_COLLECTION:
-            self._type = geopandas.GeoDataFrame
-            self._text = bytes(data).decode().replace("\n", "").replace("},]", "}]")
-            if len(self._text) > 0:
-                self._data = geopandas.GeoDataFrame.from_features(geojson.loads(self._text))
-                self._data = self._data.rename(columns={"name": "id"})
-            else:
-                self._data = geopandas.GeoDataFrame()
-        elif read_mode == ReadMode.SHAPEFILE:
-            shape_file: str = ""
-            ext_array: List[str] = ["shp", "dbf", "prj", "sbn", "sbx", "shx"]
-            # noinspection PyUnresolvedReferences,PyProtectedMember
-            temp_file = os.path.join(tempfile.gettempdir(), f"{next(tempfile._get_candidate_names())}")
-            for extension in ext_array:
-                extension = "".join([chr(c) for c in data[0:3]])
-                file_name: str = f"{temp_file}.{extension}"
-                shape_file = file_name if extension == "shp" else shape_file
-                data = data[3:]
-                #
-                byte_size: int = int.from_bytes(bytearray(data[:4]), "little")
-                data = data[4:]
-                #
-                file = open(file_name, "wb")
-                file.write(bytearray(data[:byte_size]))
-                file.close()
-                print(file_name)
-                data = data[byte_size:]
-            self._type = geopandas.GeoDataFrame
-            self._data = geopandas.GeoDataFrame.from_file(shape_file)
-            self._data = self._data.rename(columns={"global_id": "id"})
-            self._text = str(self._data)
-        elif read_mode == ReadMode.SEQUENCE:
-            self._type = list
-            self._data = list(data)
-            self._text = os.linesep.join([str(n) for n in self._data])
-        elif read_mode == ReadMode.FRAME:
-            self._type = pandas.DataFrame
-            self._data = pandas.DataFrame(data)
-            self._text = self._data.__str__()
-        elif read_mode == ReadMode.NONE:
+        if read_mode == ReadMode.NONE:
             return
-        else:
+        if read_mode not in Template._read_types:
             print(read_mode)
             sys.exit(0)
-        # if "id" in self._data:
-        #     self._data["id"] = pandas.to_numeric(self._data['id'], errors='coerce')
+        self._data = None
+        self._raw = data
+        self._read_mode = read_mode
+        self._type = Template._read_types[read_mode]
+        self._loaded = False
+
+    def release(self) -> None:
+        """
+        Releases the cached views and the decoded response data, they are rebuilt from the response buffer on next
+        access. Merged outputs have no response buffer and keep their data
+        :return: None
+        """
+        self._clear_views()
+        if self._raw is not None:
+            self._values = None
+            self._string = None
+            self._loaded = False
+
+    def merge(self, outputs: List["Template"]) -> None:
+        """
+        Concatenates outputs read with the same read mode into this output, in order
+        :param outputs: Outputs to concatenate
+        :return: None
+        """
+        # noinspection PyProtectedMember
+        outputs = [n for n in outputs if n._type is not None]
+        if len(outputs) == 0:
+            return
+        # noinspection PyProtectedMember
+        parts: List[Any] = [n._data for n in outputs]
+        # noinspection PyProtectedMember
+        self._type = outputs[0]._type
+        if self._type == dict:
+            self._data = Template._merge_arrow(parts)
+        elif self._type == list:
+            self._data = [n for part in parts for n in part]
+        elif self._type == geopandas.GeoDataFrame:
+            parts = [n for n in parts if len(n) > 0]
+            self._data = geopandas.GeoDataFrame(pandas.concat(parts, ignore_index=True), crs=parts[0].crs) \
+                if len(parts) > 0 else geopandas.GeoDataFrame()
+        else:
+            self._data = pandas.concat(parts, ignore_index=True)
 
     def __str__(self) -> str:
         """
@@ -224,61 +262,188 @@ class Template(ABC):
 
     # INTERNAL
 
-    def _aigen_extract(self, string_block: str) -> List[Dict[str, Any]]:
+    def _read(self, data: [bytes, numpy.ndarray, pandas.DataFrame], read_mode: ReadMode) -> Tuple[Any, [str, None]]:
+        """
+        Decodes a response buffer
+        :param data: Data Bytes
+        :param read_mode: Data Interpreter
+        :return: Response data and response text, None if the text is built from the data
+        """
+        if read_mode == ReadMode.AIGEN:
+            text: str = Library.decode(data)
+            columns: Dict[str, numpy.ndarray] = Template._read_arrow(libpydggrid.decode_aigen(data)) \
+                if len(text) > 0 else dict({})
+            return geopandas.GeoDataFrame({"id": Template._arrow_labels(columns)},
+                                          geometry=Template._arrow_shapely(columns),
+                                          crs=self._crs), text
+        elif read_mode == ReadMode.KML:
+            text: str = Library.decode(data)
+            frame: geopandas.GeoDataFrame = geopandas.read_file(StringIO(text), driver="KML")
+            return frame.rename(columns={"Name": "id"}), text
+        elif read_mode == ReadMode.GEOJSON or \
+                read_mode == ReadMode.GDAL_COLLECTION:
+            text: str = Library.decode(data).replace("\n", "").replace("},]", "}]")
+            if len(text) == 0:
+                return geopandas.GeoDataFrame(), text
+            frame: geopandas.GeoDataFrame = geopandas.GeoDataFrame.from_features(geojson.loads(text))
+            return frame.rename(columns={"name": "id"}), text
+        elif read_mode == ReadMode.SHAPEFILE:
+            shape_file: str = ""
+            ext_array: List[str] = ["shp", "dbf", "prj", "sbn", "sbx", "shx"]
+            # noinspection PyUnresolvedReferences,PyProtectedMember
+            temp_file = os.path.join(tempfile.gettempdir(), f"{next(tempfile._get_candidate_names())}")
+            for extension in ext_array:
+                extension = "".join([chr(c) for c in data[0:3]])
+                file_name: str = f"{temp_file}.{extension}"
+                shape_file = file_name if extension == "shp" else shape_file
+                data = data[3:]
+                #
+                byte_size: int = int.from_bytes(bytes(data[:4]), "little")
+                data = data[4:]
+                #
+                file = open(file_name, "wb")
+                file.write(data[:byte_size])
+                file.close()
+                print(file_name)
+                data = data[byte_size:]
+            frame: geopandas.GeoDataFrame = geopandas.GeoDataFrame.from_file(shape_file)
+            return frame.rename(columns={"global_id": "id"}), None
+        elif read_mode == ReadMode.SEQUENCE:
+            return list(data), None
+        elif read_mode == ReadMode.FRAME:
+            return pandas.DataFrame(data), None
+        return Template._read_arrow(data), None
+
+    def _view(self, name: str, builder: Callable[[], Any]) -> Any:
         """
-        Extract records from a single aigen block
-        :param string_block: String block data
-        :return: Extracted Records
+        Returns a cached view of the output, the view is built and cached on first access. Views larger than
+        view_cache_bytes are not cached and the least recently used views are evicted to stay within it
+        :param name: View name
+        :param builder: View builder
+        :return: View
         """
-        self.un_static()
-        block_id: str = ""
-        coordinates: List[str] = list(["", ""])
-        records: List[Dict[str, Any]] = list([])
-        element_blocks: List[str] = string_block.split("\n")
-        for element_block in element_blocks:
-            elements: List[str] = element_block.split(" ")
-            if len(elements) < 2:
+        if name in self._content:
+            view: Any = self._content.pop(name)
+            self._content[name] = view
+            return view
+        view: Any = builder()
+        size: int = Template._sizeof(view)
+        if size > Template.view_cache_bytes:
+            return view
+        self._content[name] = view
+        self._sizes[name] = size
+        while sum(self._sizes.values()) > Template.view_cache_bytes:
+            evicted: str = next(iter(self._content))
+            del self._content[evicted]
+            del self._sizes[evicted]
+        return view
+
+    def _clear_views(self) -> None:
+        """
+        Drops the cached views
+        :return: None
+        """
+        self._content = dict({})
+        self._sizes = dict({})
+
+    @staticmethod
+    def _sizeof(view: Any) -> int:
+        """
+        Returns the approximate size of a view in bytes
+        :param view: View
+        :return: Size in bytes
+        """
+        if isinstance(view, pandas.DataFrame):
+            return int(view.memory_usage(index=True).sum())
+        if isinstance(view, numpy.ndarray):
+            return int(view.nbytes)
+        return sys.getsizeof(view)
+
+    @staticmethod
+    def _merge_arrow(parts: List[Dict[str, numpy.ndarray]]) -> Dict[str, numpy.ndarray]:
+        """
+        Concatenates ARROW column buffers, offset columns are rebased onto the preceding parts
+        :param parts: Column buffers of each part
+        :return: Merged column buffers
+        """
+        merged: Dict[str, numpy.ndarray] = dict({})
+        for column in Template._arrow_types:
+            arrays: List[numpy.ndarray] = [n[column] for n in parts if column in n]
+            if len(arrays) == 0:
                 continue
-            if len(elements) == 3:
-                block_id = str(elements[0].strip())
-                coordinates[0] = elements[1]
-                coordinates[1] = elements[2]
-            if len(elements) == 2:
-                coordinates[0] = elements[0]
-                coordinates[1] = elements[1]
-            records.append({
-                "id": block_id,
-                "lat": float(coordinates[0]),
-                "long": float(coordinates[1])
-            })
-        return records
-
-    def _list_points(self,
-                     geometry: [Polygon, Point, GeometryCollection],
-                     point_list: [List[Tuple[float, float]], None] = None) -> List[Tuple[float, float]]:
-        """
-        Lists all points in a geometry
-        :param geometry: Geometry Object
-        :param point_list: Point List Object
-        :return: Points List as [(x, y),...]
-        """
-        self.un_static()
-        point_list = list([]) if point_list is None else point_list
-        if isinstance(geometry, GeometryCollection):
-            for index in list(range(0, len(mapping(geometry)['geometries'][0]))):
-                self._list_points(shape(mapping(geometry)['geometries'][index]), point_list)
-        elif isinstance(geometry, Point):
-            x, y = geometry.coords.xy
-            point_list.append(list(zip(x, y)))
-        elif isinstance(geometry, Polygon):
-            x, y = geometry.exterior.coords.xy
-            point_list.append(list(zip(x, y)))
-        elif isinstance(geometry, LineString):
-            x, y = geometry.coords.xy
-            point_list.append(list(zip(x, y)))
-        else:
-            raise NotImplementedError(f"Geometry type not implemented {type(geometry)}")
-        return [point for point_set in point_list for point in point_set]
+            if column.endswith("_offsets"):
+                bases: numpy.ndarray = numpy.cumsum([0] + [int(n[-1]) for n in arrays[:-1]])
+                arrays = [arrays[0]] + [(n[1:] + bases[i + 1]).astype(numpy.int32) for i, n in enumerate(arrays[1:])]
+            merged[column] = numpy.concatenate(arrays)
+        return merged
+
+    @staticmethod
+    def _read_arrow(data: Dict[str, numpy.ndarray]) -> Dict[str, numpy.ndarray]:
+        """
+        Views ARROW column bytes with the dtype of each column, unused columns are dropped
+        :param data: Column bytes
+        :return: Column buffers
+        """
+        columns: Dict[str, numpy.ndarray] = dict({})
+        for column, column_data in data.items():
+            if column in Template._arrow_types and len(column_data) > 0:
+                columns[column] = numpy.asarray(column_data).view(Template._arrow_types[column])
+        return columns
+
+    @staticmethod
+    def _arrow_labels(columns: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Returns the cell ids of ARROW column buffers as strings
+        :param columns: Column buffers
+        :return: Cell ids
+        """
+        if "id" in columns:
+            return columns["id"].astype(str)
+        offsets: numpy.ndarray = columns.get("label_offsets", numpy.zeros(1, dtype=numpy.int32))
+        label_data: bytes = columns.get("label_data", numpy.array([], dtype=numpy.uint8)).tobytes()
+        return numpy.array([label_data[offsets[n]:offsets[n + 1]].decode("utf-8") for n in range(0, len(offsets) - 1)],
+                           dtype=object)
+
+    @staticmethod
+    def _vertices(geometries: [numpy.ndarray, geopandas.GeoSeries]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Lists the vertices of geometries in a single vectorized pass, polygons are listed by their exterior ring
+        :param geometries: Geometries
+        :return: (vertices x 2) coordinates and the geometry index of each vertex
+        """
+        geometries = numpy.asarray(geometries)
+        polygons: numpy.ndarray = shapely.get_type_id(geometries) == shapely.GeometryType.POLYGON
+        rings: numpy.ndarray = numpy.where(polygons, shapely.get_exterior_ring(geometries), geometries)
+        return shapely.get_coordinates(rings, return_index=True)
+
+    @staticmethod
+    def _has_geometry(frame: geopandas.GeoDataFrame) -> bool:
+        """
+        Returns true if a geo data frame has rows and an active geometry column, empty results are stored as a bare
+        GeoDataFrame() without one
+        :param frame: Geo data frame
+        :return: True if the geometries can be read
+        """
+        return len(frame) > 0 and getattr(frame, "_geometry_column_name", None) in frame.columns
+
+    @staticmethod
+    def _arrow_shapely(columns: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Builds shapely geometries from ARROW column buffers in a single pass, polygons (cells) from the rings or
+        points (points) from the centers
+        :param columns: Column buffers
+        :return: Shapely geometry array
+        """
+        empty: numpy.ndarray = numpy.array([], dtype=numpy.float64)
+        if "ring_offsets" not in columns:
+            return shapely.points(columns.get("x", empty), columns.get("y", empty))
+        coordinates: numpy.ndarray = numpy.column_stack([columns.get("vertex_x", empty),
+                                                         columns.get("vertex_y", empty)])
+        ring_offsets: numpy.ndarray = columns["ring_offsets"].astype(numpy.int64)
+        # DGGRID cells are single ring polygons
+        return shapely.from_ragged_array(shapely.GeometryType.POLYGON,
+                                         coordinates,
+                                         (ring_offsets, numpy.arange(len(ring_offsets), dtype=numpy.int64)))
 
     def _get_kml(self):
         # dump text
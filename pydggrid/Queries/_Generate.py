@@ -1,5 +1,5 @@
 import pathlib
-from typing import Dict, List
+from typing import Dict, List, Iterator, Tuple
 
 import geojson
 import geopandas
@@ -10,8 +10,9 @@ import pyarrow
 
 from pydggrid.Modules import Clip
 from pydggrid.Output import Geometry
+from pydggrid.System import Library, Parallel
 from pydggrid.Types import Operation, ClipType, ReadMode, CellOutput, ChildrenOutput, NeighborOutput, \
-    InputAddress, PointOutput, OutputAddress, CellLabel
+    InputAddress, PointOutput, OutputAddress, CellLabel, DGGSType
 from pydggrid.Queries._Custom import Query as BaseQuery
 
 
@@ -21,6 +22,8 @@ class Query(BaseQuery):
     - clip: clip settings configured with set_clip, by default set to WHOLE_EARTH, AKA. "Auto()"
     - cells: Cells response from DGGRID
     - points: Points response from DGGRID
+    - neighbors: Neighbor adjacency arrays {seqnum, offsets, indices} of an ARROW neighbor_output_type
+    - children: Children adjacency arrays {seqnum, offsets, indices} of an ARROW children_output_type
     - Meta: Query meta-data object
     """
 
@@ -33,6 +36,8 @@ class Query(BaseQuery):
         self.cells: Geometry = Geometry()
         self.points: Geometry = Geometry()
         self.collection: Geometry = Geometry()
+        self.neighbors: Dict[str, numpy.ndarray] = dict({})
+        self.children: Dict[str, numpy.ndarray] = dict({})
         self.dgg_meta: str = ""
         # Set defaults
         self.Meta.set_default("clip_cell_densification")
@@ -79,6 +84,17 @@ class Query(BaseQuery):
             self.Meta.save("point_output_type", PointOutput.NONE)
             self.Meta.save("cell_output_type", CellOutput.NONE)
 
+    def adjacency(self, neighbors: bool = True, children: bool = False) -> None:
+        """
+        Outputs the neighbors and / or children of the generated cells as CSR adjacency arrays of SEQNUMs, read into
+        the neighbors and children attributes: the adjacent cells of seqnum[n] are indices[offsets[n]:offsets[n + 1]]
+        :param neighbors: Output the neighbors of each cell
+        :param children: Output the children of each cell, SEQNUMs of the next resolution
+        :return: None
+        """
+        self.Meta.save("neighbor_output_type", NeighborOutput.ARROW if neighbors else NeighborOutput.NONE)
+        self.Meta.save("children_output_type", ChildrenOutput.ARROW if children else ChildrenOutput.NONE)
+
     def clip_geometry(self,
                       records: [List,
                                 Dict,
@@ -119,6 +135,15 @@ class Query(BaseQuery):
         self._clip.geometry(records, definition)
         self.Meta.save("clip_subset_type", ClipType.GDAL)
 
+    def clip_shape(self, records: [str, pathlib.Path]) -> None:
+        """
+        Clips to a shapefile read by DGGRID's shapefile reader (SHAPEFILE clip_subset_type) from memory
+        :param records: A path string or a pathlib.Path object pointing to a .shp file
+        :return: None
+        """
+        self._clip.shape(records)
+        self.Meta.save("clip_subset_type", ClipType.SHAPEFILE)
+
     def clip_cells(self,
                    records: [str,
                              List[str],
@@ -155,6 +180,20 @@ class Query(BaseQuery):
         self.Meta.save("clip_cell_addresses", self._clip.object.integer_list(" "))
         self.Meta.save("input_address_type", address_type)
 
+    def seqnum_range(self, first: int, last: int) -> None:
+        """
+        Generates the cells of a SEQNUM range of a whole earth grid only, DGGRID seeks straight to the first cell so
+        a range costs only its own cells, use it to shard a grid across machines
+        :param first: First cell, from 1 (the cell SEQNUM if the grid SEQNUMs start at 1)
+        :param last: Last cell, inclusive
+        :return: None
+        """
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid SEQNUM range [{first}, {last}]")
+        self.Meta.save("clip_subset_type", ClipType.WHOLE_EARTH)
+        self.Meta.save("output_first_seqnum", int(first))
+        self.Meta.save("output_last_seqnum", int(last))
+
     def __bytes__(self) -> bytes:
         """
         Returns query bytes
@@ -179,8 +218,8 @@ class Query(BaseQuery):
         :return: Test response string
         """
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._clip.__bytes__())
-        return libpydggrid.UnitTest_ReadQuery(dictionary, list(payload))
+        payload: bytes = self._clip.__bytes__()
+        return libpydggrid.UnitTest_ReadQuery(dictionary, payload)
 
     # Override
     # noinspection PyPep8Naming
@@ -190,21 +229,66 @@ class Query(BaseQuery):
         :return: Test response string
         """
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._clip.__bytes__())
-        return libpydggrid.UnitTest_RunQuery(dictionary, list(payload))
+        payload: bytes = self._clip.__bytes__()
+        return libpydggrid.UnitTest_RunQuery(dictionary, payload)
 
     # Override
-    def run(self, byte_data: [bytes, None] = None) -> None:
+    def run(self, byte_data: [bytes, None] = None, workers: int = 1) -> None:
         """
         Runs the query
         :param byte_data byte payload, if left blank Input.__bytes__() will be used
+        :param workers: Number of worker processes, with more than one worker a whole earth grid is split into
+        SEQNUM ranges (output_first_seqnum / output_last_seqnum) generated in parallel and merged in order
+        :return: None
+        """
+        shards: List[Tuple[int, int]] = self._shards(workers)
+        if len(shards) > 1:
+            return self._run_shards(shards, workers)
+        self.read(super().exec(self._clip.__bytes__()))
+
+    def read(self, byte_data: Dict[str, numpy.ndarray]) -> None:
+        """
+        Reads a DGGRID response into the query outputs
+        :param byte_data: DGGRID Response dictionary
         :return: None
         """
-        byte_data: Dict[str, bytes] = super().exec(self._clip.__bytes__())
-        self.dgg_meta = bytearray(byte_data["meta"]).decode() if "meta" in byte_data else ""
-        self.cells.save(byte_data["cells"], self._read_mode("cells"))
-        self.points.save(byte_data["points"], self._read_mode("points"))
+        self.dgg_meta = Library.decode(byte_data["meta"]) if "meta" in byte_data else ""
+        self.cells.save(Query._read_data(byte_data, "cells", self._read_mode("cells")), self._read_mode("cells"))
+        self.points.save(Query._read_data(byte_data, "points", self._read_mode("points")), self._read_mode("points"))
         self.collection.save(byte_data["collection"], self._read_mode("collection"))
+        self.neighbors = Query._read_adjacency(byte_data, "neighbors")
+        self.children = Query._read_adjacency(byte_data, "children")
+
+    def iter_cells(self,
+                   chunk_size: int = 65536,
+                   capacity: int = 4,
+                   as_frame: bool = False) -> Iterator[[pyarrow.RecordBatch, geopandas.GeoDataFrame]]:
+        """
+        Generates the grid as a stream of cell batches, cells are handed over by DGGRID as they are generated
+        through a bounded queue, memory stays bounded by chunk_size * capacity cells however large the grid is.
+        The cells are generated in ARROW mode regardless of cell_output_type, points are not generated.
+        :param chunk_size: Number of cells per batch
+        :param capacity: Number of batches DGGRID may generate ahead of the consumer
+        :param as_frame: Yield GeoDataFrames instead of Arrow record batches
+        :return: Iterator of record batches {id, geometry} or GeoDataFrames
+        """
+        dictionary: Dict[str, str] = self.Meta.dict()
+        dictionary["cell_output_type"] = CellOutput.ARROW.name
+        dictionary["point_output_type"] = PointOutput.NONE.name
+        stream: libpydggrid.Stream = libpydggrid.Stream(dictionary, self._clip.__bytes__(), chunk_size, capacity)
+        try:
+            while True:
+                chunk: [Dict[str, numpy.ndarray], None] = stream.next()
+                if chunk is None:
+                    break
+                cells: Geometry = Geometry()
+                # noinspection PyProtectedMember
+                cells.set_crs(self.cells._crs)
+                cells.save({k[len("cells."):]: v for k, v in chunk.items() if k.startswith("cells.")}, ReadMode.ARROW)
+                yield cells.get_geoframe() if as_frame else \
+                    pyarrow.RecordBatch.from_arrays([cells.get_arrow_ids(), cells.get_arrow()], names=["id", "geometry"])
+        finally:
+            stream.close()
 
     # INTERNAL
 
@@ -226,6 +310,87 @@ class Query(BaseQuery):
             return ReadMode.NONE if self._is_collection() is False \
                 else ReadMode(self.Meta.as_int("cell_output_gdal_format"))
 
+    def _shards(self, workers: int) -> List[Tuple[int, int]]:
+        """
+        Returns the SEQNUM ranges of a parallel run, only whole earth grids of a single output are split, within the
+        configured output_first_seqnum / output_last_seqnum range (see seqnum_range())
+        :param workers: Number of worker processes
+        :return: (output_first_seqnum, output_last_seqnum) of each shard, empty to run in a single process
+        """
+        if workers <= 1 or self._is_collection() or \
+                self.Meta.as_int("clip_subset_type") != ClipType.WHOLE_EARTH or \
+                self.Meta.as_int("dggs_type") == DGGSType.SUPERFUND:
+            return list([])
+        return Parallel.seqnum_ranges(self.Meta.dict(), workers)
+
+    def _run_shards(self, shards: List[Tuple[int, int]], workers: int) -> None:
+        """
+        Generates the grid shards in a process pool and merges the outputs in SEQNUM order
+        :param shards: SEQNUM range of each shard
+        :param workers: Number of worker processes
+        :return: None
+        """
+        read_modes: Dict[str, ReadMode] = {n: self._read_mode(n) for n in ["cells", "points"]}
+        arguments: List[Tuple] = list([])
+        for first_seqnum, last_seqnum in shards:
+            dictionary: Dict[str, str] = self.Meta.dict()
+            dictionary["output_first_seqnum"] = str(first_seqnum)
+            dictionary["output_last_seqnum"] = str(last_seqnum)
+            # noinspection PyProtectedMember
+            arguments.append((dictionary, self._clip.__bytes__(), read_modes, self.cells._crs))
+        outputs: List[Dict[str, Geometry]] = Parallel.map(_generate_shard, arguments, workers)
+        self.dgg_meta = outputs[0]["meta"]
+        self.cells.merge([n["cells"] for n in outputs])
+        self.points.merge([n["points"] for n in outputs])
+        self.neighbors = Query._merge_adjacency([n["neighbors"] for n in outputs])
+        self.children = Query._merge_adjacency([n["children"] for n in outputs])
+
+    @staticmethod
+    def _read_data(byte_data: Dict[str, numpy.ndarray],
+                   vector_id: str,
+                   read_mode: ReadMode) -> [numpy.ndarray, Dict[str, numpy.ndarray]]:
+        """
+        Returns the response data of the vector, ARROW outputs are returned as a dictionary of column buffers
+        :param byte_data: Query response
+        :param vector_id: Vector ID To use
+        :param read_mode: Read mode of the vector
+        :return: Response bytes or column buffers
+        """
+        if read_mode != ReadMode.ARROW:
+            return byte_data[vector_id]
+        prefix: str = f"{vector_id}."
+        return {k[len(prefix):]: v for k, v in byte_data.items() if k.startswith(prefix)}
+
+    @staticmethod
+    def _read_adjacency(byte_data: Dict[str, numpy.ndarray], vector_id: str) -> Dict[str, numpy.ndarray]:
+        """
+        Returns the adjacency arrays of the vector, empty if it was not output as ARROW
+        :param byte_data: Query response
+        :param vector_id: Vector ID To use, neighbors or children
+        :return: {seqnum, offsets, indices} arrays
+        """
+        if f"{vector_id}.offsets" not in byte_data:
+            return dict({})
+        return dict({"seqnum": numpy.asarray(byte_data[f"{vector_id}.seqnum"]).view(numpy.uint64),
+                     "offsets": numpy.asarray(byte_data[f"{vector_id}.offsets"]).view(numpy.int64),
+                     "indices": numpy.asarray(byte_data[f"{vector_id}.indices"]).view(numpy.uint64)})
+
+    @staticmethod
+    def _merge_adjacency(shards: List[Dict[str, numpy.ndarray]]) -> Dict[str, numpy.ndarray]:
+        """
+        Merges the adjacency arrays of consecutive shards, the offsets of each shard are shifted past the indices of
+        the previous ones
+        :param shards: Shard {seqnum, offsets, indices} arrays
+        :return: Merged {seqnum, offsets, indices} arrays, empty if the shards have none
+        """
+        if len(shards) == 0 or len(shards[0]) == 0:
+            return dict({})
+        shifts: numpy.ndarray = numpy.cumsum([0] + [len(n["indices"]) for n in shards[:-1]])
+        return dict({"seqnum": numpy.concatenate([n["seqnum"] for n in shards]),
+                     "offsets": numpy.concatenate([shards[0]["offsets"][:1]] +
+                                                  [n["offsets"][1:] + shift for n, shift in zip(shards, shifts)]),
+                     "indices": numpy.concatenate([n["indices"] for n in shards])})
+
     def _is_collection(self) -> bool:
         """
         Returns true if collection query
@@ -251,3 +416,28 @@ class Query(BaseQuery):
 
         if self.Meta.as_int("cell_output_type") == PointOutput.GDAL:
             self.Meta.set_default("cell_output_gdal_format")
+
+
+def _generate_shard(dictionary: Dict[str, str],
+                    payload: bytes,
+                    read_modes: Dict[str, ReadMode],
+                    crs: str) -> Dict[str, [Geometry, str, Dict]]:
+    """
+    Generates a grid shard and reads its outputs, used as a process pool callback so the outputs are also
+    parsed in parallel
+    :param dictionary: Query attributes of the shard
+    :param payload: Clip payload
+    :param read_modes: Read mode of the cells and points outputs
+    :param crs: Output crs
+    :return: Shard {meta, cells, points, neighbors, children}
+    """
+    byte_data: Dict[str, numpy.ndarray] = libpydggrid.RunQuery(dictionary, payload)
+    outputs: Dict[str, [Geometry, str, Dict]] = dict({"meta": Library.decode(byte_data.get("meta")),
+                                                      "neighbors": Query._read_adjacency(byte_data, "neighbors"),
+                                                      "children": Query._read_adjacency(byte_data, "children")})
+    for vector_id, read_mode in read_modes.items():
+        outputs[vector_id] = Geometry()
+        outputs[vector_id].set_crs(crs)
+        # noinspection PyProtectedMember
+        outputs[vector_id].save(Query._read_data(byte_data, vector_id, read_mode), read_mode)
+    return outputs
@@ -10,6 +10,7 @@ import pyarrow
 
 from pydggrid.Modules import Input
 from pydggrid.Output import Records, Geometry
+from pydggrid.System import Library
 from pydggrid.Types import Operation, ReadMode, PointDataType, OutputType, OutputAddress, CellOutput, OutputControl, \
     BinCoverage, PointOutput
 from pydggrid.Queries._Custom import Query as BaseQuery
@@ -112,6 +113,7 @@ class Query(BaseQuery):
         :return: None
         """
         self.Meta.save("point_input_file_type", PointDataType.GDAL)
+        self._input.packed = self._packs_points()
         self._input.points(records, definition)
 
     # Override
@@ -131,8 +133,8 @@ class Query(BaseQuery):
         :return: Test response string
         """
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._input.__bytes__())
-        return libpydggrid.UnitTest_ReadQuery(dictionary, list(payload))
+        payload: bytes = self._input.__bytes__()
+        return libpydggrid.UnitTest_ReadQuery(dictionary, payload)
 
     # Override
     # noinspection PyPep8Naming
@@ -142,8 +144,8 @@ class Query(BaseQuery):
         :return: Test response string
         """
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._input.__bytes__())
-        return libpydggrid.UnitTest_RunQuery(dictionary, list(payload))
+        payload: bytes = self._input.__bytes__()
+        return libpydggrid.UnitTest_RunQuery(dictionary, payload)
 
     # Override
     def run(self, byte_data: [bytes, None] = None) -> None:
@@ -152,14 +154,21 @@ class Query(BaseQuery):
         :param byte_data byte payload, if left blank Input.__bytes__() will be used
         :return: None
         """
-        byte_data: Dict[str, bytes] = super().exec(self._input.__bytes__())
-        self.dgg_meta = bytearray(byte_data["meta"]).decode() if "meta" in byte_data else ""
+        self.read(super().exec(self._input.__bytes__()))
+
+    def read(self, byte_data: Dict[str, numpy.ndarray]) -> None:
+        """
+        Reads a DGGRID response into the query outputs
+        :param byte_data: DGGRID Response dictionary
+        :return: None
+        """
+        self.dgg_meta = Library.decode(byte_data["meta"]) if "meta" in byte_data else ""
         #
         self.cells.save(byte_data["cells"], ReadMode.GEOJSON)
         self.points.save(byte_data["points"], ReadMode.GEOJSON)
         #
         record_set: List[Dict[str, Any]] = list()
-        elements: List[str] = bytearray(byte_data["dataset"]).decode().split("\n")
+        elements: List[str] = Library.decode(byte_data["dataset"]).split("\n")
         for element_node in elements:
             if len(element_node.strip()) > 0:
                 vectors: List[str] = element_node.split(" ")
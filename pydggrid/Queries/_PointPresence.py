@@ -10,7 +10,7 @@ import pyarrow
 
 from pydggrid.Modules import Input
 from pydggrid.Output import Records
-from pydggrid.System import Library
+from pydggrid.System import Library, Parallel
 from pydggrid.Types import Operation, ReadMode, PointDataType
 from pydggrid.Queries._Custom import Query as BaseQuery
 
@@ -99,6 +99,8 @@ class Query(BaseQuery):
             self.Meta.save("point_input_file_type", PointDataType.GDAL)
         else:
             self.Meta.save("point_input_file_type", PointDataType.TEXT)
+        self._input.packed = self._packs_points()
+        self._input.packed_values = True
         self._input.points(records, definition)
 
     # Override
@@ -118,8 +120,8 @@ class Query(BaseQuery):
         :return: Test response string
         """
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._input.__bytes__())
-        return libpydggrid.UnitTest_ReadQuery(dictionary, list(payload))
+        payload: bytes = self._input.__bytes__()
+        return libpydggrid.UnitTest_ReadQuery(dictionary, payload)
 
     # Override
     # noinspection PyPep8Naming
@@ -129,21 +131,33 @@ class Query(BaseQuery):
         :return: Test response string
         """
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._input.__bytes__())
-        return libpydggrid.UnitTest_RunQuery(dictionary, list(payload))
+        payload: bytes = self._input.__bytes__()
+        return libpydggrid.UnitTest_RunQuery(dictionary, payload)
 
     # Override
-    def run(self, byte_data: [bytes, None] = None) -> None:
+    def run(self, byte_data: [bytes, None] = None, workers: int = 1) -> None:
         """
         Runs the query
         :param byte_data byte payload, if left blank Input.__bytes__() will be used
+        :param workers: Number of worker processes, with more than one worker the input points are split into
+        shards binned in parallel and the shard results are merged
         :return: None
         """
-        byte_data: Dict[str, bytes] = super().exec(self._input.__bytes__())
-        self.dgg_meta = bytearray(byte_data["meta"]).decode() if "meta" in byte_data else ""
+        payloads: List[bytes] = self._input.shards(workers) if workers > 1 else list([])
+        if len(payloads) > 1:
+            return self.read(Parallel.run_bins(self.Meta.dict(), payloads, workers))
+        self.read(super().exec(self._input.__bytes__()))
+
+    def read(self, byte_data: Dict[str, numpy.ndarray]) -> None:
+        """
+        Reads a DGGRID response into the query records
+        :param byte_data: DGGRID Response dictionary
+        :return: None
+        """
+        self.dgg_meta = Library.decode(byte_data["meta"]) if "meta" in byte_data else ""
         #
         record_set: List[Dict[str, Any]] = list()
-        elements: List[str] = bytearray(byte_data["dataset"]).decode().split("\n")
+        elements: List[str] = Library.decode(byte_data["dataset"]).split("\n")
         for element_node in elements:
             if len(element_node.strip()) > 0:
                 vectors: List[str] = element_node.split(" ")
@@ -1,5 +1,5 @@
 import pathlib
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Tuple
 
 import geojson
 import geopandas
@@ -10,6 +10,7 @@ import pyarrow
 
 from pydggrid.Modules import Clip
 from pydggrid.Output import Records
+from pydggrid.System import Library
 from pydggrid.Types import Operation, ClipType, ReadMode, CellOutput, ChildrenOutput, NeighborOutput, \
     InputAddress, PointOutput
 from pydggrid.Queries._Custom import Query as BaseQuery
@@ -142,8 +143,8 @@ class Query(BaseQuery):
         """
         self._alter_payload()
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._clip.__bytes__())
-        return libpydggrid.UnitTest_ReadQuery(dictionary, list(payload))
+        payload: bytes = self._clip.__bytes__()
+        return libpydggrid.UnitTest_ReadQuery(dictionary, payload)
 
     # Override
     # noinspection PyPep8Naming
@@ -154,8 +155,17 @@ class Query(BaseQuery):
         """
         self._alter_payload()
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._clip.__bytes__())
-        return libpydggrid.UnitTest_RunQuery(dictionary, list(payload))
+        payload: bytes = self._clip.__bytes__()
+        return libpydggrid.UnitTest_RunQuery(dictionary, payload)
+
+    # Override
+    def prepare(self) -> Tuple[Dict[str, str], bytes]:
+        """
+        Returns the attributes and the payload the query is run with
+        :return: Query attributes and payload bytes
+        """
+        self._alter_payload()
+        return super().prepare()
 
     # Override
     def run(self, byte_data: [bytes, None] = None) -> None:
@@ -165,14 +175,18 @@ class Query(BaseQuery):
         :return: None
         """
         self._alter_payload()
-        byte_data: Dict[str, bytes] = super().exec(self._clip.__bytes__())
-        self.dgg_meta = bytearray(byte_data["meta"]).decode() if "meta" in byte_data else ""
+        self.read(super().exec(self._clip.__bytes__()))
+
+    def read(self, byte_data: Dict[str, numpy.ndarray]) -> None:
+        """
+        Reads a DGGRID response into the query records
+        :param byte_data: DGGRID Response dictionary
+        :return: None
+        """
+        self.dgg_meta = Library.decode(byte_data["meta"]) if "meta" in byte_data else ""
         if "statistics" in byte_data.keys():
-            statistics_string: str = ""
             statistics_array: List[Dict[Any]] = []
-            for bit_char in byte_data["statistics"]:
-                statistics_string += chr(bit_char)
-            statistics_string = statistics_string.replace("\x00", "")
+            statistics_string: str = Library.decode(byte_data["statistics"]).replace("\x00", "")
             element_lines: List[str] = statistics_string.split("\n")
             for element_line in element_lines:
                 element_cells: List[str] = element_line.split("|")
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import os
 import pathlib
@@ -5,9 +6,10 @@ import sys
 import textwrap
 import time
 from abc import ABC, abstractmethod
-from typing import List, Any, Dict, TextIO
+from typing import List, Any, Dict, TextIO, Tuple
 
 import libpydggrid
+import numpy
 
 from pydggrid.System import Constants
 
@@ -121,14 +123,54 @@ class Template(ABC):
         """
         print(self)
 
-    def exec(self, byte_data: [bytes, None] = None) -> Dict[str, bytes]:
+    def exec(self, byte_data: [bytes, None] = None) -> Dict[str, numpy.ndarray]:
         """
-        Executes the query and returns a bytes array
-        :param byte_data byte payload, if left blank Input.__bytes__() will be used
-        :return: DGGRID Response Bytes array
+        Executes the query and returns a bytes array, the GIL is released while DGGRID runs so queries
+        can be executed in parallel from a thread pool
+        :param byte_data byte payload, any buffer protocol object (bytes, bytearray, memoryview, numpy uint8),
+        passed to DGGRID without copying
+        :return: DGGRID Response dictionary of numpy.uint8 arrays (zero-copy views of the DGGRID output)
         """
         dictionary: Dict[str, str] = self.Meta.dict()
-        return libpydggrid.RunQuery(dictionary, list(byte_data))
+        return libpydggrid.RunQuery(dictionary, b"" if byte_data is None else byte_data)
+
+    def prepare(self) -> Tuple[Dict[str, str], bytes]:
+        """
+        Returns the attributes and the payload the query is run with, used to run the query outside of run()
+        :return: Query attributes and payload bytes
+        """
+        return self.Meta.dict(), self.__bytes__()
+
+    def read(self, byte_data: Dict[str, numpy.ndarray]) -> None:
+        """
+        Reads a DGGRID response into the query outputs
+        :param byte_data: DGGRID Response dictionary
+        :return: None
+        """
+        raise NotImplementedError(f"read() is not implemented for {self.type().name} queries.")
+
+    async def run_async(self, timeout: [float, None] = None, executor: [Any, None] = None) -> "Template":
+        """
+        Runs the query without blocking the event loop, DGGRID runs in a thread pool (the GIL is released) or in
+        the worker processes of a pydggrid.Executor. The query is interrupted if the call is cancelled or times out,
+        its main loops stop at the next cell or point
+        :param timeout: Seconds to wait for the query, no timeout if None
+        :param executor: concurrent.futures thread pool or pydggrid.Executor, the event loop default executor if None
+        :return: The query with its outputs read
+        """
+        if hasattr(executor, "run_async"):
+            return await executor.run_async(self, timeout)
+        dictionary, payload = self.prepare()
+        interrupt: bytearray = bytearray(1)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.run_in_executor(executor, libpydggrid.RunQuery, dictionary, payload, interrupt)
+        try:
+            response: Dict[str, numpy.ndarray] = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            Template._interrupt(future, interrupt)
+            raise
+        self.read(response)
+        return self
 
     def io(self, name: str, data: [Any, None]) -> Any:
         """
@@ -213,6 +255,24 @@ class Template(ABC):
 
     # INTERNAL
 
+    def _packs_points(self) -> bool:
+        """
+        Returns true if point inputs may be sent as packed payloads, DGGRID reads packed points as GEO coordinates
+        :return: True if the input address type is GEO
+        """
+        return InputAddress(self.Meta.as_int("input_address_type")) == InputAddress.GEO
+
+    @staticmethod
+    def _interrupt(future: asyncio.Future, interrupt: [bytearray, memoryview]) -> None:
+        """
+        Interrupts a running query, the interrupted run error is retrieved once it stops
+        :param future: Running query future
+        :param interrupt: Interrupt flag of the query
+        :return: None
+        """
+        interrupt[0] = 1
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+
     def _meta_dict(self, lines: [List[str], TextIO]) -> Dict[str, str]:
         """
         converts string parameters to a dictionary of parameters
@@ -322,6 +382,12 @@ class Template(ABC):
                          data_options=None,
                          data_default=False,
                          on_verify=None)
+        # clip_hierarchical
+        self.Meta.define(name="clip_hierarchical",
+                         data_type=bool,
+                         data_options=None,
+                         data_default=False,
+                         on_verify=None)
         # clip_region_files
         self.Meta.define(name="clip_region_files",
                          data_type=str,
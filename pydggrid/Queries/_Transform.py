@@ -1,6 +1,6 @@
 import os
 import pathlib
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 import geojson
 import geopandas
@@ -11,6 +11,7 @@ import pyarrow
 
 from pydggrid.Modules import Input
 from pydggrid.Output import Geometry, Records
+from pydggrid.System import Library
 from pydggrid.Types import Operation, ClipType, ReadMode, CellOutput, ChildrenOutput, NeighborOutput, \
     InputAddress, PointOutput, OutputAddress
 from pydggrid.Queries._Custom import Query as BaseQuery
@@ -98,6 +99,7 @@ class Query(BaseQuery):
                 }
         :return: None
         """
+        self._input.packed = self._packs_points()
         self._input.points(records, definition)
 
     def input_cells(self,
@@ -153,8 +155,8 @@ class Query(BaseQuery):
         """
         self._alter_payload()
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._input.__bytes__())
-        return libpydggrid.UnitTest_ReadQuery(dictionary, list(payload))
+        payload: bytes = self._input.__bytes__()
+        return libpydggrid.UnitTest_ReadQuery(dictionary, payload)
 
     # Override
     # noinspection PyPep8Naming
@@ -165,8 +167,17 @@ class Query(BaseQuery):
         """
         self._alter_payload()
         dictionary: Dict[str, str] = self.Meta.dict()
-        payload: bytearray = bytearray(self._input.__bytes__())
-        return libpydggrid.UnitTest_RunQuery(dictionary, list(payload))
+        payload: bytes = self._input.__bytes__()
+        return libpydggrid.UnitTest_RunQuery(dictionary, payload)
+
+    # Override
+    def prepare(self) -> Tuple[Dict[str, str], bytes]:
+        """
+        Returns the attributes and the payload the query is run with
+        :return: Query attributes and payload bytes
+        """
+        self._alter_payload()
+        return super().prepare()
 
     # Override
     def run(self, byte_data: [bytes, None] = None) -> None:
@@ -176,13 +187,20 @@ class Query(BaseQuery):
         :return: None
         """
         self._alter_payload()
-        byte_data: Dict[str, bytes] = super().exec(self._input.__bytes__())
-        self.dgg_meta = bytearray(byte_data["meta"]).decode() if "meta" in byte_data else ""
+        self.read(super().exec(self._input.__bytes__()))
+
+    def read(self, byte_data: Dict[str, numpy.ndarray]) -> None:
+        """
+        Reads a DGGRID response into the query outputs
+        :param byte_data: DGGRID Response dictionary
+        :return: None
+        """
+        self.dgg_meta = Library.decode(byte_data["meta"]) if "meta" in byte_data else ""
         self.cells.save(byte_data["cells"], self._read_mode("cells"))
         self.points.save(byte_data["points"], self._read_mode("points"))
         self.collection.save(byte_data["collection"], self._read_mode("collection"))
         # save table data
-        content_string: str = bytearray(byte_data["dataset"]).decode()
+        content_string: str = Library.decode(byte_data["dataset"])
         content_array: List[str] = content_string.split(os.linesep)
         if "|" not in content_string:
             self.records = Records(["INDEX"])
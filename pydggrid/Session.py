@@ -0,0 +1,152 @@
+from typing import Any, Dict, List
+
+import libpydggrid
+import numpy
+
+from pydggrid.Objects import Attributes
+from pydggrid.Output import Records
+from pydggrid.Queries import Transform, PointValue, PointPresence
+from pydggrid.Queries._Template import Template
+from pydggrid.Types import Operation, PointDataType, InputAddress, OutputAddress
+
+
+class Session:
+    """
+    Persistent DGGRID session, the query attributes are parsed and the grid is built once,
+    every transform / bin call then only runs the operation on the new points
+    - query: Query object used to encode inputs and decode responses, a copy of the source query so the caller's
+    query is never modified
+    """
+
+    _queries: Dict[Operation, Any] = {Operation.TRANSFORM_POINTS: Transform,
+                                      Operation.BIN_POINT_VALS: PointValue,
+                                      Operation.BIN_POINT_PRESENCE: PointPresence}
+
+    def __init__(self, source: [Template, Attributes]):
+        """
+        Default constructor
+        :param source: A configured Transform, PointValue or PointPresence query, or the Attributes
+        (query.Meta) of one
+        """
+        meta: Attributes = source if isinstance(source, Attributes) else source.Meta
+        self.query: Template = Session._queries[Operation(meta.as_int("dggrid_operation"))]()
+        self.query.Meta.update(meta)
+        if self.query.type() != Operation.TRANSFORM_POINTS:
+            self.query.Meta.save("point_input_file_type", PointDataType.GDAL)
+        self._session: libpydggrid.Session = libpydggrid.Session(self.query.Meta.dict())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def transform(self, records: Any, definition: [List[str], List[int], str, None] = None) -> Records:
+        """
+        Transforms points with the session grid
+        :param records: Point records, any type accepted by Transform.input_points
+        :param definition: Columns definition data, see Transform.input_points
+        :return: Transformed records
+        """
+        if self.query.type() != Operation.TRANSFORM_POINTS:
+            raise ValueError(f"transform() requires a TRANSFORM_POINTS session, not {self.query.type().name}")
+        return self._run(records, definition)
+
+    def bin(self, records: Any, definition: [List[str], List[int], str, None] = None) -> Records:
+        """
+        Bins point values with the session grid
+        :param records: Point records, any type accepted by PointValue.input_points
+        :param definition: Columns definition data, see PointValue.input_points
+        :return: Binned records
+        """
+        if self.query.type() not in [Operation.BIN_POINT_VALS, Operation.BIN_POINT_PRESENCE]:
+            raise ValueError(f"bin() requires a BIN_POINT_VALS or BIN_POINT_PRESENCE session, "
+                             f"not {self.query.type().name}")
+        return self._run(records, definition)
+
+    def transform_array(self,
+                        *columns: numpy.ndarray,
+                        input_address: InputAddress = InputAddress.GEO,
+                        output_address: OutputAddress = OutputAddress.SEQNUM) -> Dict[str, numpy.ndarray]:
+        """
+        Transforms address arrays with the session grid, the arrays are read in place by DGGRID without being
+        formatted as text, use this over transform() for large point sets
+        :param columns: Input address columns by input address type:
+            - GEO: lon, lat (float64)
+            - Q2DI: quad, i, j (int64)
+            - Q2DD: quad (int64), x, y (float64)
+            - SEQNUM: seqnum (uint64)
+        :param input_address: Input address type, GEO, Q2DI, Q2DD or SEQNUM
+        :param output_address: Output address type, GEO, Q2DI, Q2DD or SEQNUM
+        :return: Output address columns by output address type:
+            - GEO: {lon, lat} cell centers
+            - Q2DI: {quad, i, j}
+            - Q2DD: {quad, x, y} cell centers
+            - SEQNUM: {seqnum}
+        """
+        return self._session.transform(InputAddress(input_address).name,
+                                       list(columns),
+                                       OutputAddress(output_address).name)
+
+    def bin_array(self,
+                  lon: numpy.ndarray,
+                  lat: numpy.ndarray,
+                  values: [numpy.ndarray, None] = None,
+                  classes: [numpy.ndarray, None] = None,
+                  output_all: bool = False,
+                  sparse: bool = False) -> Dict[str, numpy.ndarray]:
+        """
+        Bins point arrays with the session grid, the arrays are read in place and the cells are accumulated in
+        dense arrays without formatting any text, use this over bin() for large point sets. With a SPARSE bin_coverage,
+        or a grid too large for dense arrays, only the occupied cells are allocated
+        :param lon: Point longitudes (float64)
+        :param lat: Point latitudes (float64)
+        :param values: Point values (float64), summed into the cell totals, optional
+        :param classes: Point class indexes (int64) from 0, sets the presence vector of the cells, optional
+        :param output_all: Output every cell of the grid instead of the occupied cells only
+        :param sparse: Allocate the occupied cells only whatever the bin_coverage, use it for batches much smaller
+        than the grid
+        :return: Cell columns in SEQNUM order:
+            - seqnum, count, total, mean
+            - classes, presence (cells x classes uint8 matrix), when classes are given
+        """
+        num_classes: int = int(numpy.max(classes)) + 1 if classes is not None and len(classes) > 0 else 0
+        columns: Dict[str, numpy.ndarray] = self._session.bin(lon, lat, values, classes, num_classes, output_all,
+                                                              sparse)
+        if "presence" in columns:
+            columns["presence"] = columns["presence"].reshape(-1, num_classes)
+        return columns
+
+    def runs(self) -> int:
+        """
+        Returns the number of runs executed by the session
+        :return: Run count
+        """
+        return self._session.runs
+
+    def close(self) -> None:
+        """
+        Closes the session and releases the grid
+        :return: None
+        """
+        self._session.close()
+
+    # INTERNAL
+
+    def _run(self, records: Any, definition: [List[str], List[int], str, None]) -> Records:
+        """
+        Runs the session on a set of point records
+        :param records: Point records
+        :param definition: Columns definition data
+        :return: Response records
+        """
+        # every run sends its own points only
+        # noinspection PyProtectedMember,PyUnresolvedReferences
+        self.query._input.auto()
+        # noinspection PyUnresolvedReferences
+        self.query.input_points(records, definition)
+        byte_data: Dict[str, numpy.ndarray] = self._session.run(self.query.__bytes__())
+        self.query.records = Records()
+        # noinspection PyUnresolvedReferences
+        self.query.read(byte_data)
+        return self.query.records
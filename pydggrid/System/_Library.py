@@ -7,12 +7,23 @@ from typing import List, Dict, Any
 
 import geojson
 import geopandas
+import numpy
 import pandas
 from shapely import Polygon
 
 
 class Library:
 
+    @staticmethod
+    def decode(data: [bytes, memoryview, numpy.ndarray, None]) -> str:
+        """
+        Decodes a query response buffer (numpy.uint8 array, memoryview or bytes) into a string
+        without copying it into an intermediate bytes object
+        :param data: Response buffer
+        :return: UTF-8 decoded string
+        """
+        return "" if data is None or len(data) == 0 else str(memoryview(data), "utf-8")
+
     @staticmethod
     def is_csv_string(csv_string) -> bool:
         """
@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Tuple
+
+import libpydggrid
+import numpy
+
+from pydggrid.System._Constants import Dictionary
+from pydggrid.System._Library import Library
+
+
+class Parallel:
+
+    @staticmethod
+    def map(callback: Callable[..., Any], arguments: List[Tuple], workers: int) -> List[Any]:
+        """
+        Runs a callback over a list of argument tuples in a process pool, results are returned in order
+        :param callback: Module level function, it must be importable by the worker processes
+        :param arguments: Argument tuple of each call
+        :param workers: Number of worker processes
+        :return: Callback results, in the order of the arguments
+        """
+        if workers <= 1 or len(arguments) <= 1:
+            return [callback(*n) for n in arguments]
+        with ProcessPoolExecutor(max_workers=min(workers, len(arguments))) as executor:
+            return list(executor.map(callback, *zip(*arguments)))
+
+    @staticmethod
+    def run_query(dictionary: Dict[str, str], payload: bytes) -> Dict[str, numpy.ndarray]:
+        """
+        Runs a query shard, used as a process pool callback
+        :param dictionary: Query attributes
+        :param payload: Query payload
+        :return: DGGRID Response dictionary
+        """
+        return libpydggrid.RunQuery(dictionary, payload)
+
+    @staticmethod
+    def seqnum_ranges(dictionary: Dict[str, str], shards: int) -> List[Tuple[int, int]]:
+        """
+        Splits the cells of a grid into contiguous SEQNUM ranges of about equal size, within the
+        output_first_seqnum / output_last_seqnum range of the query if one is set
+        :param dictionary: Query attributes
+        :param shards: Number of ranges
+        :return: (output_first_seqnum, output_last_seqnum) of each range, empty if the grid size is unknown or the
+        query range is empty
+        """
+        size: int = libpydggrid.grid_size(dictionary)
+        if size == 0:
+            return list([])
+        first: int = max(1, int(dictionary.get("output_first_seqnum", 1)))
+        last: int = min(int(dictionary.get("output_last_seqnum", size)), size)
+        if last < first:
+            return list([])
+        count: int = last - first + 1
+        shards = max(1, min(shards, count))
+        bounds: List[int] = [first - 1 + (count * n) // shards for n in range(0, shards + 1)]
+        return [(bounds[n] + 1, bounds[n + 1]) for n in range(0, shards)]
+
+    @staticmethod
+    def run_bins(dictionary: Dict[str, str], payloads: List[bytes], workers: int) -> Dict[str, numpy.ndarray]:
+        """
+        Bins point shards in a process pool and merges their datasets
+        :param dictionary: Binning query attributes
+        :param payloads: Point payload of each shard
+        :param workers: Number of worker processes
+        :return: DGGRID Response dictionary with the merged dataset
+        """
+        responses: List[Dict[str, numpy.ndarray]] = Parallel.map(Parallel.run_query,
+                                                                 [(dictionary, n) for n in payloads],
+                                                                 workers)
+        dataset: str = Parallel.merge_bins([Library.decode(n.get("dataset")) for n in responses],
+                                           dictionary.get("dggrid_operation") == "BIN_POINT_PRESENCE",
+                                           int(dictionary.get("precision", Dictionary.DEFAULT_PRECISION)))
+        return dict({"meta": responses[0].get("meta", numpy.array([], dtype=numpy.uint8)),
+                     "dataset": numpy.frombuffer(dataset.encode("utf-8"), dtype=numpy.uint8)})
+
+    @staticmethod
+    def merge_bins(datasets: List[str],
+                   presence: bool = False,
+                   precision: int = Dictionary.DEFAULT_PRECISION,
+                   delimiter: str = " ") -> str:
+        """
+        Merges binned datasets of point shards, counts and totals are summed, means are recomputed and
+        presence vectors are or-ed. The value columns are read from the right of each row so the cell ids can span
+        several columns (Q2DI, Q2DD, GEO, PLANE)
+        :param datasets: Dataset text of each shard, rows as <id...> <count> <total> <mean> [<classes> <vector>]
+        :param presence: True for BIN_POINT_PRESENCE datasets, which carry the <classes> <vector> columns
+        :param precision: Query precision, the digits of the mean as printed by DGGRID
+        :param delimiter: Column delimiter
+        :return: Merged dataset text, formatted as a single process output. Rows are in SEQNUM order for SEQNUM ids,
+        in order of first appearance otherwise
+        """
+        width: int = 5 if presence else 3
+        cells: Dict[str, List[Any]] = dict({})
+        for dataset in datasets:
+            for row in dataset.split("\n"):
+                values: List[str] = row.strip().split(delimiter)
+                if len(values) <= width:
+                    continue
+                key: str = delimiter.join(values[:-width])
+                count, total = int(values[-width]), float(values[-width + 1])
+                vector: List[str] = list(values[-1]) if presence else list([])
+                if key not in cells:
+                    cells[key] = list([count, total, vector])
+                    continue
+                cell: List[Any] = cells[key]
+                cell[0] += count
+                cell[1] += total
+                cell[2] = ["1" if "1" in n else "0" for n in zip(cell[2], vector)]
+        rows: List[str] = list([])
+        order: List[str] = sorted(cells, key=int) if all(n.isdigit() for n in cells) else list(cells)
+        for key in order:
+            count, total, vector = cells[key]
+            # DgDataFieldDouble formats, %#.6LF for the total and %#.<precision>LF for the mean
+            row: List[str] = list([key, str(count), f"{total:#.6f}",
+                                   f"{total / count if count > 0 else 0.0:#.{precision}f}"])
+            if presence:
+                row.extend([str(vector.count("1")), "".join(vector)])
+            rows.append(delimiter.join(row))
+        return "\n".join(rows) + ("\n" if len(rows) > 0 else "")
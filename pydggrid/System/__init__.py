@@ -2,6 +2,7 @@ import csv
 
 from pydggrid.System._Constants import Dictionary
 from pydggrid.System._Library import Library
+from pydggrid.System._Parallel import Parallel
 
 Constants: Dictionary = Dictionary()
 Lib: Library = Library()
\ No newline at end of file
@@ -46,6 +46,7 @@ class DataType(TypeDef):
     STRING = 5
     SHAPE_BINARY = 6
     GDAL_GEOJSON = 7
+    DOUBLE = 11
     LOCATION = 13
 
     @classmethod
@@ -107,6 +108,8 @@ class DataType(TypeDef):
             return int(input_value).to_bytes(2, Constants.ENDIAN_TYPE)
         if self.value == DataType.FLOAT:
             return struct.pack("<f", float(input_value))
+        if self.value == DataType.DOUBLE:
+            return struct.pack("<d", float(input_value))
         if self.value == DataType.BINARY:
             byte_array: List[bytes] = list([])
             byte_array.append(DataType.INT.convert_bytes(len(input_value)))
@@ -375,9 +378,11 @@ class BinCoverage(TypeDef):
     BinCoverage
     GLOBAL
     PARTIAL
+    SPARSE: only the occupied cells are allocated, for high resolutions with clustered points
     """
     GLOBAL = 1
     PARTIAL = 2
+    SPARSE = 3
 
 
 class OutputControl(TypeDef):
@@ -426,7 +431,7 @@ class CellLabel(TypeDef):
 
 class CellOutput(TypeDef):
     """
-    cell_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | GDAL_COLLECTION>
+    cell_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | GDAL_COLLECTION | ARROW>
     NONE
     AIGEN
     GDAL
@@ -434,6 +439,7 @@ class CellOutput(TypeDef):
     GEOJSON
     SHAPEFILE
     GDAL_COLLECTION
+    ARROW
     """
     NONE = 1
     AIGEN = 2
@@ -442,11 +448,12 @@ class CellOutput(TypeDef):
     GEOJSON = 5
     SHAPEFILE = 6
     GDAL_COLLECTION = 7
+    ARROW = 10
 
 
 class PointOutput(TypeDef):
     """
-    point_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | TEXT | GDAL_COLLECTION>
+    point_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | TEXT | GDAL_COLLECTION | ARROW>
     NONE
     AIGEN
     GDAL
@@ -454,6 +461,7 @@ class PointOutput(TypeDef):
     GEOJSON
     SHAPEFILE
     GDAL_COLLECTION
+    ARROW
     """
     NONE = 1
     AIGEN = 2
@@ -462,11 +470,12 @@ class PointOutput(TypeDef):
     GEOJSON = 5
     SHAPEFILE = 6
     GDAL_COLLECTION = 7
+    ARROW = 10
 
 
 class ReadMode(TypeDef):
     """
-    ReadMode <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | GDAL_COLLECTION>
+    ReadMode <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | GDAL_COLLECTION | ARROW>
     NONE
     AIGEN
     GDAL
@@ -474,6 +483,7 @@ class ReadMode(TypeDef):
     GEOJSON
     SHAPEFILE
     GDAL_COLLECTION
+    ARROW
     """
     NONE = 1
     AIGEN = 2
@@ -484,6 +494,7 @@ class ReadMode(TypeDef):
     GDAL_COLLECTION = 7
     SEQUENCE = 8
     FRAME = 9
+    ARROW = 10
 
 
 class RandPointOutput(TypeDef):
@@ -508,28 +519,32 @@ class RandPointOutput(TypeDef):
 
 class NeighborOutput(TypeDef):
     """
-    neighbor_output_type <NONE | TEXT | GEOJSON_COLLECTION>
+    neighbor_output_type <NONE | TEXT | GEOJSON_COLLECTION | ARROW>
     NONE
     TEXT
     GEOJSON_COLLECTION
+    ARROW
     """
     NONE = 1
     TEXT = 2
     GEOJSON_COLLECTION = 3
     GDAL_COLLECTION = 4
+    ARROW = 10
 
 
 class ChildrenOutput(TypeDef):
     """
-    children_output_type <NONE | TEXT | GEOJSON_COLLECTION>
+    children_output_type <NONE | TEXT | GEOJSON_COLLECTION | ARROW>
     NONE
     TEXT
     GEOJSON_COLLECTION
+    ARROW
     """
     NONE = 1
     TEXT = 2
     GEOJSON_COLLECTION = 3
     GDAL_COLLECTION = 4
+    ARROW = 10
 
 
 class GDALFormat(TypeDef):
@@ -0,0 +1,164 @@
+#ifndef SRC_PYDGGRID_AIGEN_H
+#define SRC_PYDGGRID_AIGEN_H
+#include <map>
+#include <cmath>
+#include <cctype>
+#include <limits>
+#include <string>
+#include <vector>
+#include <cstdint>
+#include <cstdlib>
+#include <cstring>
+#include "Functions.h"
+
+namespace pydggrid
+{
+    /**
+     * AIGEN text decoder, cell and point records are decoded in a single pass into the column
+     * buffers of the ARROW output (see DgOutArrow), so both outputs are read back the same way
+     * - label_offsets, label_data: record labels
+     * - x, y: record centers (the point of point records)
+     * - ring_offsets, vertex_x, vertex_y: closed cell rings, only when the records have vertices
+     */
+    class AIGen
+    {
+        public:
+
+            /**
+             * Decodes AIGEN text, records are a "<label> [<x> <y>]" header line followed by
+             * "<x> <y>" vertex lines and an END line, point records are header lines only
+             * @param text AIGEN text
+             * @param size Text size
+             * @return Column buffers by column name
+             */
+            static std::map<std::string, std::vector<unsigned char> > decode(const char *text, size_t size)
+            {
+                AIGen decoder;
+                const char *end = text + size;
+                const char *line = text;
+                while (line < end)
+                {
+                    const char *next = static_cast<const char *>(std::memchr(line, '\n', (size_t) (end - line)));
+                    next = next ? next : end;
+                    decoder.readLine(line, next);
+                    line = next + 1;
+                }
+                return decoder.columns();
+            }
+
+        private:
+            std::vector<int32_t> labelOffsets = {0};
+            std::string labelData;
+            std::vector<double> x;
+            std::vector<double> y;
+            std::vector<int32_t> ringOffsets = {0};
+            std::vector<double> vertexX;
+            std::vector<double> vertexY;
+            bool open = false;
+
+            /**
+             * Reads one line of AIGEN text
+             * @param line Line start
+             * @param end Line end, exclusive
+             */
+            void readLine(const char *line, const char *end)
+            {
+                const char *tokens[3];
+                const char *tokenEnds[3];
+                size_t count = 0;
+                for (const char *c = line; c < end;)
+                {
+                    while ((c < end) && std::isspace((unsigned char) *c)) { c++; }
+                    if (c == end) { break; }
+                    if (count == 3)
+                        { Functions::throw_error("Malformed AIGEN line: " + std::string(line, end)); }
+                    tokens[count] = c;
+                    while ((c < end) && !std::isspace((unsigned char) *c)) { c++; }
+                    tokenEnds[count++] = c;
+                }
+                if (count == 0) { return; }
+                if ((count == 1) && (tokenEnds[0] - tokens[0] == 3) && (std::strncmp(tokens[0], "END", 3) == 0))
+                {
+                    // the closing END of the file has no open record
+                    if (this->open) { this->closeRing(); }
+                    this->open = false;
+                    return;
+                }
+                if ((count == 2) && this->open)
+                {
+                    this->vertexX.emplace_back(AIGen::number(tokens[0], tokenEnds[0]));
+                    this->vertexY.emplace_back(AIGen::number(tokens[1], tokenEnds[1]));
+                    return;
+                }
+                if (count == 2)
+                    { Functions::throw_error("Malformed AIGEN line: " + std::string(line, end)); }
+                // a header line, the previous record is a point record if it was not closed
+                this->labelData.append(tokens[0], tokenEnds[0]);
+                if (this->labelData.size() > (size_t) std::numeric_limits<int32_t>::max())
+                    { Functions::throw_error("AIGEN label data exceeds int32 offsets"); }
+                this->labelOffsets.emplace_back((int32_t) this->labelData.size());
+                this->x.emplace_back((count == 3) ? AIGen::number(tokens[1], tokenEnds[1]) : std::nan(""));
+                this->y.emplace_back((count == 3) ? AIGen::number(tokens[2], tokenEnds[2]) : std::nan(""));
+                this->open = true;
+            }
+
+            /**
+             * Closes the ring of the open record
+             */
+            void closeRing()
+            {
+                if (this->vertexX.size() > (size_t) std::numeric_limits<int32_t>::max())
+                    { Functions::throw_error("AIGEN vertex count exceeds int32 offsets"); }
+                this->ringOffsets.emplace_back((int32_t) this->vertexX.size());
+            }
+
+            /**
+             * Returns the decoded column buffers
+             * @return Column buffers by column name
+             */
+            std::map<std::string, std::vector<unsigned char> > columns() const
+            {
+                std::map<std::string, std::vector<unsigned char> > buffers;
+                buffers["label_offsets"] = AIGen::bytes(this->labelOffsets);
+                buffers["label_data"] = std::vector<unsigned char>(this->labelData.begin(), this->labelData.end());
+                buffers["x"] = AIGen::bytes(this->x);
+                buffers["y"] = AIGen::bytes(this->y);
+                if (this->vertexX.empty()) { return buffers; }
+                if (this->ringOffsets.size() != this->labelOffsets.size())
+                    { Functions::throw_error("Malformed AIGEN text, cell records must end with END"); }
+                buffers["ring_offsets"] = AIGen::bytes(this->ringOffsets);
+                buffers["vertex_x"] = AIGen::bytes(this->vertexX);
+                buffers["vertex_y"] = AIGen::bytes(this->vertexY);
+                return buffers;
+            }
+
+            /**
+             * Parses a number token
+             * @param token Token start
+             * @param end Token end, exclusive
+             * @return Token value
+             */
+            static double number(const char *token, const char *end)
+            {
+                char *parsed = nullptr;
+                double value = std::strtod(token, &parsed);
+                if (parsed != end)
+                    { Functions::throw_error("Malformed AIGEN number: " + std::string(token, end)); }
+                return value;
+            }
+
+            /**
+             * Copies values into a byte buffer
+             * @param values Values
+             * @return Value bytes
+             */
+            template<typename T>
+            static std::vector<unsigned char> bytes(const std::vector<T> &values)
+            {
+                std::vector<unsigned char> buffer(values.size() * sizeof(T));
+                if (!values.empty()) { std::memcpy(buffer.data(), values.data(), buffer.size()); }
+                return buffer;
+            }
+    };
+}
+#endif //SRC_PYDGGRID_AIGEN_H
@@ -0,0 +1,216 @@
+#ifndef SRC_PYDGGRID_BINNING_H
+#define SRC_PYDGGRID_BINNING_H
+#include <string>
+#include <vector>
+#include <algorithm>
+#include <stdexcept>
+#include <unordered_map>
+#include "Functions.h"
+#include <dglib/DgBoundedIDGG.h>
+#include <dglib/DgGeoSphRF.h>
+#include <dglib/DgIDGGBase.h>
+#include <dglib/DgLocation.h>
+
+namespace pydggrid
+{
+    /**
+     * Borrowed columns of points to bin, value and class are optional
+     * - x: longitude
+     * - y: latitude
+     * - value: point value, summed into the cell total
+     * - classes: point class index in [0, numClasses), sets the cell presence flag of the class
+     */
+    struct BinInput
+    {
+        size_t size = 0;
+        const double *x = nullptr;
+        const double *y = nullptr;
+        const double *value = nullptr;
+        const long long *classes = nullptr;
+    };
+
+    /**
+     * Columns of binned cells, presence holds numClasses flags per cell (row major)
+     */
+    struct BinOutput
+    {
+        std::vector<unsigned long long> seqnum;
+        std::vector<unsigned long long> count;
+        std::vector<double> total;
+        std::vector<double> mean;
+        std::vector<long long> classes;
+        std::vector<unsigned char> presence;
+    };
+
+    /**
+     * Binning kernel, accumulates point counts, totals and class presence into struct-of-arrays
+     * buffers, dense buffers are indexed by the SEQNUM of the cells of a DGG while sparse buffers
+     * only hold the occupied cells and are indexed through a SEQNUM hash table
+     */
+    class Binning
+    {
+        public:
+
+            /**
+             * Default constructor
+             * @param dggRF Grid reference frame
+             * @param degRF Geodetic degrees reference frame of the grid
+             * @param classCount Number of presence classes, 0 to skip presence
+             * @param sparseBins Allocate the occupied cells only instead of every cell of the grid
+             */
+            Binning(const DgIDGGBase &dggRF, const DgGeoSphDegRF &degRF, size_t classCount, bool sparseBins = false)
+                : idgg(dggRF), deg(degRF), numClasses(classCount), sparse(sparseBins)
+            {
+                const DgBoundedIDGG &bounds = this->idgg.bndRF();
+                this->first = bounds.zeroBased() ? 0 : 1;
+                if (this->sparse) { return; }
+                if (!bounds.validSize())
+                    { Functions::throw_error("Grid is too large for dense binning, use SPARSE bin_coverage"); }
+                this->counts.assign((size_t) bounds.size(), 0);
+                this->totals.assign((size_t) bounds.size(), 0.0);
+                this->presence.assign((size_t) bounds.size() * this->numClasses, 0);
+            };
+
+            /**
+             * Bins a batch of points, the batch is validated and located before any cell is updated so
+             * an invalid batch leaves the buffers untouched
+             * @param input Point columns
+             */
+            void update(const BinInput &input)
+            {
+                for (size_t index = 0; input.classes && (index < input.size); index++)
+                {
+                    long long cls = input.classes[index];
+                    if ((cls < 0) || ((size_t) cls >= this->numClasses))
+                    {
+                        throw std::out_of_range(Functions::string_format("Class %lld is out of range [0, %zu)",
+                                                                         cls, this->numClasses));
+                    }
+                }
+                std::vector<unsigned long long> seqnums(input.size);
+                for (size_t index = 0; index < input.size; index++)
+                    { seqnums[index] = this->seqNum(input.x[index], input.y[index]); }
+                for (size_t index = 0; index < input.size; index++)
+                {
+                    size_t cell = this->slot(seqnums[index]);
+                    this->counts[cell]++;
+                    if (input.value) { this->totals[cell] += input.value[index]; }
+                    if (input.classes) { this->presence[cell * this->numClasses + (size_t) input.classes[index]] = 1; }
+                }
+            }
+
+            /**
+             * Returns the binned cells in SEQNUM order
+             * @param outputAll Output every cell of the grid instead of the occupied cells only
+             * @return Cell columns
+             */
+            BinOutput result(bool outputAll) const
+            {
+                BinOutput output;
+                if (!this->sparse)
+                {
+                    size_t size = this->counts.size();
+                    for (size_t cell = 0; cell < size; cell++)
+                    {
+                        if (!outputAll && (this->counts[cell] == 0)) { continue; }
+                        this->append(output, cell + this->first, &cell);
+                    }
+                }
+                else if (outputAll)
+                {
+                    const DgBoundedIDGG &bounds = this->idgg.bndRF();
+                    if (!bounds.validSize())
+                        { Functions::throw_error("Grid is too large to output every cell"); }
+                    for (unsigned long long seqnum = this->first; seqnum < this->first + bounds.size(); seqnum++)
+                    {
+                        auto node = this->slots.find(seqnum);
+                        this->append(output, seqnum, (node != this->slots.end()) ? &node->second : nullptr);
+                    }
+                }
+                else
+                {
+                    std::vector<unsigned long long> order;
+                    order.reserve(this->slots.size());
+                    for (auto const &node : this->slots) { order.emplace_back(node.first); }
+                    std::sort(order.begin(), order.end());
+                    for (unsigned long long seqnum : order) { this->append(output, seqnum, &this->slots.at(seqnum)); }
+                }
+                return output;
+            }
+
+        private:
+            const DgIDGGBase &idgg;
+            const DgGeoSphDegRF &deg;
+            size_t numClasses;
+            bool sparse;
+            unsigned long long first = 0;
+            std::unordered_map<unsigned long long, size_t> slots;
+            std::vector<unsigned long long> counts;
+            std::vector<double> totals;
+            std::vector<unsigned char> presence;
+
+            /**
+             * Returns the buffer index of a cell, allocating it in sparse mode
+             * @param seqnum Cell SEQNUM
+             * @return Buffer index
+             */
+            size_t slot(unsigned long long seqnum)
+            {
+                if (!this->sparse) { return (size_t) (seqnum - this->first); }
+                auto node = this->slots.emplace(seqnum, this->counts.size());
+                if (node.second)
+                {
+                    this->counts.emplace_back(0);
+                    this->totals.emplace_back(0.0);
+                    this->presence.resize(this->presence.size() + this->numClasses, 0);
+                }
+                return node.first->second;
+            }
+
+            /**
+             * Appends a cell to the output columns
+             * @param output Cell columns
+             * @param seqnum Cell SEQNUM
+             * @param cell Buffer index, null for an empty cell
+             */
+            void append(BinOutput &output, unsigned long long seqnum, const size_t *cell) const
+            {
+                unsigned long long count = cell ? this->counts[*cell] : 0;
+                double total = cell ? this->totals[*cell] : 0.0;
+                output.seqnum.emplace_back(seqnum);
+                output.count.emplace_back(count);
+                output.total.emplace_back(total);
+                output.mean.emplace_back((count > 0) ? total / (double) count : 0.0);
+                if (this->numClasses > 0)
+                {
+                    if (!cell)
+                    {
+                        output.classes.emplace_back(0);
+                        output.presence.insert(output.presence.end(), this->numClasses, 0);
+                        return;
+                    }
+                    const unsigned char *flags = &this->presence[*cell * this->numClasses];
+                    long long present = 0;
+                    for (size_t cls = 0; cls < this->numClasses; cls++) { present += flags[cls]; }
+                    output.classes.emplace_back(present);
+                    output.presence.insert(output.presence.end(), flags, flags + this->numClasses);
+                }
+            }
+
+            /**
+             * Returns the SEQNUM of the cell holding a point
+             * @param x Longitude
+             * @param y Latitude
+             * @return Cell SEQNUM
+             */
+            unsigned long long seqNum(double x, double y) const
+            {
+                DgLocation *loc = this->deg.makeLocation(DgDVec2D(x, y));
+                this->idgg.convert(loc);
+                unsigned long long seqnum = this->idgg.bndRF().seqNum(*loc);
+                delete loc;
+                return seqnum;
+            }
+    };
+}
+#endif //SRC_PYDGGRID_BINNING_H
@@ -5,6 +5,7 @@
 #include <string>
 #include <cstring>
 #include <algorithm>
+#include <stdexcept>
 
 namespace pydggrid
 {
@@ -34,6 +35,17 @@ namespace pydggrid
                 this->read(byteArray, byteSize);
             };
 
+            /**
+             * Borrowed span constructor, the byte array is not copied and must
+             * outlive the Bytes object
+             * @param byteArray Byte Array
+             * @param byteSize Byte Array Size
+             */
+            Bytes(const unsigned char *byteArray, size_t byteSize)
+            {
+                this->borrow(byteArray, byteSize);
+            };
+
             /**
              * Vector constructor
              * @param byteArray Byte Array Vector
@@ -74,6 +86,7 @@ namespace pydggrid
                 this->data.resize(byteSize);
                 this->data.assign(byteArray, byteArray + byteSize);
                 this->size = byteSize;
+                this->span = nullptr;
                 return this;
             };
 
@@ -88,9 +101,35 @@ namespace pydggrid
                 this->size = byteArray.size();
                 this->data.resize(this->size);
                 this->data.assign(byteArray.begin(), byteArray.end());
+                this->span = nullptr;
+                return this;
+            };
+
+            /**
+             * Borrows a byte span without copying it
+             * @param byteArray Byte Array
+             * @param byteSize Byte Size
+             * @return Bytes Object
+             */
+            Bytes *borrow(const unsigned char *byteArray, size_t byteSize)
+            {
+                this->data.clear();
+                this->data.resize(0);
+                this->span = byteArray;
+                this->size = byteSize;
+                this->index = 0;
                 return this;
             };
 
+            /**
+             * Returns true if the bytes object reads from a borrowed span
+             * @return True if borrowed
+             */
+            bool isBorrowed()
+            {
+                return (this->span != nullptr);
+            }
+
             /**
              * Returns true if the bytes data is empty
              * @return True if empty
@@ -135,11 +174,8 @@ namespace pydggrid
             int getInt(size_t byteIndex)
             {
                 int value = 0;
-                size_t yIndex = byteIndex + Bytes::intSize;
-                memcpy(&value, this->slice(this->data,
-                                        (int) byteIndex,
-                                        (int) yIndex).data(),
-                       Bytes::intSize);
+                this->check(byteIndex, Bytes::intSize);
+                memcpy(&value, this->buffer() + byteIndex, Bytes::intSize);
                 this->index += Bytes::intSize;
                 return value;
             };
@@ -161,12 +197,9 @@ namespace pydggrid
             float getFloat(size_t byteIndex)
             {
                 float value = 0.0f;
-                size_t yIndex = byteIndex + Bytes::floatSize;
-                memcpy(&value, this->slice(this->data,
-                                        (int) byteIndex,
-                                        (int) yIndex).data(),
-                       Bytes::intSize);
-                this->index += Bytes::intSize;
+                this->check(byteIndex, Bytes::floatSize);
+                memcpy(&value, this->buffer() + byteIndex, Bytes::floatSize);
+                this->index += Bytes::floatSize;
                 return value;
             };
 
@@ -188,14 +221,9 @@ namespace pydggrid
             {
                 int stringSize = this->getInt(byteIndex);
                 size_t byteSubIndex = byteIndex + Bytes::intSize;
-                size_t yIndex = byteSubIndex + stringSize;
-                std::vector<unsigned char> elements = this->slice(this->data,
-                                                                  (int) byteSubIndex,
-                                                                  (int) yIndex);
-                char stringData[(4096 ^ 2)];
-                memcpy(stringData, elements.data(), stringSize);
-                stringData[stringSize] = '\0';
-                std::string stringElement(stringData);
+                this->check(byteSubIndex, stringSize);
+                const char *stringData = (const char *) (this->buffer() + byteSubIndex);
+                std::string stringElement(stringData, strnlen(stringData, stringSize));
                 this->index += stringSize;
                 return stringElement;
             }
@@ -218,43 +246,81 @@ namespace pydggrid
             {
                 int byteSize = this->getInt(byteIndex);
                 size_t byteSubIndex = byteIndex + Bytes::intSize;
-                size_t yIndex = byteSubIndex + byteSize;
-                std::vector<unsigned char> elements = this->slice(this->data,
-                                                                  (int) byteSubIndex,
-                                                                  (int) yIndex);
+                this->check(byteSubIndex, byteSize);
+                std::vector<unsigned char> elements(this->buffer() + byteSubIndex,
+                                                    this->buffer() + byteSubIndex + byteSize);
                 this->index += byteSize;
                 return elements;
             }
 
+            /**
+             * Returns a borrowed view of the bytes at current index
+             * @return Bytes view, valid while the parent data is alive
+             */
+            Bytes getView()
+            {
+                return this->getView(this->getIndex());
+            };
+
+            /**
+             * Returns a borrowed view of the bytes at given index
+             * @param byteIndex Byte Index
+             * @return Bytes view, valid while the parent data is alive
+             */
+            Bytes getView(size_t byteIndex)
+            {
+                int byteSize = this->getInt(byteIndex);
+                size_t byteSubIndex = byteIndex + Bytes::intSize;
+                this->check(byteSubIndex, byteSize);
+                Bytes view(this->buffer() + byteSubIndex, (size_t) byteSize);
+                this->index += byteSize;
+                return view;
+            }
+
+            /**
+             * Returns a pointer to the first byte of the data
+             * @return Byte pointer
+             */
+            const unsigned char *toPointer()
+            {
+                return this->buffer();
+            }
+
             /**
              * Returns internal data as vector
              * @return VBytes vector
              */
             std::vector<unsigned char> toVector()
             {
-                return {this->data};
+                return {this->buffer(), this->buffer() + this->size};
             }
 
         private:
             size_t size = 0;
             size_t index = 0;
             std::vector<unsigned char> data{};
+            const unsigned char *span = nullptr;
 
             /**
-             * Slices a vector
-             * @tparam T Vector Template
-             * @param array Vector Array
-             * @param X Slice Begin
-             * @param Y Slice End
-             * @return Sliced vector
+             * Returns the active data pointer, borrowed span or owned data
+             * @return Byte pointer
+             */
+            const unsigned char *buffer()
+            {
+                return (this->span != nullptr) ? this->span : this->data.data();
+            }
+
+            /**
+             * Throws if a read of byteSize at byteIndex runs past the data
+             * @param byteIndex Byte Index
+             * @param byteSize Read Size
              */
-            std::vector<unsigned char > slice(std::vector<unsigned char> const& array, int X, int Y)
+            void check(size_t byteIndex, int byteSize)
             {
-                auto start = array.begin() + X;
-                auto end = array.begin() + Y;
-                std::vector<unsigned char> result(Y - X);
-                std::copy(start, end, result.begin());
-                return result;
+                if ((byteSize < 0) || ((byteIndex + (size_t) byteSize) > this->size))
+                {
+                    throw std::out_of_range("Bytes read past end of payload");
+                }
             }
     };
 }
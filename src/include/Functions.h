@@ -193,10 +193,10 @@ namespace pydggrid::Functions
      * @param byteData Byte Data
      * @param byteSize Byte Size
      */
-    static void writeBinary(const char *pathString, unsigned char *byteData, size_t byteSize)
+    static void writeBinary(const char *pathString, const unsigned char *byteData, size_t byteSize)
     {
         std::ofstream stream(pathString, std::ios::out | std::ios::binary | std::ios::app);
-        stream.write((char *) byteData, (long) byteSize);
+        stream.write((const char *) byteData, (long) byteSize);
         stream.close();
     }
 
@@ -8,4 +8,7 @@ typedef std::basic_ofstream<unsigned char, std::char_traits<unsigned char> > ofs
 #include "Parameters.h"
 #include "Bytes.h"
 #include "Query.h"
+#include "Session.h"
+#include "Stream.h"
+#include "AIGen.h"
 #endif //SRC_INCLUDES_H
@@ -6,12 +6,18 @@
 #include <cstdio>
 #include <sstream>
 #include <filesystem>
+#include <atomic>
+#include <cpl_conv.h>
+#include <cpl_vsi.h>
 #include "Functions.h"
 #include "Constants.h"
 #include "Bytes.h"
 #include "../pydggrid/OpBasic.h"
 #include "../pydggrid/SubOpStats.h"
+#include "../pydggrid/DgOutArrow.h"
+#include "../pydggrid/DgOutAdjacency.h"
 #include <dglib/DgOWStream.h>
+#include <dglib/DgBoundedIDGG.h>
 
 namespace pydggrid
 {
@@ -27,19 +33,22 @@ namespace pydggrid
             Query(const std::map<std::string, std::string> &parameterData,
                   const std::vector<unsigned char> &byteData)
             {
-                for (const auto& parameter : parameterData)
-                    { this->parameters[parameter.first] = std::string{parameter.second}; }
-                this->parameters["verbosity"] = "0";
-                //
-                this->bin.clear();
-                this->bin.resize(0);
-                this->readBytes(byteData);
-                this->writeBinaries();
-                this->writeRegisters();
-                this->writeOutputs();
-                this->operation = std::make_unique<OpBasic>(this->parameters);
-                //
-                this->copyStreams();
+                this->payload = byteData;
+                this->load(parameterData, this->payload.data(), this->payload.size());
+            };
+
+            /**
+             * Borrowed span constructor, the payload is parsed in place and must
+             * outlive the query
+             * @param parameterData Parameter Data
+             * @param byteData Bytes Data
+             * @param byteSize Bytes Data Size
+             */
+            Query(const std::map<std::string, std::string> &parameterData,
+                  const unsigned char *byteData,
+                  size_t byteSize)
+            {
+                this->load(parameterData, byteData, byteSize);
             };
 
             /**
@@ -58,40 +67,53 @@ namespace pydggrid
             {
                 this->operation->initialize();
                 this->operation->execute();
-                this->response["meta"] = this->metaBin();
-                this->response["cells"] = this->operation->outOp.getCells();
-                this->response["points"] = this->operation->outOp.getPoints();
-                this->response["collection"] = this->operation->outOp.getCollection();
-                this->response["pr_cells"] = this->operation->outOp.getPRCells();
-                this->response["r_points"] = this->operation->outOp.getRPoints();
-                this->response["collection"] = this->operation->outOp.getCollection();
-                this->response["statistics"] = this->statisticBlocks();
-                this->response["dataset"] = this->operation->outOp.getDataOut();
-                if (this->isPointQuery())
-                    { this->response["dataset"] = this->operation->outOp.getTextOut(); }
+                this->readStreams();
                 this->operation->cleanup();
-                if (this->isOutFile("cell"))
-                    { this->response["cells"] = this->getData("cell"); }
-                if (this->isOutFile("point"))
-                    { this->response["points"] = this->getData("point"); }
-                if (this->isOutFile("collection"))
-                    { this->response["collection"] = this->getData("collection"); }
+                this->readOutputs();
+                // only the grid of a successful run goes back into the grid cache
+                this->operation->dggOp.setGridComplete(true);
                 //
                 return this;
             };
 
             /**
-             * Closes the query
+             * Sets the interrupt flag of the query, the operation stops and run() throws
+             * DgInterruptedError once the flag is non-zero. The flag must outlive the run
+             * @param flag Interrupt flag, nullptr to clear it
+             * @return Query Object
+             */
+            Query *interruptWith(const volatile unsigned char *flag)
+            {
+                this->operation->interruptFlag = flag;
+                return this;
+            }
+
+            /**
+             * Builds the grid of the query without running the operation
+             * @return Number of cells of the grid, 0 if the count does not fit an unsigned long long
+             */
+            unsigned long long gridSize()
+            {
+                this->operation->initialize();
+                this->operation->mainOp.execute();
+                this->operation->dggOp.execute();
+                this->operation->dggOp.setGridComplete(true);
+                const DgBoundedIDGG &bounds = this->operation->dggOp.dgg().bndRF();
+                return bounds.validSize() ? bounds.size() : 0;
+            }
+
+            /**
+             * Closes the query, releasing its in-memory input and output files
              * @return
              */
             Query *close()
             {
-                for (const std::string &filename : this->IOGC)
+                this->operation->cleanup();
+                if (!this->vsiRoot.empty())
                 {
-                    std::remove(filename.c_str());
+                    VSIRmdirRecursive(this->vsiRoot.c_str());
+                    this->vsiRoot.clear();
                 }
-                this->IOGC.clear();
-                this->operation->cleanup();
                 return this;
             }
 
@@ -115,6 +137,30 @@ namespace pydggrid
                     std::vector<unsigned char>{} : std::vector<unsigned char>{this->response[responseCode]};
             }
 
+            /**
+             * Returns true if the query holds response data by name
+             * @param responseCode Response Code
+             * @return True if the response exists
+             */
+            bool hasResponse(const std::string &responseCode)
+            {
+                return this->response.find(responseCode) != this->response.end();
+            }
+
+            /**
+             * Moves response data out of the query by name, the response entry is released
+             * @param responseCode Response Code
+             * @return Response Code Bytes
+             */
+            std::vector<unsigned char> takeResponse(const char *responseCode)
+            {
+                auto node = this->response.find(responseCode);
+                if (node == this->response.end()) { return {}; }
+                std::vector<unsigned char> elements = std::move(node->second);
+                this->response.erase(node);
+                return elements;
+            }
+
             /**
              * Returns response bytes of the query
              * @return Response Bytes
@@ -187,20 +233,104 @@ namespace pydggrid
              */
             size_t getPacketSize(size_t index)
             {
-                return (index < this->binSize) ? this->bin[index].size() : -1;
+                return (index < this->binSize) ? this->bin[index].getSize() : -1;
             }
 
-        private:
+        protected:
             size_t binSize = 0;
             std::vector<int>  bin_t;
-            std::vector<std::vector<unsigned char> >  bin;
+            std::vector<Bytes>  bin;
+            std::vector<unsigned char> payload; // owned payload for the vector constructor
             std::map<std::string, std::string> parameters;
             std::map<std::string, std::vector<unsigned char> > response;
             //
             std::unique_ptr<OpBasic> operation;
             std::vector<std::string> REGF; // region registration set
-            std::vector<std::string> IOGC; // I/o garbage collection
+            std::string vsiRoot; // /vsimem/ directory holding the query's input and output files
+            size_t vsiIndex = 0;
             std::map<std::string, std::vector<std::string> > streams;
+            std::map<std::string, DgPackedPoints> packed; // packed point packets, borrowed from the payload
+
+            /**
+             * Loads parameters and payload into the query
+             * @param parameterData Parameter Data
+             * @param byteData Bytes Data
+             * @param byteSize Bytes Data Size
+             */
+            void load(const std::map<std::string, std::string> &parameterData,
+                      const unsigned char *byteData,
+                      size_t byteSize)
+            {
+                for (const auto& parameter : parameterData)
+                    { this->parameters[parameter.first] = std::string{parameter.second}; }
+                this->parameters["verbosity"] = "0";
+                //
+                this->vsiRoot = Functions::string_format("/vsimem/pydggrid_%llu", Query::nextID());
+                VSIMkdir(this->vsiRoot.c_str(), 0755);
+                try
+                {
+                    this->bin.clear();
+                    this->bin.resize(0);
+                    this->readBytes(byteData, byteSize);
+                    this->writeBinaries();
+                    this->writeRegisters();
+                    this->writeOutputs();
+                    this->operation = std::make_unique<OpBasic>(this->parameters);
+                    //
+                    this->copyStreams();
+                }
+                catch (...)
+                {
+                    // the destructor does not run when a constructor throws, drop the in-memory files here
+                    VSIRmdirRecursive(this->vsiRoot.c_str());
+                    this->vsiRoot.clear();
+                    throw;
+                }
+            }
+
+            /**
+             * Reads the in-memory output streams of the executed operation into the response
+             */
+            void readStreams()
+            {
+                this->response["meta"] = this->metaBin();
+                this->response["cells"] = this->operation->outOp.getCells();
+                this->response["points"] = this->operation->outOp.getPoints();
+                this->response["pr_cells"] = this->operation->outOp.getPRCells();
+                this->response["r_points"] = this->operation->outOp.getRPoints();
+                this->response["collection"] = this->operation->outOp.getCollection();
+                this->response["statistics"] = this->statisticBlocks();
+                this->response["dataset"] = this->operation->outOp.getDataOut();
+                if (this->isPointQuery())
+                    { this->response["dataset"] = this->operation->outOp.getTextOut(); }
+                for (const std::string &column : DgOutArrow::columns)
+                {
+                    if (this->getOutputType("cell") == "ARROW")
+                        { this->response["cells." + column] = this->operation->outOp.getCellArrow(column); }
+                    if (this->getOutputType("point") == "ARROW")
+                        { this->response["points." + column] = this->operation->outOp.getPointArrow(column); }
+                }
+                for (const std::string &column : DgOutAdjacency::columns)
+                {
+                    if (this->getOutputType("neighbor") == "ARROW")
+                        { this->response["neighbors." + column] = this->operation->outOp.getNeighborArrow(column); }
+                    if (this->getOutputType("children") == "ARROW")
+                        { this->response["children." + column] = this->operation->outOp.getChildrenArrow(column); }
+                }
+            }
+
+            /**
+             * Reads the output files into the response, output files must be closed first
+             */
+            void readOutputs()
+            {
+                if (this->isOutFile("cell"))
+                    { this->response["cells"] = this->getData("cell"); }
+                if (this->isOutFile("point"))
+                    { this->response["points"] = this->getData("point"); }
+                if (this->isOutFile("collection"))
+                    { this->response["collection"] = this->getData("collection"); }
+            }
 
             /**
              * Returns the meta response data as a byte array
@@ -230,6 +360,7 @@ namespace pydggrid
                 if (dataType == Constants::DataTypes::STRING) { return "STRING"; }
                 if (dataType == Constants::DataTypes::SHAPE_BINARY) { return "SHAPE_BINARY"; }
                 if (dataType == Constants::DataTypes::LOCATION) { return "LOCATION"; }
+                if (dataType == Constants::DataTypes::DOUBLE) { return "DOUBLE"; }
                 return "UNKNOWN";
             }
 
@@ -244,26 +375,27 @@ namespace pydggrid
                     (this->bin_t[index] == Constants::DataTypes::SHAPE_BINARY) ||
                     (this->bin_t[index] == Constants::DataTypes::LOCATION))
                 {
-                    return Functions::to_hex(this->bin[index]);
+                    return Functions::to_hex(this->bin[index].toVector());
                 }
 
                 return "";
             }
 
             /**
-             * Reads bytes into the query object
+             * Reads bytes into the query object, packets are borrowed views of the payload
              * @param byteData Byte Data from python
+             * @param byteSize Byte Data Size
              */
-            void readBytes(const std::vector<unsigned char> &byteData)
+            void readBytes(const unsigned char *byteData, size_t byteSize)
             {
-                Bytes bytes(byteData);
+                Bytes bytes(byteData, byteSize);
                 if (!bytes.isEmpty())
                 {
                     this->binSize = bytes.getInt();
                     for (int index = 0; index < this->binSize; index++)
                     {
                         this->bin_t.emplace_back(bytes.getInt());
-                        this->bin.emplace_back(bytes.getBytes());
+                        this->bin.emplace_back(bytes.getView());
                     }
                 }
             }
@@ -280,20 +412,15 @@ namespace pydggrid
                     if ((this->getDataType(index) == Constants::DataTypes::SHAPE_BINARY))
                     {
                         Bytes bytes(this->bin[index]);
-                        char filename[] = "/tmp/PYDGGRID.XXXXXX"; // template for our file.
-                        int fd = mkstemp(filename);
-                        std::string base = std::string(filename);
+                        std::string base = this->vsiFile();
                         int element_size = bytes.getInt();
                         for (size_t element_index = 0; element_index < element_size; element_index++)
                         {
                             std::string file_extension = bytes.getString();
-                            std::vector<unsigned char> file_data = bytes.getBytes();
+                            Bytes file_data = bytes.getView();
                             std::string file_name = base + std::string(".") + file_extension;
-                            Functions::writeBinary(file_name.c_str(),
-                                                   file_data.data(),
-                                                   file_data.size());
+                            this->mountFile(file_name, file_data);
                             if (file_extension == "shp") { this->REGF.emplace_back(file_name); }
-                            this->IOGC.emplace_back(file_name);
                         }
                     }
                     if ((this->getDataType(index) == Constants::DataTypes::INT))
@@ -320,14 +447,30 @@ namespace pydggrid
                         }
                         else
                         {
-                            std::string fileName = this->tmpFile();
-                            std::vector<unsigned char> fileData = bytes.getBytes();
-                            Functions::writeBinary(fileName.c_str(),
-                                                   fileData.data(),
-                                                   fileData.size());
+                            std::string fileName = this->vsiFile();
+                            Bytes fileData = bytes.getView();
+                            this->mountFile(fileName, fileData);
                             this->REGF.emplace_back(fileName);
                         }
                     }
+                    if (this->getDataType(index) == Constants::DataTypes::DOUBLE)
+                    {
+                        // packed points: <rows> <columns> then float64 columns x, y [, value]
+                        Bytes bytes(this->bin[index]);
+                        DgPackedPoints points;
+                        points.size = (unsigned long long) bytes.getInt();
+                        auto columns = (size_t) bytes.getInt();
+                        size_t columnSize = points.size * sizeof(double);
+                        if ((columns < 2) || (bytes.getSize() < 2 * Bytes::intSize + columns * columnSize))
+                            { Functions::throw_error("Invalid packed point packet %zu", index + 1); }
+                        const unsigned char *data = bytes.toPointer() + 2 * Bytes::intSize;
+                        points.x = data;
+                        points.y = data + columnSize;
+                        points.value = (columns > 2) ? data + 2 * columnSize : nullptr;
+                        std::string enumID = "PTS-" + std::to_string((index + 1));
+                        this->packed.insert({enumID, points});
+                        this->REGF.emplace_back(enumID);
+                    }
                     if (this->getDataType(index) == Constants::DataTypes::LOCATION)
                     {
                         std::vector<std::string> elements;
@@ -350,7 +493,7 @@ namespace pydggrid
             }
 
             /**
-             * Write register files from tmpfs
+             * Write register files from the in-memory file system
              */
             void writeRegisters()
             {
@@ -478,20 +621,58 @@ namespace pydggrid
                 {
                     this->operation->stringStreamData.insert({streamNode.first, streamNode.second});
                 }
+                for (auto const &packedNode : this->packed)
+                    { this->operation->packedPointData.insert({packedNode.first, packedNode.second}); }
             }
 
             /**
-             * Creates a temp file with extension and returns name
-             * @param extension Extension String
-             * @return Temp File Name
+             * Returns a process unique query id
+             * @return Query ID
              */
-            std::string tmpFile()
+            static unsigned long long nextID()
             {
-                char filename[] = "/tmp/PYDGGRID.XXXXXX"; // template for our file.
-                int _ = mkstemp(filename);
-                std::string fileName{filename};
-                std::remove(fileName.c_str());
-                return fileName;
+                static std::atomic<unsigned long long> queryID{0};
+                return ++queryID;
+            }
+
+            /**
+             * Returns a new in-memory file name under the query's /vsimem/ directory
+             * @return VSI File Name
+             */
+            std::string vsiFile()
+            {
+                return this->vsiRoot + "/" + std::to_string(++this->vsiIndex);
+            }
+
+            /**
+             * Mounts a payload view as an in-memory file, the data is referenced and not copied
+             * @param fileName VSI File Name
+             * @param fileData Payload View
+             */
+            static void mountFile(const std::string &fileName, Bytes &fileData)
+            {
+                VSILFILE *file = VSIFileFromMemBuffer(fileName.c_str(),
+                                                      (GByte *) fileData.toPointer(),
+                                                      (vsi_l_offset) fileData.getSize(),
+                                                      FALSE);
+                if (file == nullptr)
+                    { Functions::throw_error("Unable to create in-memory file %s", fileName.c_str()); }
+                VSIFCloseL(file);
+            }
+
+            /**
+             * Reads an in-memory file into a byte vector and releases it
+             * @param fileName VSI File Name
+             * @return File Bytes
+             */
+            static std::vector<unsigned char> readFile(const std::string &fileName)
+            {
+                vsi_l_offset fileSize = 0;
+                GByte *fileData = VSIGetMemFileBuffer(fileName.c_str(), &fileSize, TRUE);
+                if (fileData == nullptr) { return {}; }
+                std::vector<unsigned char> elements(fileData, fileData + fileSize);
+                CPLFree(fileData);
+                return elements;
             }
 
             /**
@@ -505,7 +686,7 @@ namespace pydggrid
                 std::string file_f = Functions::string_format("%s_output_file_name", vectorID.c_str());
                 if (this->parameters.find(field_f) != this->parameters.end())
                 {
-                    return Functions::readBinary(this->parameters[file_f].c_str());
+                    return Query::readFile(this->parameters[file_f]);
                 }
                 //
                 field_f = Functions::string_format("%s_output_type", vectorID.c_str());
@@ -530,7 +711,7 @@ namespace pydggrid
                 for (const auto &extension : Constants::shapefile_extensions)
                 {
                     std::string f_name = Functions::string_format("%s.%s", fileName, extension.c_str());
-                    std::vector<unsigned char> byteData = Functions::readBinary(f_name.c_str());
+                    std::vector<unsigned char> byteData = Query::readFile(f_name);
                     std::vector<unsigned char> byteSize = Functions::to_bytes(byteData.size());
                     bytes.insert(bytes.end(), extension.begin(), extension.end());
                     bytes.insert(bytes.end(), byteSize.begin(), byteSize.end());
@@ -565,14 +746,13 @@ namespace pydggrid
             };
 
             /**
-             * Sets the output file to temp directory
+             * Sets the output file to the query's /vsimem/ directory
              * @param dataIndex Data Index
              */
             void setOutputFile(const char *dataIndex)
             {
                 std::string file_f = Functions::string_format("%s_output_file_name", dataIndex);
-                this->parameters[file_f] = this->tmpFile();
-                this->IOGC.emplace_back(this->parameters[file_f]);
+                this->parameters[file_f] = this->vsiFile();
             }
 
             /**
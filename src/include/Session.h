@@ -0,0 +1,209 @@
+#ifndef SRC_PYDGGRID_SESSION_H
+#define SRC_PYDGGRID_SESSION_H
+#include <string>
+#include <vector>
+#include <map>
+#include <mutex>
+#include "Functions.h"
+#include "Query.h"
+#include "Transform.h"
+#include "Binning.h"
+
+namespace pydggrid
+{
+    /**
+     * Long lived query, the operation is configured and the grid is built once, every run
+     * then only re-executes the input, output and primary sub operations on a new payload
+     */
+    class Session : public Query
+    {
+        public:
+
+            /**
+             * Default constructor, configures the operation and builds the grid
+             * @param parameterData Parameter Data
+             */
+            explicit Session(const std::map<std::string, std::string> &parameterData)
+                : Query(parameterData, nullptr, 0)
+            {
+                if (!this->isPointQuery() && !this->isTransformQuery())
+                {
+                    Functions::throw_error("Session does not support %s, use a point or transform operation",
+                                           this->parameters["dggrid_operation"].c_str());
+                }
+                this->sessionRoot = this->vsiRoot;
+                this->operation->initialize();
+                if (this->operation->dggOp.numGrids > 1)
+                    { Functions::throw_error("Session requires a single grid (dggs_num_grids 1)"); }
+                this->operation->mainOp.execute();
+                this->operation->dggOp.execute();
+                this->operation->dggOp.setGridComplete(true);
+            };
+
+            /**
+             * Runs the session operation on a payload, the payload is parsed in place and
+             * only needs to stay alive for the duration of the call
+             * @param byteData Bytes Data
+             * @param byteSize Bytes Data Size
+             * @return Session Object
+             */
+            Session *run(const unsigned char *byteData, size_t byteSize)
+            {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                if (this->closed) { Functions::throw_error("Session is closed"); }
+                this->reset();
+                // inputs of a run live in their own directory so they can be dropped together
+                this->vsiRoot = Functions::string_format("%s/run_%llu",
+                                                         this->sessionRoot.c_str(),
+                                                         ++this->runs);
+                VSIMkdir(this->vsiRoot.c_str(), 0755);
+                try
+                {
+                    this->readBytes(byteData, byteSize);
+                    this->writeBinaries();
+                    if (!this->REGF.empty())
+                    {
+                        for (auto const &streamNode : this->streams)
+                            { this->operation->stringStreamData[streamNode.first] = streamNode.second; }
+                        for (auto const &packedNode : this->packed)
+                            { this->operation->packedPointData[packedNode.first] = packedNode.second; }
+                        this->operation->inOp.inputFiles = this->REGF;
+                        this->operation->inOp.execute(true);
+                        this->operation->outOp.execute(true);
+                        this->operation->primarySubOp->execute(true);
+                        this->readStreams();
+                        this->operation->outOp.resetFiles();
+                        this->readOutputs();
+                    }
+                }
+                catch (...)
+                {
+                    // a failed or interrupted run may leave the grid half updated, keep it out of the cache
+                    this->operation->dggOp.setGridComplete(false);
+                    this->release();
+                    throw;
+                }
+                this->release();
+                return this;
+            };
+
+            /**
+             * Transforms address columns to the cells of the session grid, the columns are read in
+             * place and no text is formatted or parsed
+             * @param inType Input address type name (GEO, Q2DI, Q2DD, SEQNUM)
+             * @param input Input columns
+             * @param outType Output address type name (GEO, Q2DI, Q2DD, SEQNUM)
+             * @return Output columns
+             */
+            TransformOutput transform(const std::string &inType,
+                                      const TransformInput &input,
+                                      const std::string &outType)
+            {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                if (this->closed) { Functions::throw_error("Session is closed"); }
+                Transform transform(this->operation->dggOp.dgg(), this->operation->dggOp.deg());
+                return transform.run(dgg::addtype::stringToAddressType(inType),
+                                     input,
+                                     dgg::addtype::stringToAddressType(outType));
+            }
+
+            /**
+             * Bins point columns into the cells of the session grid, the columns are read in place
+             * and no text is formatted or parsed
+             * @param input Point columns
+             * @param numClasses Number of presence classes, 0 to skip presence
+             * @param outputAll Output every cell of the grid instead of the occupied cells only
+             * @param sparse Allocate the occupied cells only whatever the bin_coverage, for small batches
+             * @return Cell columns
+             */
+            BinOutput binPoints(const BinInput &input, size_t numClasses, bool outputAll, bool sparse = false)
+            {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                if (this->closed) { Functions::throw_error("Session is closed"); }
+                Binning binning(this->operation->dggOp.dgg(), this->operation->dggOp.deg(), numClasses,
+                                sparse || this->isSparse());
+                binning.update(input);
+                return binning.result(outputAll);
+            }
+
+            /**
+             * Returns true if the session bins into the occupied cells only, either as requested by the
+             * SPARSE bin_coverage or because the grid is too large for dense buffers
+             * @return Sparse binning flag
+             */
+            bool isSparse()
+            {
+                auto coverage = this->parameters.find("bin_coverage");
+                return ((coverage != this->parameters.end()) && (coverage->second == "SPARSE")) ||
+                       !this->operation->dggOp.dgg().bndRF().validSize();
+            }
+
+            /**
+             * Closes the session, releasing the operation and its in-memory files
+             * @return Session Object
+             */
+            Session *close()
+            {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                if (!this->closed)
+                {
+                    this->closed = true;
+                    Query::close();
+                }
+                return this;
+            }
+
+            /**
+             * Returns true if the session was closed
+             * @return True if closed
+             */
+            bool isClosed()
+            {
+                return this->closed;
+            }
+
+            /**
+             * Returns the number of runs executed by the session
+             * @return Run Count
+             */
+            unsigned long long getRuns()
+            {
+                return this->runs;
+            }
+
+        private:
+            std::mutex mutex;
+            std::string sessionRoot; // /vsimem/ directory holding the session's output files
+            unsigned long long runs = 0;
+            bool closed = false;
+
+            /**
+             * Clears the payload and response of the previous run
+             */
+            void reset()
+            {
+                this->binSize = 0;
+                this->bin_t.clear();
+                this->bin.clear();
+                this->streams.clear();
+                this->packed.clear();
+                this->REGF.clear();
+                this->response.clear();
+            }
+
+            /**
+             * Releases the input streams and in-memory files of the current run
+             */
+            void release()
+            {
+                for (auto const &streamNode : this->streams)
+                    { this->operation->stringStreamData.erase(streamNode.first); }
+                for (auto const &packedNode : this->packed)
+                    { this->operation->packedPointData.erase(packedNode.first); }
+                this->bin.clear();
+                VSIRmdirRecursive(this->vsiRoot.c_str());
+                this->vsiRoot = this->sessionRoot;
+            }
+    };
+}
+#endif //SRC_PYDGGRID_SESSION_H
@@ -0,0 +1,161 @@
+#ifndef SRC_PYDGGRID_STREAM_H
+#define SRC_PYDGGRID_STREAM_H
+#include <string>
+#include <vector>
+#include <map>
+#include <deque>
+#include <mutex>
+#include <thread>
+#include <exception>
+#include <stdexcept>
+#include <condition_variable>
+#include "Functions.h"
+#include "Query.h"
+
+namespace pydggrid
+{
+    /**
+     * Streamed ARROW query, the operation runs on a worker thread and hands its cells over in
+     * chunks through a bounded queue, the worker waits while the queue is full so memory stays
+     * bounded by chunkSize * capacity cells however large the grid is
+     */
+    class Stream : public Query
+    {
+        public:
+
+            /**
+             * Default constructor, starts the operation
+             * @param parameterData Parameter Data
+             * @param byteData Bytes Data, copied
+             * @param chunkSize Number of cells per chunk
+             * @param capacity Number of chunks buffered ahead of the consumer
+             */
+            Stream(const std::map<std::string, std::string> &parameterData,
+                   const std::vector<unsigned char> &byteData,
+                   size_t chunkSize,
+                   size_t capacity) : Query(parameterData, byteData)
+            {
+                if ((this->getOutputType("cell") != "ARROW") && (this->getOutputType("point") != "ARROW"))
+                    { Functions::throw_error("Stream requires ARROW cell or point output"); }
+                if ((chunkSize == 0) || (capacity == 0))
+                    { Functions::throw_error("Stream chunk size and capacity must be positive"); }
+                this->capacity = capacity;
+                this->operation->outOp.arrowChunkSize = chunkSize;
+                this->operation->outOp.arrowSink = [this](std::map<std::string, std::vector<unsigned char> > &chunk)
+                    { this->push(chunk); };
+                this->worker = std::thread(&Stream::produce, this);
+            };
+
+            /**
+             * Stream deconstructor, stops the operation
+             */
+            ~Stream()
+            {
+                this->close();
+            }
+
+            /**
+             * Waits for the next chunk, rethrows the error of a failed operation
+             * @param chunk Chunk columns ("cells.<column>", "points.<column>")
+             * @return False once the operation has finished and every chunk was read
+             */
+            bool next(std::map<std::string, std::vector<unsigned char> > &chunk)
+            {
+                std::unique_lock<std::mutex> lock(this->mutex);
+                this->notEmpty.wait(lock, [this] { return !this->chunks.empty() || this->done; });
+                if (!this->chunks.empty())
+                {
+                    chunk = std::move(this->chunks.front());
+                    this->chunks.pop_front();
+                    this->notFull.notify_one();
+                    return true;
+                }
+                if (this->error)
+                {
+                    std::exception_ptr error = this->error;
+                    this->error = nullptr;
+                    std::rethrow_exception(error);
+                }
+                return false;
+            }
+
+            /**
+             * Stops the operation and releases the query, buffered chunks are dropped
+             * @return Stream Object
+             */
+            Stream *close()
+            {
+                {
+                    std::lock_guard<std::mutex> lock(this->mutex);
+                    if (this->closed) { return this; }
+                    this->closed = true;
+                    this->cancelled = true;
+                    this->chunks.clear();
+                }
+                this->notFull.notify_all();
+                if (this->worker.joinable()) { this->worker.join(); }
+                this->operation->outOp.arrowSink = nullptr;
+                Query::close();
+                return this;
+            }
+
+            /**
+             * Returns true if the stream was closed
+             * @return True if closed
+             */
+            bool isClosed()
+            {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                return this->closed;
+            }
+
+        private:
+            std::mutex mutex;
+            std::condition_variable notEmpty;
+            std::condition_variable notFull;
+            std::deque<std::map<std::string, std::vector<unsigned char> > > chunks;
+            std::exception_ptr error = nullptr;
+            size_t capacity = 1;
+            bool done = false;
+            bool cancelled = false;
+            bool closed = false;
+            std::thread worker;
+
+            /**
+             * Worker thread, runs the operation to completion or cancellation
+             */
+            void produce()
+            {
+                try
+                {
+                    this->operation->initialize();
+                    this->operation->execute();
+                    this->operation->cleanup(); // flushes the last partial chunk
+                    this->operation->dggOp.setGridComplete(true);
+                }
+                catch (...)
+                {
+                    std::lock_guard<std::mutex> lock(this->mutex);
+                    if (!this->cancelled) { this->error = std::current_exception(); }
+                }
+                std::lock_guard<std::mutex> lock(this->mutex);
+                this->done = true;
+                this->notEmpty.notify_all();
+            }
+
+            /**
+             * Queues a chunk, waits while the queue is full, throws once the stream is closed
+             * to unwind the operation
+             * @param chunk Chunk columns
+             */
+            void push(std::map<std::string, std::vector<unsigned char> > &chunk)
+            {
+                std::unique_lock<std::mutex> lock(this->mutex);
+                this->notFull.wait(lock, [this] { return this->cancelled || (this->chunks.size() < this->capacity); });
+                if (this->cancelled) { throw std::runtime_error("Stream closed"); }
+                this->chunks.emplace_back(std::move(chunk));
+                this->notEmpty.notify_one();
+            }
+    };
+}
+#endif //SRC_PYDGGRID_STREAM_H
@@ -0,0 +1,200 @@
+#ifndef SRC_PYDGGRID_TRANSFORM_H
+#define SRC_PYDGGRID_TRANSFORM_H
+#include <string>
+#include <vector>
+#include <stdexcept>
+#include "Functions.h"
+#include <dglib/DgAddressType.h>
+#include <dglib/DgBoundedIDGG.h>
+#include <dglib/DgGeoSphRF.h>
+#include <dglib/DgIDGGBase.h>
+#include <dglib/DgIDGGutil.h>
+#include <dglib/DgLocation.h>
+
+namespace pydggrid
+{
+    /**
+     * Borrowed columns of input addresses, only the columns of the input address type are set
+     * - GEO: x (longitude), y (latitude)
+     * - Q2DI: quad, i, j
+     * - Q2DD: quad, x, y
+     * - SEQNUM: seqnum
+     */
+    struct TransformInput
+    {
+        size_t size = 0;
+        const long long *quad = nullptr;
+        const long long *i = nullptr;
+        const long long *j = nullptr;
+        const double *x = nullptr;
+        const double *y = nullptr;
+        const unsigned long long *seqnum = nullptr;
+    };
+
+    /**
+     * Columns of output addresses, only the columns of the output address type are filled
+     */
+    struct TransformOutput
+    {
+        std::vector<long long> quad;
+        std::vector<long long> i;
+        std::vector<long long> j;
+        std::vector<double> x;
+        std::vector<double> y;
+        std::vector<unsigned long long> seqnum;
+    };
+
+    /**
+     * Vectorized point transform, converts address columns to the cells of a DGG without
+     * going through the text input and output streams
+     */
+    class Transform
+    {
+        public:
+
+            /**
+             * Default constructor
+             * @param dggRF Grid reference frame
+             * @param degRF Geodetic degrees reference frame of the grid
+             */
+            Transform(const DgIDGGBase &dggRF, const DgGeoSphDegRF &degRF) : idgg(dggRF), deg(degRF) { };
+
+            /**
+             * Converts the input columns to cell addresses
+             * @param inType Input address type (GEO, Q2DI, Q2DD, SEQNUM)
+             * @param input Input columns
+             * @param outType Output address type (GEO, Q2DI, Q2DD, SEQNUM)
+             * @return Output columns
+             */
+            TransformOutput run(dgg::addtype::DgAddressType inType,
+                                const TransformInput &input,
+                                dgg::addtype::DgAddressType outType)
+            {
+                Transform::check(inType, "input");
+                Transform::check(outType, "output");
+                TransformOutput output;
+                Transform::reserve(output, outType, input.size);
+                for (size_t index = 0; index < input.size; index++)
+                {
+                    DgLocation *loc = this->makeLocation(inType, input, index);
+                    this->idgg.convert(loc);
+                    this->write(output, outType, loc);
+                    delete loc;
+                }
+                return output;
+            }
+
+        private:
+            const DgIDGGBase &idgg;
+            const DgGeoSphDegRF &deg;
+
+            /**
+             * Throws if the address type is not supported by the vectorized transform
+             * @param type Address Type
+             * @param label Address role used in the error message
+             */
+            static void check(dgg::addtype::DgAddressType type, const char *label)
+            {
+                using namespace dgg::addtype;
+                if ((type != Geo) && (type != Q2DI) && (type != Q2DD) && (type != SeqNum))
+                {
+                    Functions::throw_error("Unsupported %s address type %s, use GEO, Q2DI, Q2DD or SEQNUM",
+                                           label, dgg::addtype::to_string(type).c_str());
+                }
+            }
+
+            /**
+             * Reserves the output columns of the address type
+             * @param output Output columns
+             * @param type Output address type
+             * @param size Number of points
+             */
+            static void reserve(TransformOutput &output, dgg::addtype::DgAddressType type, size_t size)
+            {
+                using namespace dgg::addtype;
+                if ((type == Q2DI) || (type == Q2DD)) { output.quad.reserve(size); }
+                if (type == Q2DI) { output.i.reserve(size); output.j.reserve(size); }
+                if ((type == Geo) || (type == Q2DD)) { output.x.reserve(size); output.y.reserve(size); }
+                if (type == SeqNum) { output.seqnum.reserve(size); }
+            }
+
+            /**
+             * Builds the location of an input point
+             * @param type Input address type
+             * @param input Input columns
+             * @param index Point index
+             * @return New location, owned by the caller
+             */
+            DgLocation *makeLocation(dgg::addtype::DgAddressType type, const TransformInput &input, size_t index)
+            {
+                using namespace dgg::addtype;
+                switch (type)
+                {
+                    case Geo:
+                        return this->deg.makeLocation(DgDVec2D(input.x[index], input.y[index]));
+                    case Q2DI:
+                        return this->idgg.makeLocation(DgQ2DICoord((int) input.quad[index],
+                                                                  DgIVec2D(input.i[index], input.j[index])));
+                    case Q2DD:
+                        return this->idgg.q2ddRF().makeLocation(DgQ2DDCoord((int) input.quad[index],
+                                                                           DgDVec2D(input.x[index],
+                                                                                    input.y[index])));
+                    default:
+                    {
+                        const DgBoundedIDGG &bounds = this->idgg.bndRF();
+                        unsigned long long first = bounds.zeroBased() ? 0 : 1;
+                        if ((input.seqnum[index] < first) ||
+                            (bounds.validSize() && (input.seqnum[index] - first >= bounds.size())))
+                        {
+                            throw std::out_of_range(Functions::string_format("SEQNUM %llu is out of range",
+                                                                             input.seqnum[index]));
+                        }
+                        return bounds.locFromSeqNum(input.seqnum[index]);
+                    }
+                }
+            }
+
+            /**
+             * Writes a cell location to the output columns
+             * @param output Output columns
+             * @param type Output address type
+             * @param loc Cell location in the grid reference frame, converted in place
+             */
+            void write(TransformOutput &output, dgg::addtype::DgAddressType type, DgLocation *loc)
+            {
+                using namespace dgg::addtype;
+                switch (type)
+                {
+                    case SeqNum:
+                        output.seqnum.emplace_back(this->idgg.bndRF().seqNum(*loc));
+                        break;
+                    case Q2DI:
+                    {
+                        const DgQ2DICoord &address = *this->idgg.getAddress(*loc);
+                        output.quad.emplace_back(address.quadNum());
+                        output.i.emplace_back(address.coord().i());
+                        output.j.emplace_back(address.coord().j());
+                        break;
+                    }
+                    case Q2DD:
+                    {
+                        this->idgg.q2ddRF().convert(loc);
+                        const DgQ2DDCoord &address = *this->idgg.q2ddRF().getAddress(*loc);
+                        output.quad.emplace_back(address.quadNum());
+                        output.x.emplace_back((double) address.coord().x());
+                        output.y.emplace_back((double) address.coord().y());
+                        break;
+                    }
+                    default:
+                    {
+                        this->deg.convert(loc);
+                        const DgDVec2D &address = *this->deg.getAddress(*loc);
+                        output.x.emplace_back((double) address.x());
+                        output.y.emplace_back((double) address.y());
+                        break;
+                    }
+                }
+            }
+    };
+}
+#endif //SRC_PYDGGRID_TRANSFORM_H
@@ -63,6 +63,23 @@ std::vector<unsigned char > DGGrid_ConvertBytes(const pybind11::bytes& bytes)
     return elements;
 }
 
+/**
+ * Requests a contiguous byte view over a python buffer object (bytes, bytearray, memoryview,
+ * numpy uint8 array), the data is borrowed and not copied
+ * @param buffer Pybinds11 Buffer Object
+ * @return Buffer Info
+ */
+pybind11::buffer_info
+PyDGGRID_readBuffer(const pybind11::buffer& buffer)
+{
+    pybind11::buffer_info info = buffer.request();
+    if (info.itemsize != 1)
+        { throw pybind11::value_error("Payload buffer must be a byte buffer (itemsize 1)"); }
+    if ((info.ndim > 1) || ((info.ndim == 1) && (info.strides[0] != 1)))
+        { throw pybind11::value_error("Payload buffer must be one dimensional and contiguous"); }
+    return info;
+}
+
 /**
  * Tests payload pass capability
  * @param dictionary Parameter Dictionary
@@ -116,6 +133,124 @@ std::string UnitTest_RunQuery(const pybind11::dict& dictionary,
     return query.toString();
 }
 
+/**
+ * Query parameter read unit test, buffer protocol payload
+ * @param dictionary Python Parameter Dictionary
+ * @param buffer Payload Buffer
+ * @return Unit test response
+ */
+std::string UnitTest_ReadQueryBuffer(const pybind11::dict& dictionary,
+                                     const pybind11::buffer& buffer)
+{
+    pybind11::buffer_info info = PyDGGRID_readBuffer(buffer);
+    pydggrid::Query query(PyDGGRID_readDictionaryToMap(dictionary),
+                          (const unsigned char *) info.ptr,
+                          (size_t) info.size);
+    return query.toString();
+}
+
+/**
+ * Query run unit test, buffer protocol payload
+ * @param dictionary Python Parameter Dictionary
+ * @param buffer Payload Buffer
+ * @return Unit test response
+ */
+std::string UnitTest_RunQueryBuffer(const pybind11::dict& dictionary,
+                                    const pybind11::buffer& buffer)
+{
+    pybind11::buffer_info info = PyDGGRID_readBuffer(buffer);
+    pydggrid::Query query(PyDGGRID_readDictionaryToMap(dictionary),
+                          (const unsigned char *) info.ptr,
+                          (size_t) info.size);
+    query.run();
+    return query.toString();
+}
+
+/**
+ * Moves a vector into a capsule owned numpy array, the data is not copied
+ * @param values Value Vector
+ * @return numpy array viewing the moved values
+ */
+template<typename T>
+pybind11::array_t<T>
+PyDGGRID_toArray(std::vector<T> &&values)
+{
+    auto *elements = new std::vector<T>(std::move(values));
+    pybind11::capsule owner(elements, [](void *data)
+        { delete reinterpret_cast<std::vector<T> *>(data); });
+    return pybind11::array_t<T>((pybind11::ssize_t) elements->size(),
+                                elements->data(),
+                                owner);
+}
+
+/**
+ * Requests a contiguous one dimensional column of type T, the array is only copied if it is
+ * not already contiguous or of type T
+ * @param columns Column list
+ * @param index Column index
+ * @param size Expected column size, set from the first column when 0
+ * @return Column array
+ */
+template<typename T>
+pybind11::array_t<T, pybind11::array::c_style | pybind11::array::forcecast>
+PyDGGRID_readColumn(const pybind11::sequence &columns, size_t index, size_t &size)
+{
+    if (index >= (size_t) pybind11::len(columns))
+        { throw pybind11::value_error(pydggrid::Functions::string_format("Missing address column %zu", index)); }
+    auto column = pybind11::array_t<T, pybind11::array::c_style | pybind11::array::forcecast>::ensure(columns[index]);
+    if (!column || (column.ndim() != 1))
+        { throw pybind11::value_error("Address columns must be one dimensional numeric arrays"); }
+    if (index == 0) { size = (size_t) column.size(); }
+    if ((size_t) column.size() != size)
+        { throw pybind11::value_error("Address columns must have the same length"); }
+    return column;
+}
+
+/**
+ * Moves the python facing responses out of an executed query, safe to call without the GIL
+ * @param query Executed Query
+ * @return Response Map
+ */
+std::map<std::string, std::vector<unsigned char> >
+PyDGGRID_takeResponse(pydggrid::Query &query)
+{
+    std::map<std::string, std::vector<unsigned char> > response;
+    for (const char *responseCode : {"cells", "points", "collection", "statistics", "meta", "dataset"})
+        { response[responseCode] = query.takeResponse(responseCode); }
+    for (const char *output : {"cells", "points"})
+    {
+        for (const std::string &column : DgOutArrow::columns)
+        {
+            std::string responseCode = std::string(output) + "." + column;
+            if (query.hasResponse(responseCode))
+                { response[responseCode] = query.takeResponse(responseCode.c_str()); }
+        }
+    }
+    for (const char *output : {"neighbors", "children"})
+    {
+        for (const std::string &column : DgOutAdjacency::columns)
+        {
+            std::string responseCode = std::string(output) + "." + column;
+            if (query.hasResponse(responseCode))
+                { response[responseCode] = query.takeResponse(responseCode.c_str()); }
+        }
+    }
+    return response;
+}
+
+/**
+ * Compiles the query response dictionary, requires the GIL
+ * @param response Response Map
+ * @return Response Bytes
+ */
+pybind11::dict PyDGGRID_readResponse(std::map<std::string, std::vector<unsigned char> > &response)
+{
+    pybind11::dict dict;
+    for (auto &responseData : response)
+        { dict[responseData.first.c_str()] = PyDGGRID_toArray(std::move(responseData.second)); }
+    return dict;
+}
+
 /**
  * Runs the query and compiles response bytes
  * @param dictionary Parameter Dictionary
@@ -125,20 +260,358 @@ std::string UnitTest_RunQuery(const pybind11::dict& dictionary,
 pybind11::dict RunQuery(const pybind11::dict& dictionary,
                                     const std::vector<unsigned int>& bytes)
 {
-    pydggrid::Query query(PyDGGRID_readDictionaryToMap(dictionary),
-                          PyDGGRID_readBytesToUCVector(bytes));
-    //
-    query.run();
+    std::map<std::string, std::string> parameters = PyDGGRID_readDictionaryToMap(dictionary);
+    std::vector<unsigned char> payload = PyDGGRID_readBytesToUCVector(bytes);
+    std::map<std::string, std::vector<unsigned char> > response;
+    {
+        pybind11::gil_scoped_release release;
+        pydggrid::Query query(parameters, payload);
+        query.run();
+        response = PyDGGRID_takeResponse(query);
+    }
+    return PyDGGRID_readResponse(response);
+}
+
+/**
+ * Runs the query and compiles response bytes, the payload is read in place from any
+ * buffer protocol object without being copied. The GIL is released while DGGRID runs,
+ * the buffer export held by info keeps the payload alive and unresized meanwhile.
+ * @param dictionary Parameter Dictionary
+ * @param buffer Payload Buffer
+ * @param interrupt Optional writable one byte buffer, the query stops and raises
+ * libpydggrid.Interrupted once its first byte is set from another thread or process
+ * @return Response Bytes
+ */
+pybind11::dict RunQueryBuffer(const pybind11::dict& dictionary,
+                              const pybind11::buffer& buffer,
+                              const pybind11::object& interrupt)
+{
+    pybind11::buffer_info info = PyDGGRID_readBuffer(buffer);
+    pybind11::buffer_info flag;
+    if (!interrupt.is_none())
+    {
+        flag = PyDGGRID_readBuffer(interrupt.cast<pybind11::buffer>());
+        if (flag.size < 1) { throw pybind11::value_error("Interrupt buffer must hold at least one byte"); }
+    }
+    std::map<std::string, std::string> parameters = PyDGGRID_readDictionaryToMap(dictionary);
+    std::map<std::string, std::vector<unsigned char> > response;
+    {
+        pybind11::gil_scoped_release release;
+        pydggrid::Query query(parameters,
+                              (const unsigned char *) info.ptr,
+                              (size_t) info.size);
+        query.interruptWith((const volatile unsigned char *) flag.ptr);
+        query.run();
+        response = PyDGGRID_takeResponse(query);
+    }
+    return PyDGGRID_readResponse(response);
+}
+
+/**
+ * Creates a session, the grid is built with the GIL released
+ * @param dictionary Parameter Dictionary
+ * @return Session Object
+ */
+std::unique_ptr<pydggrid::Session> SessionCreate(const pybind11::dict& dictionary)
+{
+    std::map<std::string, std::string> parameters = PyDGGRID_readDictionaryToMap(dictionary);
+    pybind11::gil_scoped_release release;
+    return std::make_unique<pydggrid::Session>(parameters);
+}
+
+/**
+ * Runs a session on a buffer protocol payload, the GIL is released while DGGRID runs
+ * @param session Session Object
+ * @param buffer Payload Buffer
+ * @return Response Bytes
+ */
+pybind11::dict SessionRun(pydggrid::Session &session, const pybind11::buffer& buffer)
+{
+    pybind11::buffer_info info = PyDGGRID_readBuffer(buffer);
+    std::map<std::string, std::vector<unsigned char> > response;
+    {
+        pybind11::gil_scoped_release release;
+        session.run((const unsigned char *) info.ptr, (size_t) info.size);
+        response = PyDGGRID_takeResponse(session);
+    }
+    return PyDGGRID_readResponse(response);
+}
+
+/**
+ * Transforms address columns with the session grid, the GIL is released while DGGRID runs
+ * @param session Session Object
+ * @param inType Input address type (GEO: lon, lat | Q2DI: quad, i, j | Q2DD: quad, x, y | SEQNUM: seqnum)
+ * @param columns Input address columns
+ * @param outType Output address type (GEO, Q2DI, Q2DD, SEQNUM)
+ * @return Dictionary of typed output columns
+ */
+pybind11::dict SessionTransform(pydggrid::Session &session,
+                                const std::string &inType,
+                                const pybind11::sequence &columns,
+                                const std::string &outType)
+{
+    pydggrid::TransformInput input;
+    std::vector<pybind11::array> arrays; // keeps converted columns alive while the GIL is released
+    if (inType == "GEO")
+    {
+        arrays.emplace_back(PyDGGRID_readColumn<double>(columns, 0, input.size));
+        arrays.emplace_back(PyDGGRID_readColumn<double>(columns, 1, input.size));
+        input.x = (const double *) arrays[0].data();
+        input.y = (const double *) arrays[1].data();
+    }
+    else if ((inType == "Q2DI") || (inType == "Q2DD"))
+    {
+        arrays.emplace_back(PyDGGRID_readColumn<long long>(columns, 0, input.size));
+        input.quad = (const long long *) arrays[0].data();
+        if (inType == "Q2DI")
+        {
+            arrays.emplace_back(PyDGGRID_readColumn<long long>(columns, 1, input.size));
+            arrays.emplace_back(PyDGGRID_readColumn<long long>(columns, 2, input.size));
+            input.i = (const long long *) arrays[1].data();
+            input.j = (const long long *) arrays[2].data();
+        }
+        else
+        {
+            arrays.emplace_back(PyDGGRID_readColumn<double>(columns, 1, input.size));
+            arrays.emplace_back(PyDGGRID_readColumn<double>(columns, 2, input.size));
+            input.x = (const double *) arrays[1].data();
+            input.y = (const double *) arrays[2].data();
+        }
+    }
+    else if (inType == "SEQNUM")
+    {
+        arrays.emplace_back(PyDGGRID_readColumn<unsigned long long>(columns, 0, input.size));
+        input.seqnum = (const unsigned long long *) arrays[0].data();
+    }
+    else
+    {
+        throw pybind11::value_error("Unsupported input address type " + inType + ", use GEO, Q2DI, Q2DD or SEQNUM");
+    }
+    pydggrid::TransformOutput output;
+    {
+        pybind11::gil_scoped_release release;
+        output = session.transform(inType, input, outType);
+    }
+    pybind11::dict dict;
+    if (outType == "GEO")
+    {
+        dict["lon"] = PyDGGRID_toArray(std::move(output.x));
+        dict["lat"] = PyDGGRID_toArray(std::move(output.y));
+    }
+    else if (outType == "SEQNUM")
+    {
+        dict["seqnum"] = PyDGGRID_toArray(std::move(output.seqnum));
+    }
+    else
+    {
+        dict["quad"] = PyDGGRID_toArray(std::move(output.quad));
+        if (outType == "Q2DI")
+        {
+            dict["i"] = PyDGGRID_toArray(std::move(output.i));
+            dict["j"] = PyDGGRID_toArray(std::move(output.j));
+        }
+        else
+        {
+            dict["x"] = PyDGGRID_toArray(std::move(output.x));
+            dict["y"] = PyDGGRID_toArray(std::move(output.y));
+        }
+    }
+    return dict;
+}
+
+/**
+ * Bins point columns with the session grid, the GIL is released while DGGRID runs
+ * @param session Session Object
+ * @param lon Longitude column
+ * @param lat Latitude column
+ * @param values Value column or None
+ * @param classes Class index column or None
+ * @param numClasses Number of presence classes
+ * @param outputAll Output every cell of the grid instead of the occupied cells only
+ * @param sparse Allocate the occupied cells only whatever the bin_coverage
+ * @return Dictionary of typed cell columns
+ */
+pybind11::dict SessionBin(pydggrid::Session &session,
+                          const pybind11::object &lon,
+                          const pybind11::object &lat,
+                          const pybind11::object &values,
+                          const pybind11::object &classes,
+                          size_t numClasses,
+                          bool outputAll,
+                          bool sparse)
+{
+    pydggrid::BinInput input;
+    pybind11::list columns;
+    columns.append(lon);
+    columns.append(lat);
+    if (!values.is_none()) { columns.append(values); }
+    if (!classes.is_none()) { columns.append(classes); }
+    std::vector<pybind11::array> arrays; // keeps converted columns alive while the GIL is released
+    arrays.emplace_back(PyDGGRID_readColumn<double>(columns, 0, input.size));
+    arrays.emplace_back(PyDGGRID_readColumn<double>(columns, 1, input.size));
+    input.x = (const double *) arrays[0].data();
+    input.y = (const double *) arrays[1].data();
+    if (!values.is_none())
+    {
+        arrays.emplace_back(PyDGGRID_readColumn<double>(columns, 2, input.size));
+        input.value = (const double *) arrays.back().data();
+    }
+    if (!classes.is_none())
+    {
+        arrays.emplace_back(PyDGGRID_readColumn<long long>(columns, columns.size() - 1, input.size));
+        input.classes = (const long long *) arrays.back().data();
+    }
+    pydggrid::BinOutput output;
+    {
+        pybind11::gil_scoped_release release;
+        output = session.binPoints(input, numClasses, outputAll, sparse);
+    }
+    pybind11::dict dict;
+    dict["seqnum"] = PyDGGRID_toArray(std::move(output.seqnum));
+    dict["count"] = PyDGGRID_toArray(std::move(output.count));
+    dict["total"] = PyDGGRID_toArray(std::move(output.total));
+    dict["mean"] = PyDGGRID_toArray(std::move(output.mean));
+    if (numClasses > 0)
+    {
+        dict["classes"] = PyDGGRID_toArray(std::move(output.classes));
+        dict["presence"] = PyDGGRID_toArray(std::move(output.presence));
+    }
+    return dict;
+}
+
+/**
+ * Closes a session
+ * @param session Session Object
+ */
+void SessionClose(pydggrid::Session &session)
+{
+    pybind11::gil_scoped_release release;
+    session.close();
+}
+
+/**
+ * Builds the grid of a query and returns its number of cells, the GIL is released meanwhile
+ * @param dictionary Parameter Dictionary
+ * @return Number of cells, 0 if the count overflows
+ */
+unsigned long long GridSize(const pybind11::dict& dictionary)
+{
+    std::map<std::string, std::string> parameters = PyDGGRID_readDictionaryToMap(dictionary);
+    pybind11::gil_scoped_release release;
+    pydggrid::Query query(parameters, nullptr, 0);
+    return query.gridSize();
+}
+
+/**
+ * Starts a streamed query, the payload is copied so the buffer is free once the call returns
+ * @param dictionary Parameter Dictionary
+ * @param buffer Payload Buffer
+ * @param chunkSize Number of cells per chunk
+ * @param capacity Number of chunks buffered ahead of the consumer
+ * @return Stream Object
+ */
+std::unique_ptr<pydggrid::Stream> StreamCreate(const pybind11::dict& dictionary,
+                                               const pybind11::buffer& buffer,
+                                               size_t chunkSize,
+                                               size_t capacity)
+{
+    pybind11::buffer_info info = PyDGGRID_readBuffer(buffer);
+    std::map<std::string, std::string> parameters = PyDGGRID_readDictionaryToMap(dictionary);
+    std::vector<unsigned char> payload((const unsigned char *) info.ptr,
+                                       (const unsigned char *) info.ptr + info.size);
+    pybind11::gil_scoped_release release;
+    return std::make_unique<pydggrid::Stream>(parameters, payload, chunkSize, capacity);
+}
+
+/**
+ * Waits for the next chunk of a streamed query with the GIL released
+ * @param stream Stream Object
+ * @return Chunk column bytes, None once the stream is exhausted
+ */
+pybind11::object StreamNext(pydggrid::Stream &stream)
+{
+    std::map<std::string, std::vector<unsigned char> > chunk;
+    bool available;
+    {
+        pybind11::gil_scoped_release release;
+        available = stream.next(chunk);
+    }
+    if (!available) { return pybind11::none(); }
+    return PyDGGRID_readResponse(chunk);
+}
+
+/**
+ * Closes a streamed query
+ * @param stream Stream Object
+ */
+void StreamClose(pydggrid::Stream &stream)
+{
+    pybind11::gil_scoped_release release;
+    stream.close();
+}
+
+/**
+ * Returns the grid cache counters
+ * @return {hits, misses, size, capacity} dictionary
+ */
+pybind11::dict GridCacheInfo()
+{
+    DgGridCache &cache = DgGridCache::instance();
+    pybind11::dict dict;
+    dict["hits"] = cache.hits();
+    dict["misses"] = cache.misses();
+    dict["size"] = cache.size();
+    dict["capacity"] = cache.capacity();
+    return dict;
+}
+
+/**
+ * Decodes AIGEN response text into ARROW column buffers, the text is read in place and decoded
+ * with the GIL released
+ * @param buffer AIGEN Text Buffer
+ * @return Column buffers, see pydggrid::AIGen
+ */
+pybind11::dict DecodeAIGen(const pybind11::buffer& buffer)
+{
+    pybind11::buffer_info info = PyDGGRID_readBuffer(buffer);
+    std::map<std::string, std::vector<unsigned char> > columns;
+    {
+        pybind11::gil_scoped_release release;
+        columns = pydggrid::AIGen::decode((const char *) info.ptr, (size_t) info.size);
+    }
+    return PyDGGRID_readResponse(columns);
+}
+
+/**
+ * Returns the location free list counters, blocks requested by locations, addresses and data fields and
+ * blocks taken from the system allocator
+ * @return {requests, allocations} dictionary
+ */
+pybind11::dict AllocationInfo()
+{
     pybind11::dict dict;
-    dict["cells"] = query.getResponse("cells");
-    dict["points"] = query.getResponse("points");
-    dict["collection"] = query.getResponse("collection");
-    dict["statistics"] = query.getResponse("statistics");
-    dict["meta"] = query.getResponse("meta");
-    dict["dataset"] = query.getResponse("dataset");
+    dict["requests"] = DgFreeList::requests();
+    dict["allocations"] = DgFreeList::allocations();
     return dict;
 }
 
+/**
+ * Drops every cached grid and resets the cache counters
+ */
+void ClearGridCache()
+{
+    DgGridCache::instance().clear();
+}
+
+/**
+ * Sets the maximum number of grids kept in the cache, 0 disables caching
+ * @param capacity Cache Capacity
+ */
+void SetGridCacheSize(size_t capacity)
+{
+    DgGridCache::instance().setCapacity(capacity);
+}
+
 PYBIND11_MODULE(libpydggrid, m) {
     m.doc() = R"pbdoc(
         Pybind11 example plugin
@@ -153,10 +626,44 @@ PYBIND11_MODULE(libpydggrid, m) {
            subtract
     )pbdoc";
     m.def("add", &add);
+    pybind11::register_exception<DgInterruptedError>(m, "Interrupted");
+    pybind11::register_exception<DgArrowOverflowError>(m, "ArrowOverflow", PyExc_OverflowError);
+    pybind11::register_exception<DgPackedInputError>(m, "PackedInputError", PyExc_ValueError);
+    // Buffer overloads are registered first so bytes-like payloads skip list conversion
+    m.def("RunQuery", &RunQueryBuffer,
+          pybind11::arg("parameters"), pybind11::arg("payload"), pybind11::arg("interrupt") = pybind11::none());
     m.def("RunQuery", &RunQuery);
+    m.def("UnitTest_ReadQuery", &UnitTest_ReadQueryBuffer);
     m.def("UnitTest_ReadQuery", &UnitTest_ReadQuery);
+    m.def("UnitTest_RunQuery", &UnitTest_RunQueryBuffer);
     m.def("UnitTest_RunQuery", &UnitTest_RunQuery);
     m.def("UnitTest_ReadPayload", &UnitTest_ReadPayload);
+    m.def("grid_cache_info", &GridCacheInfo);
+    m.def("clear_grid_cache", &ClearGridCache);
+    m.def("set_grid_cache_size", &SetGridCacheSize, pybind11::arg("capacity"));
+    m.def("grid_size", &GridSize, pybind11::arg("parameters"));
+    m.def("allocation_info", &AllocationInfo);
+    m.def("decode_aigen", &DecodeAIGen, pybind11::arg("data"));
+    pybind11::class_<pydggrid::Session>(m, "Session")
+        .def(pybind11::init(&SessionCreate), pybind11::arg("parameters"))
+        .def("run", &SessionRun, pybind11::arg("payload"))
+        .def("transform", &SessionTransform,
+             pybind11::arg("input_address"), pybind11::arg("columns"), pybind11::arg("output_address"))
+        .def("bin", &SessionBin,
+             pybind11::arg("lon"), pybind11::arg("lat"),
+             pybind11::arg("values") = pybind11::none(), pybind11::arg("classes") = pybind11::none(),
+             pybind11::arg("num_classes") = 0, pybind11::arg("output_all") = false,
+             pybind11::arg("sparse") = false)
+        .def("close", &SessionClose)
+        .def_property_readonly("closed", &pydggrid::Session::isClosed)
+        .def_property_readonly("runs", &pydggrid::Session::getRuns);
+    pybind11::class_<pydggrid::Stream>(m, "Stream")
+        .def(pybind11::init(&StreamCreate),
+             pybind11::arg("parameters"), pybind11::arg("payload"),
+             pybind11::arg("chunk_size"), pybind11::arg("capacity"))
+        .def("next", &StreamNext)
+        .def("close", &StreamClose)
+        .def_property_readonly("closed", &pydggrid::Stream::isClosed);
 
 #ifdef VERSION_INFO
     m.attr("__version__") = MACRO_STRINGIFY(VERSION_INFO);
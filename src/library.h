@@ -2,6 +2,7 @@
 #define LIBPYDGGRID_LIBRARY_H
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
 #include "include/Includes.h"
 
 #endif //LIBPYDGGRID_LIBRARY_H
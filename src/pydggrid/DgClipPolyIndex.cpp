@@ -0,0 +1,164 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgClipPolyIndex.cpp: DgClipPolyIndex class implementation
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+#include "DgClipPolyIndex.h"
+
+const int DgClipPolyIndex::MAX_BUCKETS = 1024;
+
+////////////////////////////////////////////////////////////////////////////////
+ClipperLib::IntRect
+DgClipPolyIndex::bounds (const ClipperLib::Paths& paths)
+{
+   ClipperLib::IntRect box;
+   box.left = box.top = std::numeric_limits<ClipperLib::cInt>::max();
+   box.right = box.bottom = std::numeric_limits<ClipperLib::cInt>::min();
+
+   for (const ClipperLib::Path& path : paths) {
+      for (const ClipperLib::IntPoint& p : path) {
+         box.left = std::min(box.left, p.X);
+         box.right = std::max(box.right, p.X);
+         box.top = std::min(box.top, p.Y);
+         box.bottom = std::max(box.bottom, p.Y);
+      }
+   }
+
+   return box;
+
+} // ClipperLib::IntRect DgClipPolyIndex::bounds
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgClipPolyIndex::insert (const ClipperLib::Paths& poly)
+{
+   boxes_.push_back(bounds(poly));
+
+} // void DgClipPolyIndex::insert
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgClipPolyIndex::clear (void)
+{
+   boxes_.clear();
+   bucketStart_.clear();
+   bucketPolys_.clear();
+   nx_ = ny_ = 0;
+
+} // void DgClipPolyIndex::clear
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgClipPolyIndex::build (void)
+{
+   bucketStart_.clear();
+   bucketPolys_.clear();
+   nx_ = ny_ = 0;
+   if (boxes_.empty()) return;
+
+   extent_ = boxes_[0];
+   for (const ClipperLib::IntRect& b : boxes_) {
+      extent_.left = std::min(extent_.left, b.left);
+      extent_.right = std::max(extent_.right, b.right);
+      extent_.top = std::min(extent_.top, b.top);
+      extent_.bottom = std::max(extent_.bottom, b.bottom);
+   }
+
+   // about one bucket per polygon
+   int n = (int) std::ceil(std::sqrt((double) boxes_.size()));
+   nx_ = ny_ = std::max(1, std::min(n, MAX_BUCKETS));
+   bucketW_ = ((long double) extent_.right - extent_.left + 1) / nx_;
+   bucketH_ = ((long double) extent_.bottom - extent_.top + 1) / ny_;
+
+   // count then fill (CSR layout)
+   bucketStart_.assign(nx_ * ny_ + 1, 0);
+   for (const ClipperLib::IntRect& b : boxes_) {
+      int i0, i1, j0, j1;
+      bucketRange(b, i0, i1, j0, j1);
+      for (int j = j0; j <= j1; j++)
+         for (int i = i0; i <= i1; i++)
+            bucketStart_[j * nx_ + i + 1]++;
+   }
+
+   for (int b = 0; b < nx_ * ny_; b++)
+      bucketStart_[b + 1] += bucketStart_[b];
+
+   bucketPolys_.resize(bucketStart_.back());
+   std::vector<int> next(bucketStart_.begin(), bucketStart_.end() - 1);
+   for (int p = 0; p < (int) boxes_.size(); p++) {
+      int i0, i1, j0, j1;
+      bucketRange(boxes_[p], i0, i1, j0, j1);
+      for (int j = j0; j <= j1; j++)
+         for (int i = i0; i <= i1; i++)
+            bucketPolys_[next[j * nx_ + i]++] = p;
+   }
+
+} // void DgClipPolyIndex::build
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgClipPolyIndex::bucketRange (const ClipperLib::IntRect& box, int& i0,
+                              int& i1, int& j0, int& j1) const
+{
+   i0 = (int) ((box.left - extent_.left) / bucketW_);
+   i1 = (int) ((box.right - extent_.left) / bucketW_);
+   j0 = (int) ((box.top - extent_.top) / bucketH_);
+   j1 = (int) ((box.bottom - extent_.top) / bucketH_);
+
+   i0 = std::max(0, std::min(i0, nx_ - 1));
+   i1 = std::max(0, std::min(i1, nx_ - 1));
+   j0 = std::max(0, std::min(j0, ny_ - 1));
+   j1 = std::max(0, std::min(j1, ny_ - 1));
+
+} // void DgClipPolyIndex::bucketRange
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgClipPolyIndex::query (const ClipperLib::IntRect& box,
+                        std::vector<int>& polys) const
+{
+   polys.clear();
+   if (nx_ == 0 || !overlaps(box, extent_)) return;
+
+   int i0, i1, j0, j1;
+   bucketRange(box, i0, i1, j0, j1);
+   for (int j = j0; j <= j1; j++) {
+      for (int i = i0; i <= i1; i++) {
+         int b = j * nx_ + i;
+         for (int k = bucketStart_[b]; k < bucketStart_[b + 1]; k++) {
+            int p = bucketPolys_[k];
+            if (overlaps(box, boxes_[p])) polys.push_back(p);
+         }
+      }
+   }
+
+   // a polygon spanning several buckets is found once per bucket
+   std::sort(polys.begin(), polys.end());
+   polys.erase(std::unique(polys.begin(), polys.end()), polys.end());
+
+} // void DgClipPolyIndex::query
+
+////////////////////////////////////////////////////////////////////////////////
@@ -0,0 +1,91 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgClipPolyIndex.h: bounding box index over the clipping polygons of a quad
+//
+//   The polygon bounding boxes (in clipper integer space) are bucketed into
+//   a uniform grid of about one bucket per polygon spanning the quad clip
+//   region. A query returns, in ascending order, the polygons whose boxes
+//   overlap the query box, so evalCell only runs clipper against them.
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGCLIPPOLYINDEX_H
+#define DGCLIPPOLYINDEX_H
+
+#include <vector>
+
+#include "clipper.hpp"
+
+////////////////////////////////////////////////////////////////////////////////
+class DgClipPolyIndex {
+
+   public:
+
+      // maximum number of buckets along one axis of the grid
+      static const int MAX_BUCKETS;
+
+      DgClipPolyIndex (void) : nx_ (0), ny_ (0) { }
+
+      // add the next polygon; polygons are numbered in insertion order
+      void insert (const ClipperLib::Paths& poly);
+
+      // bucket the inserted polygons; call after the last insert
+      void build (void);
+
+      // remove all polygons
+      void clear (void);
+
+      // the polygons whose bounding boxes overlap box, in ascending order
+      void query (const ClipperLib::IntRect& box, std::vector<int>& polys) const;
+
+      // the bounding box of a set of paths; top/bottom are the min/max y
+      static ClipperLib::IntRect bounds (const ClipperLib::Paths& paths);
+
+      int size (void) const { return (int) boxes_.size(); }
+
+   private:
+
+      std::vector<ClipperLib::IntRect> boxes_;
+
+      // the extent of the grid
+      ClipperLib::IntRect extent_;
+      int nx_;
+      int ny_;
+      long double bucketW_;
+      long double bucketH_;
+
+      // polygons of bucket b are bucketPolys_[bucketStart_[b]] to
+      // bucketPolys_[bucketStart_[b + 1] - 1]
+      std::vector<int> bucketStart_;
+      std::vector<int> bucketPolys_;
+
+      static bool overlaps (const ClipperLib::IntRect& a,
+                            const ClipperLib::IntRect& b)
+           { return a.left <= b.right && b.left <= a.right &&
+                    a.top <= b.bottom && b.top <= a.bottom; }
+
+      void bucketRange (const ClipperLib::IntRect& box, int& i0, int& i1,
+                        int& j0, int& j1) const;
+};
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
@@ -0,0 +1,162 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgClipPolyRaster.cpp: DgClipPolyRaster class implementation
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#include <algorithm>
+#include <cmath>
+#include <utility>
+
+#include "DgClipPolyIndex.h"
+#include "DgClipPolyRaster.h"
+
+const int DgClipPolyRaster::MAX_BUCKETS = 1024;
+
+////////////////////////////////////////////////////////////////////////////////
+int
+DgClipPolyRaster::column (long double x) const
+{
+   int i = (int) std::floor((x - extent_.left) / bucketW_);
+   return std::max(0, std::min(i, nx_ - 1));
+
+} // int DgClipPolyRaster::column
+
+////////////////////////////////////////////////////////////////////////////////
+int
+DgClipPolyRaster::row (long double y) const
+{
+   int j = (int) std::floor((y - extent_.top) / bucketH_);
+   return std::max(0, std::min(j, ny_ - 1));
+
+} // int DgClipPolyRaster::row
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgClipPolyRaster::build (const ClipperLib::Paths& poly)
+{
+   buckets_.clear();
+   nx_ = ny_ = 0;
+
+   // the edges of every closed path
+   std::vector<std::pair<ClipperLib::IntPoint, ClipperLib::IntPoint> > edges;
+   for (const ClipperLib::Path& path : poly) {
+      for (size_t k = 0; k < path.size(); k++)
+         edges.push_back(std::make_pair(path[k], path[(k + 1) % path.size()]));
+   }
+   if (edges.empty()) return;
+
+   extent_ = DgClipPolyIndex::bounds(poly);
+
+   // about four buckets per edge
+   int n = 2 * (int) std::ceil(std::sqrt((double) edges.size()));
+   nx_ = ny_ = std::max(1, std::min(n, MAX_BUCKETS));
+   bucketW_ = ((long double) extent_.right - extent_.left + 1) / nx_;
+   bucketH_ = ((long double) extent_.bottom - extent_.top + 1) / ny_;
+
+   // mark the boundary buckets and collect the edges of each row
+   buckets_.assign(nx_ * ny_, Outside);
+   std::vector<std::vector<int> > rowEdges(ny_);
+   for (int e = 0; e < (int) edges.size(); e++) {
+      const ClipperLib::IntPoint& p0 = edges[e].first;
+      const ClipperLib::IntPoint& p1 = edges[e].second;
+      int i0 = column(std::min(p0.X, p1.X));
+      int i1 = column(std::max(p0.X, p1.X));
+      int j0 = row(std::min(p0.Y, p1.Y));
+      int j1 = row(std::max(p0.Y, p1.Y));
+      for (int j = j0; j <= j1; j++) {
+         rowEdges[j].push_back(e);
+         for (int i = i0; i <= i1; i++)
+            buckets_[j * nx_ + i] = Boundary;
+      }
+   }
+
+   // label the remaining buckets with the winding number of their centers,
+   // every edge crossing a row's center line is in the row's edge list
+   std::vector<std::pair<long double, int> > crossings;
+   for (int j = 0; j < ny_; j++) {
+      long double y = extent_.top + (j + 0.5L) * bucketH_;
+
+      crossings.clear();
+      for (int e : rowEdges[j]) {
+         const ClipperLib::IntPoint& p0 = edges[e].first;
+         const ClipperLib::IntPoint& p1 = edges[e].second;
+         int dir = 0;
+         if (p0.Y <= y && y < p1.Y) dir = 1;
+         else if (p1.Y <= y && y < p0.Y) dir = -1;
+         if (!dir) continue;
+
+         long double x = p0.X + (y - p0.Y) * (p1.X - p0.X) /
+                                   (long double) (p1.Y - p0.Y);
+         crossings.push_back(std::make_pair(x, dir));
+      }
+      std::sort(crossings.begin(), crossings.end());
+
+      int winding = 0;
+      size_t c = 0;
+      for (int i = 0; i < nx_; i++) {
+         long double x = extent_.left + (i + 0.5L) * bucketW_;
+         while (c < crossings.size() && crossings[c].first < x)
+            winding += crossings[c++].second;
+
+         unsigned char& bucket = buckets_[j * nx_ + i];
+         if (bucket != Boundary) bucket = winding ? Inside : Outside;
+      }
+   }
+
+} // void DgClipPolyRaster::build
+
+////////////////////////////////////////////////////////////////////////////////
+DgClipPolyRaster::DgClipClass
+DgClipPolyRaster::classify (const ClipperLib::IntRect& box) const
+{
+   if (!nx_) return Boundary;
+
+   // disjoint from the polygon bounding box
+   if (box.right < extent_.left || box.left > extent_.right ||
+       box.bottom < extent_.top || box.top > extent_.bottom)
+      return Outside;
+
+   // inside buckets never touch the polygon bounding box, so a box
+   // reaching past it is either outside or crosses the boundary
+   bool beyond = box.left < extent_.left || box.right > extent_.right ||
+                 box.top < extent_.top || box.bottom > extent_.bottom;
+
+   int i0 = column(box.left);
+   int i1 = column(box.right);
+   int j0 = row(box.top);
+   int j1 = row(box.bottom);
+
+   // no boundary bucket in the box means no edge crosses it, so all of
+   // its buckets share one label
+   unsigned char label = buckets_[j0 * nx_ + i0];
+   if (label == Boundary || (beyond && label == Inside)) return Boundary;
+   for (int j = j0; j <= j1; j++) {
+      for (int i = i0; i <= i1; i++) {
+         if (buckets_[j * nx_ + i] != label) return Boundary;
+      }
+   }
+
+   return (DgClipClass) label;
+
+} // DgClipPolyRaster::DgClipClass DgClipPolyRaster::classify
+
+////////////////////////////////////////////////////////////////////////////////
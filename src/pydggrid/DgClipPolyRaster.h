@@ -0,0 +1,76 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgClipPolyRaster.h: coarse interior/exterior raster of a clipping polygon
+//
+//   The bounding box of the polygon (in clipper integer space) is split
+//   into a raster of buckets. Buckets crossed by an edge bounding box are
+//   boundary buckets; the others lie entirely inside or entirely outside
+//   the polygon (nonzero fill) and are labelled by a scanline pass. A cell
+//   whose bounding box only covers inside (or outside) buckets does not
+//   cross the polygon boundary, so it needs no clipper intersection.
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGCLIPPOLYRASTER_H
+#define DGCLIPPOLYRASTER_H
+
+#include <vector>
+
+#include "clipper.hpp"
+
+////////////////////////////////////////////////////////////////////////////////
+class DgClipPolyRaster {
+
+   public:
+
+      enum DgClipClass { Outside = 0, Inside = 1, Boundary = 2 };
+
+      // maximum number of buckets along one axis of the raster
+      static const int MAX_BUCKETS;
+
+      DgClipPolyRaster (void) : nx_ (0), ny_ (0) { }
+
+      // build the raster of the polygon (nonzero fill)
+      void build (const ClipperLib::Paths& poly);
+
+      // classify a cell by its bounding box; Boundary if clipper is needed
+      DgClipClass classify (const ClipperLib::IntRect& box) const;
+
+      bool isBuilt (void) const { return nx_ > 0; }
+
+   private:
+
+      ClipperLib::IntRect extent_;
+      int nx_;
+      int ny_;
+      long double bucketW_;
+      long double bucketH_;
+
+      // DgClipClass of each bucket, row major
+      std::vector<unsigned char> buckets_;
+
+      int column (long double x) const;
+      int row (long double y) const;
+};
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
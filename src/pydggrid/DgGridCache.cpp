@@ -0,0 +1,144 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgGridCache.cpp: DgGridCache class implementation
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#include "DgGridCache.h"
+
+const size_t DgGridCache::DEFAULT_CAPACITY = 8;
+const unsigned long long int DgGridCache::MAX_NETWORK_GROWTH = 256;
+
+////////////////////////////////////////////////////////////////////////////////
+DgGridCache&
+DgGridCache::instance (void)
+{
+   static DgGridCache cache;
+   return cache;
+
+} // DgGridCache& DgGridCache::instance
+
+////////////////////////////////////////////////////////////////////////////////
+std::unique_ptr<DgGridCacheEntry>
+DgGridCache::acquire (const std::string& key)
+{
+   std::lock_guard<std::mutex> lock(mutex_);
+
+   for (auto it = entries_.begin(); it != entries_.end(); it++) {
+      if (it->first == key) {
+         std::unique_ptr<DgGridCacheEntry> entry = std::move(it->second);
+         entries_.erase(it);
+         hits_++;
+         return entry;
+      }
+   }
+
+   misses_++;
+   return nullptr;
+
+} // DgGridCache::acquire
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgGridCache::release (const std::string& key,
+                      std::unique_ptr<DgGridCacheEntry> entry)
+{
+   if (!entry || !entry->net) return;
+
+   // a network that has grown too much is cheaper to rebuild than to keep
+   if (entry->net->size() > entry->baseSize + MAX_NETWORK_GROWTH) return;
+
+   std::lock_guard<std::mutex> lock(mutex_);
+   if (capacity_ == 0) return;
+
+   entries_.emplace_front(key, std::move(entry));
+   evict();
+
+} // void DgGridCache::release
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgGridCache::clear (void)
+{
+   std::lock_guard<std::mutex> lock(mutex_);
+   entries_.clear();
+   hits_ = 0;
+   misses_ = 0;
+
+} // void DgGridCache::clear
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgGridCache::setCapacity (size_t capacity)
+{
+   std::lock_guard<std::mutex> lock(mutex_);
+   capacity_ = capacity;
+   evict();
+
+} // void DgGridCache::setCapacity
+
+////////////////////////////////////////////////////////////////////////////////
+size_t
+DgGridCache::capacity (void)
+{
+   std::lock_guard<std::mutex> lock(mutex_);
+   return capacity_;
+
+} // size_t DgGridCache::capacity
+
+////////////////////////////////////////////////////////////////////////////////
+size_t
+DgGridCache::size (void)
+{
+   std::lock_guard<std::mutex> lock(mutex_);
+   return entries_.size();
+
+} // size_t DgGridCache::size
+
+////////////////////////////////////////////////////////////////////////////////
+unsigned long long int
+DgGridCache::hits (void)
+{
+   std::lock_guard<std::mutex> lock(mutex_);
+   return hits_;
+
+} // unsigned long long int DgGridCache::hits
+
+////////////////////////////////////////////////////////////////////////////////
+unsigned long long int
+DgGridCache::misses (void)
+{
+   std::lock_guard<std::mutex> lock(mutex_);
+   return misses_;
+
+} // unsigned long long int DgGridCache::misses
+
+////////////////////////////////////////////////////////////////////////////////
+// caller holds mutex_
+void
+DgGridCache::evict (void)
+{
+   while (entries_.size() > capacity_) entries_.pop_back();
+
+} // void DgGridCache::evict
+
+////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////
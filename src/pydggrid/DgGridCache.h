@@ -0,0 +1,108 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgGridCache.h: process level LRU cache of constructed DGG systems
+//
+//   A built grid (its DgRFNetwork plus the frames SubOpDGG looks up) is
+//   leased exclusively to one query at a time: acquire() removes the entry
+//   from the cache and release() returns it, so a grid is never shared by
+//   two running queries and needs no locking while in use. Concurrent
+//   queries on the same key simply build their own grid on a miss.
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGGRIDCACHE_H
+#define DGGRIDCACHE_H
+
+#include <list>
+#include <memory>
+#include <mutex>
+#include <string>
+
+#include <dglib/DgRFNetwork.h>
+
+class DgGeoSphRF;
+class DgGeoSphDegRF;
+class DgIDGGSBase;
+
+////////////////////////////////////////////////////////////////////////////////
+struct DgGridCacheEntry {
+
+   DgGridCacheEntry (void)
+      : net (new DgRFNetwork()), pGeoRF (nullptr), pDGGS (nullptr),
+        pDeg (nullptr), pChdDeg (nullptr), baseSize (0) { }
+
+   std::unique_ptr<DgRFNetwork> net;
+   const DgGeoSphRF*    pGeoRF;
+   const DgIDGGSBase*   pDGGS;
+   const DgGeoSphDegRF* pDeg;
+   const DgGeoSphDegRF* pChdDeg;
+
+   // network size right after construction; queries may add frames
+   // (e.g. clipping projections) to a leased network
+   unsigned long long int baseSize;
+};
+
+////////////////////////////////////////////////////////////////////////////////
+class DgGridCache {
+
+   public:
+
+      static const size_t DEFAULT_CAPACITY;
+
+      // frames a leased network may gain before it is dropped on release
+      static const unsigned long long int MAX_NETWORK_GROWTH;
+
+      static DgGridCache& instance (void);
+
+      // lease the most recently used grid for key; nullptr on a miss
+      std::unique_ptr<DgGridCacheEntry> acquire (const std::string& key);
+
+      // return a leased (or newly built) grid to the cache
+      void release (const std::string& key,
+                    std::unique_ptr<DgGridCacheEntry> entry);
+
+      void clear (void);
+
+      void setCapacity (size_t capacity);
+
+      size_t capacity (void);
+      size_t size     (void);
+      unsigned long long int hits   (void);
+      unsigned long long int misses (void);
+
+   private:
+
+      DgGridCache (void) : capacity_ (DEFAULT_CAPACITY), hits_ (0), misses_ (0) { }
+
+      void evict (void);
+
+      std::mutex mutex_;
+      size_t capacity_;
+      unsigned long long int hits_;
+      unsigned long long int misses_;
+
+      // front is most recently used; a key may appear more than once
+      std::list<std::pair<std::string, std::unique_ptr<DgGridCacheEntry> > > entries_;
+};
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
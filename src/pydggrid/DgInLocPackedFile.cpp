@@ -0,0 +1,66 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgInLocPackedFile.cpp: DgInLocPackedFile class implementation
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#include "DgInLocPackedFile.h"
+
+////////////////////////////////////////////////////////////////////////////////
+DgInLocPackedFile::DgInLocPackedFile (const DgRFBase& rfIn,
+                                      const DgPackedPoints& pointsIn,
+                                      const string* fileNameIn,
+                                      DgReportLevel failLevel)
+   : DgInLocStreamFile (rfIn, DgInLocPackedFileEmptyData, nullptr, true,
+                        failLevel),
+     points_ (pointsIn), next_ (0)
+{
+   // the base class would try to read fileNameIn from disk
+   if (fileNameIn) fileName_ = *fileNameIn;
+
+} // DgInLocPackedFile::DgInLocPackedFile
+
+////////////////////////////////////////////////////////////////////////////////
+bool
+DgInLocPackedFile::open (const string* fileNameIn, DgReportLevel failLevel)
+{
+   if (fileNameIn) fileName_ = *fileNameIn;
+   next_ = 0;
+
+   return true;
+
+} // bool DgInLocPackedFile::open
+
+////////////////////////////////////////////////////////////////////////////////
+bool
+DgInLocPackedFile::nextPoint (DgDVec2D& coord, double& value)
+{
+   if (isEOF()) return false;
+
+   coord = DgDVec2D(column(points_.x, next_), column(points_.y, next_));
+   if (points_.value) value = column(points_.value, next_);
+   next_++;
+
+   return true;
+
+} // bool DgInLocPackedFile::nextPoint
+
+////////////////////////////////////////////////////////////////////////////////
@@ -0,0 +1,102 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgInLocPackedFile.h: packed binary point input
+//
+//   Points are read straight from a packed payload of float64 columns
+//   (x, y and an optional value) instead of being formatted as text and
+//   parsed back one line at a time. The columns are borrowed from the query
+//   payload and must stay alive while the file is read.
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGINLOCPACKEDFILE_H
+#define DGINLOCPACKEDFILE_H
+
+#include <cstring>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <dglib/DgDVec2D.h>
+#include <dglib/DgInLocStreamFile.h>
+
+static std::vector<std::string> DgInLocPackedFileEmptyData{};
+
+////////////////////////////////////////////////////////////////////////////////
+// thrown when a packed payload cannot be read with the input RF, unlike a
+// fatal report it leaves the process alive
+struct DgPackedInputError : public std::invalid_argument {
+
+   DgPackedInputError (const std::string& what) : std::invalid_argument(what) { }
+};
+
+////////////////////////////////////////////////////////////////////////////////
+// borrowed float64 columns of a packed point packet; the columns are not
+// required to be aligned
+struct DgPackedPoints {
+
+   DgPackedPoints (void)
+      : size (0), x (nullptr), y (nullptr), value (nullptr) { }
+
+   unsigned long long int size;
+   const unsigned char* x;
+   const unsigned char* y;
+   const unsigned char* value; // nullptr if the packet has no value column
+};
+
+////////////////////////////////////////////////////////////////////////////////
+class DgInLocPackedFile : public DgInLocStreamFile {
+
+   public:
+
+      DgInLocPackedFile (const DgRFBase& rfIn, const DgPackedPoints& pointsIn,
+                         const string* fileNameIn = nullptr,
+                         DgReportLevel failLevel = DgBase::Fatal);
+
+      virtual bool open (const string* fileName = NULL,
+                 DgReportLevel failLevel = DgBase::Fatal);
+
+      virtual void close (void) { }
+
+      virtual bool isEOF (void) { return next_ >= points_.size; }
+
+      bool hasValue (void) const { return points_.value != nullptr; }
+
+      // returns false at EOF; value is left untouched without a value column
+      bool nextPoint (DgDVec2D& coord, double& value);
+
+   private:
+
+      static double column (const unsigned char* col,
+                            unsigned long long int ndx)
+      {
+         double val;
+         memcpy(&val, col + ndx * sizeof(double), sizeof(double));
+         return val;
+      }
+
+      DgPackedPoints points_;
+      unsigned long long int next_;
+};
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
@@ -0,0 +1,91 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgOutAdjacency.cpp: DgOutAdjacency class implementation
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#include <dglib/DgBoundedIDGG.h>
+#include <dglib/DgIDGGBase.h>
+#include <dglib/DgLocVector.h>
+
+#include "DgOutAdjacency.h"
+
+//   seqnum   uint64 sequence numbers of the cells
+//   offsets  int64 offsets into indices, size + 1
+//   indices  uint64 sequence numbers of the adjacent cells
+const std::vector<std::string> DgOutAdjacency::columns = { "seqnum",
+   "offsets", "indices" };
+
+////////////////////////////////////////////////////////////////////////////////
+DgOutAdjacency::DgOutAdjacency (const DgIDGGBase& dgg)
+   : dgg_ (dgg), size_ (0), nIndices_ (0)
+{
+   clear();
+
+} // DgOutAdjacency::DgOutAdjacency
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgOutAdjacency::insert (unsigned long long int seqNum, const DgLocVector& vec)
+{
+   append(buffers_["seqnum"], seqNum);
+
+   std::vector<unsigned char>& indices = buffers_["indices"];
+   for (int i = 0; i < vec.size(); i++) {
+      DgLocation tmpLoc(vec[i]);
+      dgg_.convert(&tmpLoc);
+      append(indices, dgg_.bndRF().seqNum(tmpLoc));
+   }
+
+   nIndices_ += vec.size();
+   append(buffers_["offsets"], nIndices_);
+
+   size_++;
+
+} // void DgOutAdjacency::insert
+
+////////////////////////////////////////////////////////////////////////////////
+std::vector<unsigned char>
+DgOutAdjacency::take (const std::string& column)
+{
+   auto it = buffers_.find(column);
+   if (it == buffers_.end()) return std::vector<unsigned char>();
+
+   std::vector<unsigned char> buf = std::move(it->second);
+   buffers_.erase(it);
+   return buf;
+
+} // std::vector<unsigned char> DgOutAdjacency::take
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgOutAdjacency::clear (void)
+{
+   buffers_.clear();
+   size_ = 0;
+   nIndices_ = 0;
+
+   append(buffers_["offsets"], nIndices_);
+
+} // void DgOutAdjacency::clear
+
+////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////
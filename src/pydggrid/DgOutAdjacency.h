@@ -0,0 +1,83 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgOutAdjacency.h: columnar neighbor/children output
+//
+//   The neighbors or children of each cell are appended as a CSR adjacency
+//   list of sequence numbers: the cell sequence numbers, int64 offsets into
+//   the indices and the uint64 sequence numbers of the adjacent cells. Like
+//   DgOutArrow every column is kept as raw bytes for the query response.
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGOUTADJACENCY_H
+#define DGOUTADJACENCY_H
+
+#include <cstdint>
+#include <cstring>
+#include <map>
+#include <string>
+#include <vector>
+
+class DgIDGGBase;
+class DgLocVector;
+
+////////////////////////////////////////////////////////////////////////////////
+class DgOutAdjacency {
+
+   public:
+
+      // column names, in response order
+      static const std::vector<std::string> columns;
+
+      // dgg: grid of the adjacent cells, the child grid for children
+      DgOutAdjacency (const DgIDGGBase& dgg);
+
+      // the adjacent cells are converted to dgg without modifying vec
+      void insert (unsigned long long int seqNum, const DgLocVector& vec);
+
+      unsigned long long int size (void) const { return size_; }
+
+      // moves a column out of the buffer; empty if unused
+      std::vector<unsigned char> take (const std::string& column);
+
+      // drops all cells
+      void clear (void);
+
+   private:
+
+      template<class T> static void append (std::vector<unsigned char>& buf,
+                                            const T& val)
+      {
+         size_t n = buf.size();
+         buf.resize(n + sizeof(T));
+         memcpy(buf.data() + n, &val, sizeof(T));
+      }
+
+      const DgIDGGBase& dgg_;
+      unsigned long long int size_;
+      int64_t nIndices_;
+
+      std::map<std::string, std::vector<unsigned char> > buffers_;
+};
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
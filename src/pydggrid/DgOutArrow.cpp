@@ -0,0 +1,134 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgOutArrow.cpp: DgOutArrow class implementation
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#include <limits>
+
+#include <dglib/DgCell.h>
+#include <dglib/DgContCartRF.h>
+#include <dglib/DgPolygon.h>
+
+#include "DgOutArrow.h"
+
+//   id            uint64 sequence numbers (seqNumIds)
+//   label_offsets int32 string offsets, size + 1 (!seqNumIds)
+//   label_data    utf-8 label bytes (!seqNumIds)
+//   x, y          float64 cell centers
+//   ring_offsets  int32 vertex offsets, size + 1 (!isPointFile)
+//   vertex_x      float64 closed ring vertices (!isPointFile)
+//   vertex_y      float64 closed ring vertices (!isPointFile)
+const std::vector<std::string> DgOutArrow::columns = { "id", "label_offsets",
+   "label_data", "x", "y", "ring_offsets", "vertex_x", "vertex_y" };
+
+////////////////////////////////////////////////////////////////////////////////
+DgOutArrow::DgOutArrow (const DgContCartRF& rfIn, bool seqNumIds,
+                        bool isPointFile)
+   : rf_ (rfIn), seqNumIds_ (seqNumIds), isPointFile_ (isPointFile),
+     size_ (0), nLabelBytes_ (0), nVertices_ (0)
+{
+   clear();
+
+} // DgOutArrow::DgOutArrow
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgOutArrow::insert (DgCell& cell, unsigned long long int seqNum)
+{
+   rf_.convert(&cell);
+
+   if (seqNumIds_)
+      append(buffers_["id"], seqNum);
+   else {
+      const string& label = cell.label();
+      if (label.size() > (size_t) (std::numeric_limits<int32_t>::max() - nLabelBytes_))
+         throw DgArrowOverflowError(
+                  "DgOutArrow::insert() label data exceeds int32 offsets");
+
+      std::vector<unsigned char>& data = buffers_["label_data"];
+      data.insert(data.end(), label.begin(), label.end());
+      nLabelBytes_ += (int32_t) label.size();
+      append(buffers_["label_offsets"], nLabelBytes_);
+   }
+
+   DgDVec2D ctr = rf_.getVecLocation(cell.node());
+   append(buffers_["x"], (double) ctr.x());
+   append(buffers_["y"], (double) ctr.y());
+
+   if (isPointFile_) {
+      size_++;
+      return;
+   }
+
+   if (cell.hasRegion() && cell.region().size() > 0) {
+      const vector<DgAddressBase*>& v = cell.region().addressVec();
+      if (v.size() + 1 > (size_t) (std::numeric_limits<int32_t>::max() - nVertices_))
+         throw DgArrowOverflowError(
+                  "DgOutArrow::insert() vertex count exceeds int32 offsets");
+
+      std::vector<unsigned char>& vx = buffers_["vertex_x"];
+      std::vector<unsigned char>& vy = buffers_["vertex_y"];
+      for (size_t i = 0; i <= v.size(); i++) {
+         // close the ring by repeating the first vertex
+         DgDVec2D pt = rf_.getVecAddress(*v[i % v.size()]);
+         append(vx, (double) pt.x());
+         append(vy, (double) pt.y());
+      }
+
+      nVertices_ += (int32_t) (v.size() + 1);
+   }
+
+   append(buffers_["ring_offsets"], nVertices_);
+
+   size_++;
+
+} // void DgOutArrow::insert
+
+////////////////////////////////////////////////////////////////////////////////
+std::vector<unsigned char>
+DgOutArrow::take (const std::string& column)
+{
+   auto it = buffers_.find(column);
+   if (it == buffers_.end()) return std::vector<unsigned char>();
+
+   std::vector<unsigned char> buf = std::move(it->second);
+   buffers_.erase(it);
+   return buf;
+
+} // std::vector<unsigned char> DgOutArrow::take
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgOutArrow::clear (void)
+{
+   buffers_.clear();
+   size_ = 0;
+   nLabelBytes_ = 0;
+   nVertices_ = 0;
+
+   if (!seqNumIds_) append(buffers_["label_offsets"], nLabelBytes_);
+   if (!isPointFile_) append(buffers_["ring_offsets"], nVertices_);
+
+} // void DgOutArrow::clear
+
+////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////
@@ -0,0 +1,96 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgOutArrow.h: columnar cell/point output
+//
+//   Cells are appended into GeoArrow compatible column buffers (separated
+//   x/y coordinates plus int32 ring offsets) instead of being formatted as
+//   text. Every column is kept as raw bytes so it can be moved into the query
+//   response and viewed from Python with the matching dtype without a copy.
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGOUTARROW_H
+#define DGOUTARROW_H
+
+#include <cstdint>
+#include <cstring>
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+class DgCell;
+class DgContCartRF;
+
+////////////////////////////////////////////////////////////////////////////////
+// thrown when a column outgrows its int32 offsets, unlike a fatal report it
+// leaves the process alive
+struct DgArrowOverflowError : public std::overflow_error {
+
+   DgArrowOverflowError (const std::string& what) : std::overflow_error(what) { }
+};
+
+////////////////////////////////////////////////////////////////////////////////
+class DgOutArrow {
+
+   public:
+
+      // column names, in response order
+      static const std::vector<std::string> columns;
+
+      // seqNumIds: ids are stored as uint64 "id" instead of label strings
+      // isPointFile: only the cell centers are stored
+      DgOutArrow (const DgContCartRF& rfIn, bool seqNumIds, bool isPointFile);
+
+      // the cell is converted in place to rfIn
+      void insert (DgCell& cell, unsigned long long int seqNum = 0);
+
+      unsigned long long int size (void) const { return size_; }
+
+      // moves a column out of the buffer; empty if unused
+      std::vector<unsigned char> take (const std::string& column);
+
+      // drops all cells, the next cell starts a new chunk
+      void clear (void);
+
+   private:
+
+      template<class T> static void append (std::vector<unsigned char>& buf,
+                                            const T& val)
+      {
+         size_t n = buf.size();
+         buf.resize(n + sizeof(T));
+         memcpy(buf.data() + n, &val, sizeof(T));
+      }
+
+      const DgContCartRF& rf_;
+      bool seqNumIds_;
+      bool isPointFile_;
+      unsigned long long int size_;
+      int32_t nLabelBytes_;
+      int32_t nVertices_;
+
+      std::map<std::string, std::vector<unsigned char> > buffers_;
+};
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
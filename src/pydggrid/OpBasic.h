@@ -27,6 +27,7 @@
 #define OPBASIC_H
 
 #include <map>
+#include <stdexcept>
 #include <vector>
 
 #include <dglib/DgUtil.h>
@@ -37,10 +38,18 @@
 #include "SubOpDGG.h"
 #include "SubOpIn.h"
 #include "SubOpOut.h"
+#include "DgInLocPackedFile.h"
 
 struct SubOpBasic;
 struct SubOpBasicMulti;
 
+////////////////////////////////////////////////////////////////////////////////
+// thrown once an interrupted operation has stopped
+struct DgInterruptedError : public std::runtime_error {
+
+   DgInterruptedError (void) : std::runtime_error("DGGRID operation interrupted") { }
+};
+
 ////////////////////////////////////////////////////////////////////////////////
 struct OpBasic : public DgApOperationPList {
 
@@ -63,7 +72,17 @@ struct OpBasic : public DgApOperationPList {
    std::string metaResponse;
    std::vector<std::vector<std::string> > statisticBlocks{};
    std::map<std::string, std::vector<std::string> > stringStreamData{};
+   std::map<std::string, DgPackedPoints> packedPointData{};
    std::unique_ptr<SubOpBasicMulti> opContainer;
+
+   // interrupt flag set by another thread or process while the operation
+   // runs; the main loops stop once it is non-zero. nullptr if unused
+   const volatile unsigned char* interruptFlag = nullptr;
+
+   bool interrupted (void) const { return interruptFlag && *interruptFlag; }
+
+   void checkInterrupt (void) const
+        { if (interrupted()) throw DgInterruptedError(); }
 };
 
 ////////////////////////////////////////////////////////////////////////////////
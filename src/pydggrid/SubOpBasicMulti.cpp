@@ -89,6 +89,24 @@ SubOpBasicMulti::inStrToPointLoc (const string& inStr) const {
 
 } // DgLocationData* SubOpBasicMulti::inStrToPointLoc
 
+////////////////////////////////////////////////////////////////////////////////
+DgLocationData*
+SubOpBasicMulti::inVecToPointLoc (const DgDVec2D& vec, const double*) const {
+
+   // only coordinate input RF's (GEO) build locations from a vector
+   DgLocation* tmpLoc = op.inOp.pInRF->vecLocation(vec);
+   if (!tmpLoc) {
+      throw DgPackedInputError(
+               "inVecToPointLoc(): packed points require GEO input addresses");
+   }
+
+   DgLocationData* loc = new DgLocationData(*tmpLoc);
+   delete tmpLoc;
+
+   return loc;
+
+} // DgLocationData* SubOpBasicMulti::inVecToPointLoc
+
 /*
 ////////////////////////////////////////////////////////////////////////////////
 DgCell*
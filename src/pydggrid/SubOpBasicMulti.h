@@ -47,6 +47,9 @@ struct SubOpBasicMulti : public SubOpBasic {
    virtual string dataToOutStr (DgDataList* data);
    //virtual DgCell* inStrToPointCell (const string& inStr) const;
    virtual DgLocationData* inStrToPointLoc (const string& inStr) const;
+   // packed point input; val is nullptr if the point has no value
+   virtual DgLocationData* inVecToPointLoc (const DgDVec2D& vec,
+                                            const double* val) const;
 
 };
 
@@ -22,7 +22,10 @@
 //
 ////////////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+#include <climits>
 #include <iostream>
+#include <memory>
 
 #include <dglib/DgBoundedIDGG.h>
 #include <dglib/DgCell.h>
@@ -105,9 +108,8 @@ SubOpBinPts::presVecToString (const bool* presVec, int allClasses,
 void
 SubOpBinPts::outputCell (unsigned long int sNum, const Val& val) const {
 
-      DgLocation* loc = op.dggOp.dgg().bndRF().locFromSeqNum(sNum);
+      unique_ptr<DgLocation> loc(op.dggOp.dgg().bndRF().locFromSeqNum(sNum));
       outputCell(*loc, val);
-      delete loc;
 }
 
 ////////////////////////////////////////////////////////////////////////////////
@@ -172,9 +174,10 @@ SubOpBinPts::initializeOp (void) {
    dgg::util::release(choices);
 */
 
-   // bin_coverage <GLOBAL | PARTIAL>
+   // bin_coverage <GLOBAL | PARTIAL | SPARSE>
    choices.push_back(new string("GLOBAL"));
    choices.push_back(new string("PARTIAL"));
+   choices.push_back(new string("SPARSE"));
    pList().insertParam(new DgStringChoiceParam("bin_coverage", "GLOBAL", &choices));
    dgg::util::release(choices);
 
@@ -234,7 +237,8 @@ SubOpBinPts::setupOp (void) {
    getParamValue(plist, "bin_method", dummy, false);
 */
    getParamValue(pList(), "bin_coverage", dummy, false);
-   wholeEarth = (dummy == "GLOBAL"); // alternative is PARTIAL
+   wholeEarth = (dummy == "GLOBAL"); // alternatives are PARTIAL and SPARSE
+   sparse = (dummy == "SPARSE");
 
    getParamValue(pList(), "output_count", outputCount, false);
    getParamValue(pList(), "output_count_field_name", outputCountFldName,
@@ -308,6 +312,24 @@ SubOpBinPts::inStrToPointLoc (const string& inStr) const {
 
 } // DgLocationData* inStrToPointLoc(const string& inStr) const
 
+////////////////////////////////////////////////////////////////////////////////
+DgLocationData*
+SubOpBinPts::inVecToPointLoc (const DgDVec2D& vec, const double* val) const {
+
+   DgLocationData* loc = SubOpBasicMulti::inVecToPointLoc(vec, val);
+
+   // the value is already a double; without one getVal() reports the
+   // missing field
+   if (useValInput && val) {
+      DgDataList* data = new DgDataList();
+      data->addField(new DgDataFieldDouble(inValFieldName, *val));
+      loc->setDataList(data);
+   }
+
+   return loc;
+
+} // DgLocationData* SubOpBinPts::inVecToPointLoc
+
 
 ////////////////////////////////////////////////////////////////////////////////
 double
@@ -349,6 +371,8 @@ SubOpBinPts::binPtsGlobal (void) {
 
    while (1) {
 
+      if (op.interrupted()) break;
+
       DgLocationData* loc = op.inOp.getNextLoc();
       if (!loc) break; // reached EOF on last input file
 
@@ -447,6 +471,8 @@ SubOpBinPts::binPtsPartial (void)
    dgcout << "determing quad bounds..." << endl;
    while (1) {
 
+      if (op.interrupted()) break;
+
       DgLocationData* loc = op.inOp.getNextLoc();
       if (!loc) break; // reached EOF on last input file
 
@@ -493,6 +519,8 @@ SubOpBinPts::binPtsPartial (void)
    op.inOp.resetInFile(); // start again with first input file
    while (1) {
 
+      if (op.interrupted()) break;
+
       DgLocationData* loc = op.inOp.getNextLoc();
       if (!loc) break; // reached EOF on last input file
 //cout << *loc << endl;
@@ -599,6 +627,180 @@ SubOpBinPts::binPtsPartial (void)
 
 } // void SubOpBinPts::binPtsPartial
 
+////////////////////////////////////////////////////////////////////////////////
+// open-addressing (linear probing) table of the values of the occupied cells,
+// keyed by sequence number; the table owns the presence vectors of the cells
+
+class SparseVals {
+
+   public:
+
+      static const unsigned long long emptyKey = ULLONG_MAX;
+
+      SparseVals (int _numClasses)
+       : numUsed (0), mask (0), numClasses (_numClasses) { resize(1024); }
+
+      // returns the slot of sNum, or -1 if the cell is not occupied
+      long long find (unsigned long long sNum) const {
+
+         unsigned long long ndx = hash(sNum) & mask;
+         while (keys[ndx] != emptyKey) {
+            if (keys[ndx] == sNum) return (long long) ndx;
+            ndx = (ndx + 1) & mask;
+         }
+
+         return -1;
+      }
+
+      // returns the slot of sNum, inserting it with an empty value if the
+      // cell is not occupied
+      unsigned long long insert (unsigned long long sNum) {
+
+         // keep the load factor under 0.7
+         if ((numUsed + 1) * 10 > keys.size() * 7)
+            resize(keys.size() * 2);
+
+         unsigned long long ndx = hash(sNum) & mask;
+         while (keys[ndx] != emptyKey) {
+            if (keys[ndx] == sNum) return ndx;
+            ndx = (ndx + 1) & mask;
+         }
+
+         if (numClasses > 0)
+            presVecs[ndx].reset(new bool[numClasses]()); // all false
+
+         Val& val = vals[ndx];
+         val.nVals = 0;
+         val.total = 0.0;
+         val.mean = 0.0;
+         val.presVec = presVecs[ndx].get();
+
+         keys[ndx] = sNum;
+         numUsed++;
+         return ndx;
+      }
+
+      unsigned long long numUsed;
+      unsigned long long mask;
+      vector<unsigned long long> keys;
+      vector<Val> vals;
+
+   private:
+
+      int numClasses; // presence vector length, 0 for none
+      vector<unique_ptr<bool[]> > presVecs;
+
+      static unsigned long long hash (unsigned long long key) {
+
+         // splitmix64 finalizer; sequence numbers are dense so mix the bits
+         key ^= key >> 30;
+         key *= 0xbf58476d1ce4e5b9ULL;
+         key ^= key >> 27;
+         key *= 0x94d049bb133111ebULL;
+         key ^= key >> 31;
+         return key;
+      }
+
+      void resize (unsigned long long size) {
+
+         vector<unsigned long long> oldKeys(size, emptyKey);
+         vector<Val> oldVals(size);
+         vector<unique_ptr<bool[]> > oldPresVecs(size);
+         oldKeys.swap(keys);
+         oldVals.swap(vals);
+         oldPresVecs.swap(presVecs);
+         mask = size - 1;
+
+         for (unsigned long long i = 0; i < oldKeys.size(); i++) {
+            if (oldKeys[i] == emptyKey) continue;
+
+            unsigned long long ndx = hash(oldKeys[i]) & mask;
+            while (keys[ndx] != emptyKey) ndx = (ndx + 1) & mask;
+            keys[ndx] = oldKeys[i];
+            vals[ndx] = oldVals[i]; // the presVec array moves along
+            presVecs[ndx] = move(oldPresVecs[i]);
+         }
+      }
+};
+
+////////////////////////////////////////////////////////////////////////////////
+void
+SubOpBinPts::binPtsSparse (void)
+{
+   const DgIDGGBase& dgg = op.dggOp.dgg();
+
+   // storage grows with the number of occupied cells, not the grid size
+   SparseVals svals(outputPresVec ? (int) op.inOp.inputFiles.size() : 0);
+
+   // now process the points in each input file
+   if (useValInput)
+      dgcout << "binning point values..." << endl;
+   else
+      dgcout << "binning points..." << endl;
+
+   while (1) {
+
+      if (op.interrupted()) break;
+
+      unique_ptr<DgLocationData> loc(op.inOp.getNextLoc());
+      if (!loc) break; // reached EOF on last input file
+
+      dgg.convert(loc.get());
+      unsigned long long sNum = dgg.bndRF().seqNum(*loc);
+
+      Val& val = svals.vals[svals.insert(sNum)];
+
+      val.nVals++;
+
+      if (useValInput)
+         val.total += getVal(*loc);
+
+      if (outputPresVec)
+         val.presVec[op.inOp.fileNum] = true;
+   }
+
+   dgcout << "occupied cells: " << svals.numUsed << endl;
+
+   ///// calculate the averages /////
+
+   if (useValInput && outputMean) {
+      for (unsigned long long i = 0; i < svals.keys.size(); i++) {
+         if (svals.keys[i] == SparseVals::emptyKey) continue;
+
+         Val& val = svals.vals[i];
+         if (val.nVals > 0) val.mean = (val.total / val.nVals);
+      }
+   }
+
+   ///// output the cells in sequence number order /////
+
+   if (outputAllCells) {
+      Val emptyVal;
+      initVal(emptyVal, false); // don't allocate presVec
+
+      unsigned long int first = (dgg.bndRF().zeroBased()) ? 0 : 1;
+      unsigned long int last = first + dgg.bndRF().size();
+      for (unsigned long int sNum = first; sNum < last; sNum++) {
+         long long ndx = svals.find(sNum);
+         outputCell(sNum, (ndx < 0) ? emptyVal : svals.vals[ndx]);
+      }
+   } else {
+      vector<unsigned long long> order;
+      order.reserve(svals.numUsed);
+      for (unsigned long long i = 0; i < svals.keys.size(); i++) {
+         if (svals.keys[i] != SparseVals::emptyKey)
+            order.push_back(svals.keys[i]);
+      }
+      sort(order.begin(), order.end());
+
+      for (unsigned long long i = 0; i < order.size(); i++)
+         outputCell(order[i], svals.vals[svals.find(order[i])]);
+   }
+
+   // the presence vectors are released with svals, also on a throw
+
+} // void SubOpBinPts::binPtsSparse
+
 ////////////////////////////////////////////////////////////////////////////////
 ////////////////////////////////////////////////////////////////////////////////
 ////////////////////////////////////////////////////////////////////////////////
@@ -636,9 +838,13 @@ SubOpBinPts::executeOp (void)
    const DgIDGGBase& dgg = op.dggOp.dgg();
    dgcout << "Res " << dgg.outputRes() << " " << dgg.gridStats() << endl;
 
-   if (wholeEarth) binPtsGlobal();
+   if (sparse) binPtsSparse();
+   else if (wholeEarth) binPtsGlobal();
    else binPtsPartial();
 
+   // the binning loops stop early once interrupted
+   op.checkInterrupt();
+
    int numFiles = op.inOp.fileNum;
    dgcout << "\nprocessed " << numFiles << " input file"
           << ((numFiles > 1) ? "s." : ".") << endl;
@@ -45,6 +45,7 @@ struct SubOpBinPts : public SubOpBasicMulti {
 
    // the parameters
    bool wholeEarth;
+   bool sparse;           // bin into a hash table of the occupied cells only
    bool outputAllCells;   // or only occupied ones?
    string inValFieldName; // name of input field to take the average of
    string valFmtStr;      // how format values for string output
@@ -72,6 +73,8 @@ struct SubOpBinPts : public SubOpBasicMulti {
 
       // helper methods
       virtual DgLocationData* inStrToPointLoc (const string& inStr) const;
+      virtual DgLocationData* inVecToPointLoc (const DgDVec2D& vec,
+                                               const double* val) const;
       virtual double getVal (DgLocationData& loc) const;
       void initVal (Val& val, bool allocPresVec) const;
       int presVecToString (const bool* presVec, int allClasses,
@@ -79,6 +82,7 @@ struct SubOpBinPts : public SubOpBasicMulti {
 
       void binPtsGlobal (void);
       void binPtsPartial (void);
+      void binPtsSparse (void);
       void outputCell(unsigned long int sNum, const Val& val) const;
       void outputCell(const DgLocation& loc, const Val& val) const;
 };
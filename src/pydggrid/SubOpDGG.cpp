@@ -40,6 +40,9 @@
 #include "OpBasic.h"
 #include "SubOpDGG.h"
 
+#include <iomanip>
+#include <sstream>
+
 using namespace dgg::topo;
 using namespace dgg::addtype;
 
@@ -48,6 +51,8 @@ const int SubOpDGG::MAX_DGG_RES = 35;
 ////////////////////////////////////////////////////////////////////////////////
 SubOpDGG::SubOpDGG (OpBasic& op, bool _activate)
    : SubOpBasic (op, _activate),
+     _grid (new DgGridCacheEntry()), _gridKey (""), _gridCacheable (false),
+     _gridComplete (false),
      dggsType (""), gridTopo (dgg::topo::InvalidTopo),
      gridMetric (dgg::topo::InvalidMetric), aperture (4),
      projType ("ISEA"), res (5), actualRes (5),
@@ -58,6 +63,32 @@ SubOpDGG::SubOpDGG (OpBasic& op, bool _activate)
 {
 }
 
+////////////////////////////////////////////////////////////////////////////////
+SubOpDGG::~SubOpDGG (void)
+{
+   // OpBasic destroys the other sub operations first, so nothing refers
+   // to the network anymore when it goes back into the cache
+   if (_gridCacheable && _gridComplete)
+      DgGridCache::instance().release(_gridKey, std::move(_grid));
+
+} // SubOpDGG::~SubOpDGG
+
+////////////////////////////////////////////////////////////////////////////////
+string
+SubOpDGG::gridKey (void) const
+{
+   ostringstream key;
+   key << setprecision(21)
+       << datum << "|" << earthRadius << "|"
+       << vert0.lonDegs() << "|" << vert0.latDegs() << "|" << azimuthDegs << "|"
+       << projType << "|" << gridTopo << "|" << gridMetric << "|"
+       << aperture << "|" << actualRes << "|"
+       << isMixed43 << "|" << numAp4 << "|" << isSuperfund << "|"
+       << isApSeq << "|" << (isApSeq ? string(apSeq) : string(""));
+   return key.str();
+
+} // string SubOpDGG::gridKey
+
 ////////////////////////////////////////////////////////////////////////////////
 // choose a reference frame based on address type
 // returns whether or not seq nums are used
@@ -576,6 +607,24 @@ SubOpDGG::executeOp (void) {
 
    orientGrid();
 
+   // single placement grids are shared across queries through the grid cache
+   _gridCacheable = (numGrids == 1);
+   if (_gridCacheable) {
+      _gridKey = gridKey();
+      std::unique_ptr<DgGridCacheEntry> cached =
+                     DgGridCache::instance().acquire(_gridKey);
+      if (cached) {
+         _grid = std::move(cached);
+         _pGeoRF  = _grid->pGeoRF;
+         _pDGGS   = _grid->pDGGS;
+         _pDeg    = _grid->pDeg;
+         _pChdDeg = _grid->pChdDeg;
+         _pDGG    = &dggs().idggBase(actualRes);
+         _pChdDgg = &dggs().idggBase(actualRes + 1);
+         return 0;
+      }
+   }
+
    if (curGrid == 1) {
       _pGeoRF = DgGeoSphRF::makeRF(net0(), datum, earthRadius);
    }
@@ -594,6 +643,14 @@ SubOpDGG::executeOp (void) {
    _pDeg = DgGeoSphDegRF::makeRF(geoRF(), _pGeoRF->name() + "Deg");
    _pChdDeg = DgGeoSphDegRF::makeRF(_pChdDgg->geoRF(), _pChdDgg->geoRF().name() + "Deg");
 
+   if (_gridCacheable) {
+      _grid->pGeoRF   = _pGeoRF;
+      _grid->pDGGS    = _pDGGS;
+      _grid->pDeg     = _pDeg;
+      _grid->pChdDeg  = _pChdDeg;
+      _grid->baseSize = net0().size();
+   }
+
    return 0;
 
 } // SubOpDGG::executeOp
@@ -33,6 +33,9 @@
 #include <dglib/DgAddressType.h>
 
 #include "SubOpBasic.h"
+#include "DgGridCache.h"
+
+#include <memory>
 
 class DgRandom;
 struct OpBasic;
@@ -44,8 +47,16 @@ struct SubOpDGG : public SubOpBasic {
 
    SubOpDGG (OpBasic& op, bool activate = true);
 
+   // returns a single placement grid to the grid cache once its query
+   // completed; the grid of a failed or interrupted query is discarded
+  ~SubOpDGG (void);
+
+   // marks the grid as complete (cacheable) or not, set by the query runner
+   // after a successful run
+   void setGridComplete (bool complete) { _gridComplete = complete; }
+
    // DGG access methods
-   DgRFNetwork&         net0   (void) { return _net0; }
+   DgRFNetwork&         net0   (void) { return *_grid->net; }
    const DgGeoSphRF&    geoRF  (void) { return *_pGeoRF; }
    const DgIDGGSBase&   dggs   (void) { return *_pDGGS; }
    const DgIDGGBase&    dgg    (void) { return *_pDGG; }
@@ -70,8 +81,14 @@ struct SubOpDGG : public SubOpBasic {
    void determineRes (void);
    void orientGrid   (void);
 
+   // canonical DGGS parameters identifying the grid in the grid cache
+   string gridKey (void) const;
+
    // the created DGG
-   DgRFNetwork          _net0;
+   std::unique_ptr<DgGridCacheEntry> _grid; // network and frames, possibly cached
+   string _gridKey;
+   bool   _gridCacheable;
+   bool   _gridComplete;
    const DgGeoSphRF*    _pGeoRF;
    const DgIDGGSBase*   _pDGGS;
    const DgIDGGBase*    _pDGG;
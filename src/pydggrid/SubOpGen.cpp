@@ -83,7 +83,7 @@ SubOpGen::SubOpGen (OpBasic& op, bool _activate)
      cellClip (false), useGDAL (false),
      clipAIGen (false), clipGDAL(false), clipShape(false), clipCellRes (0),
      nClipCellDensify (1), nudge (0.001), doPointInPoly (true),
-     doPolyIntersect (false)
+     doPolyIntersect (false), clipHierarchical (false)
 {
    // turn-on/off the available sub operations
    op.mainOp.active = true;
@@ -103,6 +103,9 @@ SubOpGen::initializeOp (void)
    pList().insertParam(new DgBoolParam("clip_using_holes", false));
 #endif
 
+   // clip_hierarchical <TRUE | FALSE>
+   pList().insertParam(new DgBoolParam("clip_hierarchical", false));
+
    // geodetic_densify <long double: decimal degrees> (v >= 0.0)
    pList().insertParam(new DgDoubleParam("geodetic_densify", 0.0, 0.0, 360.0));
 
@@ -225,6 +228,8 @@ SubOpGen::setupOp (void)
    getParamValue(pList(), "clip_using_holes", useHoles, false);
 #endif
 
+   getParamValue(pList(), "clip_hierarchical", clipHierarchical, false);
+
    getParamValue(pList(), "clipper_scale_factor", clipperFactor, false);
    invClipperFactor = 1.0L / clipperFactor;
 
@@ -34,6 +34,8 @@
 #include <ogrsf_frmts.h>
 #endif
 #include "clipper.hpp"
+#include "DgClipPolyIndex.h"
+#include "DgClipPolyRaster.h"
 #include <dglib/DgIVec2D.h>
 #include <dglib/DgProjGnomonicRF.h>
 #include <dglib/DgInShapefileAtt.h>
@@ -70,6 +72,16 @@ struct DgClippingPoly {
       // the exterior polygon(s) for clipper intersection
       ClipperLib::Paths exterior;
 
+      // interior/exterior raster of exterior, built with the quad index
+      DgClipPolyRaster raster;
+
+      // does a hole make part of the exterior interior not clip?
+#ifdef USE_GDAL
+      bool hasHoles (void) const { return !holes.empty(); }
+#else
+      bool hasHoles (void) const { return false; }
+#endif
+
 #ifdef USE_GDAL
       // the holes for gdal containment
       vector<DgClippingHole> holes;
@@ -93,6 +105,7 @@ class DgQuadClipRegion {
      ~DgQuadClipRegion (void) { }
 
       vector<DgClippingPoly>& clpPolys (void) { return clpPolys_; }
+      DgClipPolyIndex& polyIndex (void) { return polyIndex_; }
       vector < set<DgDBFfield> >& polyFields (void) { return polyFields_; }
 
       set<DgIVec2D>& points (void) { return points_; }
@@ -143,6 +156,8 @@ class DgQuadClipRegion {
       vector<DgClippingPoly> clpPolys_; // clipper region intersection with
                                // quad with holes in quad Snyder space
 
+      DgClipPolyIndex polyIndex_; // bounding box index over clpPolys_
+
       vector < set<DgDBFfield> > polyFields_; // shapefile attribute fields
 
       set<DgIVec2D> points_; // points that fall on this quad
@@ -214,6 +229,13 @@ struct SubOpGen : public SubOpBasicMulti {
                   const DgDiscRF2D& grid, DgQuadClipRegion& clipRegion,
                   const DgIVec2D& add2D);
    ClipperLib::Paths intersectPolyWithQuad (const DgPolygon& v, DgQuadClipRegion& clipRegion);
+   ClipperLib::IntRect blockBounds (const DgContCartRF& cc1,
+                  const DgDiscRF2D& grid, const DgIVec2D& lLeft,
+                  const DgIVec2D& uRight);
+   void clipBlocks (const DgIDGGBase& dgg, const DgContCartRF& cc1,
+                  const DgDiscRF2D& grid, DgQuadClipRegion& clipRegion,
+                  const DgIVec2D& lLeft, const DgIVec2D& uRight,
+                  vector<DgIVec2D>& accepted);
    void processOneClipPoly (DgPolygon& polyIn, const DgIDGGBase& dgg,
              DgQuadClipRegion clipRegions[], DgInShapefileAtt* pAttributeFile);
    void createClipRegions (const DgIDGGBase& dgg,
@@ -243,6 +265,7 @@ struct SubOpGen : public SubOpBasicMulti {
    unsigned long int clipperFactor;   // clipper scaling factor
    long double invClipperFactor;      // 1.0L / clipper scaling factor
    bool useHoles;                     // handle holes in clipping polygons
+   bool clipHierarchical;             // clip quads block by block, coarse to fine
    long double geoDens;               // max arc length in radians
 };
 
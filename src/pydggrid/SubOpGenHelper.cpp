@@ -27,6 +27,7 @@
 #include <gdal.h>
 #endif
 
+#include <algorithm>
 #include <iostream>
 #include <set>
 #include <cstdlib>
@@ -175,17 +176,31 @@ SubOpGen::evalCell (const DgIDGGBase& dgg, const DgContCartRF& cc1,
               ClipperLib::IntPoint(clipperFactor * cc1.getAddress((verts)[i])->x(),
                                    clipperFactor * cc1.getAddress((verts)[i])->y());
 
-         for (unsigned int i = 0; i < clipRegion.clpPolys().size(); i++) {
+         // only the polygons whose bounding boxes overlap the cell's
+         const ClipperLib::IntRect cellBox = DgClipPolyIndex::bounds(cellPoly);
+         vector<int> candidates;
+         clipRegion.polyIndex().query(cellBox, candidates);
 
-           ClipperLib::Clipper c;
-           c.AddPaths(cellPoly, ClipperLib::ptSubject, true);
-           c.AddPaths(clipRegion.clpPolys()[i].exterior, ClipperLib::ptClip, true);
+         for (int i : candidates) {
 
-           ClipperLib::Paths solution;
-           c.Execute(ClipperLib::ctIntersection, solution, ClipperLib::pftNonZero,
-                     ClipperLib::pftNonZero);
+           // cells entirely inside or outside skip the clipper intersection
+           DgClipPolyRaster::DgClipClass cellClass =
+                     clipRegion.clpPolys()[i].raster.classify(cellBox);
+           if (cellClass == DgClipPolyRaster::Outside) continue;
 
-           if (solution.size() != 0) {
+           bool intersects = (cellClass == DgClipPolyRaster::Inside);
+           if (!intersects) {
+              ClipperLib::Clipper c;
+              c.AddPaths(cellPoly, ClipperLib::ptSubject, true);
+              c.AddPaths(clipRegion.clpPolys()[i].exterior, ClipperLib::ptClip, true);
+
+              ClipperLib::Paths solution;
+              c.Execute(ClipperLib::ctIntersection, solution, ClipperLib::pftNonZero,
+                        ClipperLib::pftNonZero);
+              intersects = (solution.size() != 0);
+           }
+
+           if (intersects) {
               accepted = true; // a hole may make this false
 #ifdef USE_GDAL
               if (useHoles) {
@@ -385,6 +400,8 @@ SubOpGen::executeOp (void)
       // generate the cells
       for (set<unsigned long int>::iterator i=seqnums.begin();i!=seqnums.end();i++) {
 
+        if (op.interrupted()) break;
+
         DgLocation* loc = static_cast<const DgIDGG&>(dgg).bndRF().locFromSeqNum(*i);
         if (!dgg.bndRF().validLocation(*loc)){
           dgcerr<<"genGrid(): SEQNUM " << (*i)<< " is not a valid location"<<std::endl;
@@ -449,28 +466,44 @@ SubOpGen::executeOp (void)
       {
          unsigned long long int startCell = op.outOp.outFirstSeqNum - 1;
          //unsigned long long int startCell = op.outOp.maxCellsPerFile * (op.outOp.outFirstSeqNum - 1);
-         DgLocation* addLoc = new DgLocation(dgg.bndRF().first());
+         const DgBoundedIDGG& bnd = dgg.bndRF();
+         DgLocation* addLoc = NULL;
          bool more = true;
 
-         // skip cells up to the first desired output file; this needs to be done
-         // with seqNum to address converters
-         while (op.outOp.nCellsTested < startCell)
+         if (bnd.validSize())
          {
-            //op.outOp.nCellsAccepted++;
-            op.outOp.nCellsTested++;
-            outputStatus();
-
-            dgg.bndRF().incrementLocation(*addLoc);
-            if (!dgg.bndRF().validLocation(*addLoc))
+            // seek straight to the first desired cell
+            more = startCell < bnd.size();
+            if (more)
             {
-               more = false;
-               break;
+               addLoc = bnd.locFromSeqNum(startCell + (bnd.zeroBased() ? 0 : 1));
+               op.outOp.nCellsTested = startCell;
+            }
+         }
+         else
+         {
+            // the grid size overflows the seqNum converters; skip cells up
+            // to the first desired cell one at a time
+            addLoc = new DgLocation(bnd.first());
+            while (op.outOp.nCellsTested < startCell && !op.interrupted())
+            {
+               //op.outOp.nCellsAccepted++;
+               op.outOp.nCellsTested++;
+               outputStatus();
+
+               bnd.incrementLocation(*addLoc);
+               if (!bnd.validLocation(*addLoc))
+               {
+                  more = false;
+                  break;
+               }
             }
          }
 
          if (more)
          {
-            while (op.outOp.nCellsTested < op.outOp.outLastSeqNum)
+            while (op.outOp.nCellsTested < op.outOp.outLastSeqNum &&
+                   !op.interrupted())
             {
                op.outOp.nCellsAccepted++;
                op.outOp.nCellsTested++;
@@ -529,7 +562,7 @@ SubOpGen::executeOp (void)
       if (op.mainOp.verbosity > 0)
         dgcout << "\n";
 
-      for (int q = 0; q < 12; q++)
+      for (int q = 0; q < 12 && !op.interrupted(); q++)
       {
          if (overageSet[q].empty() && !clipRegions[q].isQuadUsed())
          {
@@ -566,11 +599,49 @@ SubOpGen::executeOp (void)
             baseTile.setType('P');
             baseTile.depthFirstTraversal(*dggs, dgg, op.dggOp.deg(), 2, &ed);
          }
+         else if (clipHierarchical && clipRegions[q].isQuadUsed() &&
+                  doPolyIntersect && clipRegions[q].points().empty() &&
+                  !op.outOp.buildShapeFileAttributes)
+         {
+            // classify the quad block by block, then output the accepted
+            // cells merged with the overage cells in (i, j) order
+            vector<DgIVec2D> accepted;
+            clipBlocks(dgg, cc1, grid, clipRegions[q], lLeft, uRight, accepted);
+
+            vector<DgIVec2D>::iterator next = accepted.begin();
+            while ((next != accepted.end() || !overageSet[q].empty()) &&
+                   !op.interrupted())
+            {
+               DgIVec2D coord;
+               if (overageSet[q].empty() ||
+                   (next != accepted.end() && *next < *overageSet[q].begin()))
+               {
+                  coord = *next++;
+               }
+               else
+               {
+                  coord = *overageSet[q].begin();
+                  overageSet[q].erase(overageSet[q].begin());
+                  if (next != accepted.end() && *next == coord) next++;
+
+                  if (op.dggOp.gridTopo == Hexagon && !dgg.isClassI())
+                     if ((coord.j() + coord.i()) % 3) continue;
+               }
+
+               outputStatus();
+               op.outOp.nCellsAccepted++;
+
+               DgLocation* addLoc = dgg.makeLocation(DgQ2DICoord(q, coord));
+               op.outOp.outputCellAdd2D(*addLoc);
+               delete addLoc;
+            }
+         }
          else // !isSuperfund
          {
             DgBoundedRF2D b1(grid, DgIVec2D(0, 0), (uRight - lLeft));
             DgIVec2D tCoord = lLeft; // where are we on the grid?
-            while (!overageSet[q].empty() || clipRegions[q].isQuadUsed())
+            while ((!overageSet[q].empty() || clipRegions[q].isQuadUsed()) &&
+                   !op.interrupted())
             {
                DgIVec2D coord = tCoord;
                bool accepted = false;
@@ -672,6 +743,10 @@ SubOpGen::executeOp (void)
       }
 
    } // end if wholeEarth else
+
+   // the generation loops stop early once interrupted
+   op.checkInterrupt();
+
     if (op.mainOp.verbosity > 0)
         dgcout << "\n** grid generation complete **" << endl;
    outputStatus(true);
@@ -691,6 +766,121 @@ SubOpGen::executeOp (void)
 
 } // int SubOpGen::executeOp
 
+////////////////////////////////////////////////////////////////////////////////
+ClipperLib::IntRect
+SubOpGen::blockBounds (const DgContCartRF& cc1, const DgDiscRF2D& grid,
+                       const DgIVec2D& lLeft, const DgIVec2D& uRight)
+//
+// the bounding box, in clipper space, of the cells lLeft to uRight
+//
+{
+   // the cells are lattice translates of the corner cells; the corner
+   // neighbors also cover the second orientation of triangle cells
+   const long long int iCorner[] = { lLeft.i(), uRight.i() };
+   const long long int jCorner[] = { lLeft.j(), uRight.j() };
+   const int step[][2] = { { 0, 0 }, { 1, 0 }, { 0, 1 } };
+
+   ClipperLib::Paths corners(1);
+   for (int ci = 0; ci < 2; ci++) {
+      for (int cj = 0; cj < 2; cj++) {
+         for (int s = 0; s < 3; s++) {
+            DgIVec2D add2D(iCorner[ci] + (ci ? -step[s][0] : step[s][0]),
+                           jCorner[cj] + (cj ? -step[s][1] : step[s][1]));
+
+            DgPolygon verts;
+            grid.setVertices(add2D, verts);
+            cc1.convert(verts);
+
+            for (int i = 0; i < verts.size(); i++)
+               corners[0] <<
+                  ClipperLib::IntPoint(clipperFactor * cc1.getAddress(verts[i])->x(),
+                                       clipperFactor * cc1.getAddress(verts[i])->y());
+         }
+      }
+   }
+
+   return DgClipPolyIndex::bounds(corners);
+
+} // ClipperLib::IntRect SubOpGen::blockBounds
+
+////////////////////////////////////////////////////////////////////////////////
+void
+SubOpGen::clipBlocks (const DgIDGGBase& dgg, const DgContCartRF& cc1,
+               const DgDiscRF2D& grid, DgQuadClipRegion& clipRegion,
+               const DgIVec2D& lLeft, const DgIVec2D& uRight,
+               vector<DgIVec2D>& accepted)
+//
+// coarse-to-fine clipping of the cells lLeft to uRight: blocks outside
+// every clipping polygon are skipped, blocks inside one are accepted
+// without testing their cells, and the others are split in two down to
+// single cells tested by evalCell. accepted is sorted in (i, j) order
+//
+{
+   const bool classIIHex = (op.dggOp.gridTopo == Hexagon && !dgg.isClassI());
+
+   vector<pair<DgIVec2D, DgIVec2D> > blocks(1, make_pair(lLeft, uRight));
+   vector<int> candidates;
+   while (!blocks.empty() && !op.interrupted()) {
+
+      const DgIVec2D ll = blocks.back().first;
+      const DgIVec2D ur = blocks.back().second;
+      blocks.pop_back();
+
+      if (ll == ur) {
+         if (classIIHex && (ll.i() + ll.j()) % 3) continue;
+
+         outputStatus();
+         if (evalCell(dgg, cc1, grid, clipRegion, ll))
+            accepted.push_back(ll);
+
+         continue;
+      }
+
+      const ClipperLib::IntRect box = blockBounds(cc1, grid, ll, ur);
+      clipRegion.polyIndex().query(box, candidates);
+      if (candidates.empty()) continue;
+
+      bool inside = false;
+      for (int i : candidates) {
+         const DgClippingPoly& clipPoly = clipRegion.clpPolys()[i];
+         if (!clipPoly.hasHoles() &&
+             clipPoly.raster.classify(box) == DgClipPolyRaster::Inside) {
+            inside = true;
+            break;
+         }
+      }
+
+      if (inside) {
+         for (long long int i = ll.i(); i <= ur.i(); i++) {
+            for (long long int j = ll.j(); j <= ur.j(); j++) {
+               DgIVec2D add2D(i, j);
+               if (!dgg.bndRF().bnd2D().validAddressPattern(add2D)) continue;
+               if (classIIHex && (i + j) % 3) continue;
+
+               op.outOp.nCellsTested++;
+               accepted.push_back(add2D);
+            }
+         }
+
+         continue;
+      }
+
+      // split the longer side
+      if (ur.i() - ll.i() >= ur.j() - ll.j()) {
+         long long int mid = (ll.i() + ur.i()) / 2;
+         blocks.push_back(make_pair(ll, DgIVec2D(mid, ur.j())));
+         blocks.push_back(make_pair(DgIVec2D(mid + 1, ll.j()), ur));
+      } else {
+         long long int mid = (ll.j() + ur.j()) / 2;
+         blocks.push_back(make_pair(ll, DgIVec2D(ur.i(), mid)));
+         blocks.push_back(make_pair(DgIVec2D(ll.i(), mid + 1), ur));
+      }
+   }
+
+   sort(accepted.begin(), accepted.end());
+
+} // void SubOpGen::clipBlocks
+
 ////////////////////////////////////////////////////////////////////////////////
 //////////////////////////////////////////////////////////////////////////////
 ClipperLib::Paths
@@ -1317,6 +1507,18 @@ SubOpGen::createClipRegions (const DgIDGGBase& dgg,
    } else {
         ::report("genGrid(): Invalid clipping choices.", DgBase::Fatal);
    }
+
+   //// index and rasterize the clipping polygons of each quad ////
+
+   for (int q = 1; q < 11; q++) {
+      clipRegions[q].polyIndex().clear();
+      for (DgClippingPoly& clipPoly : clipRegions[q].clpPolys()) {
+         clipRegions[q].polyIndex().insert(clipPoly.exterior);
+         clipPoly.raster.build(clipPoly.exterior);
+      }
+      clipRegions[q].polyIndex().build();
+   }
+
    //// adjust the bounds for boundary buffers if needed ////
 
    int skipVal = (op.dggOp.aperture == 3) ? 3 : 1;
@@ -26,6 +26,8 @@
 #include <dglib/DgInLocTextFile.h>
 #include <dglib/DgInGdalFile.h>
 
+#include "DgInLocPackedFile.h"
+
 #include "OpBasic.h"
 #include "SubOpBasicMulti.h"
 #include "SubOpIn.h"
@@ -33,7 +35,7 @@
 ////////////////////////////////////////////////////////////////////////////////
 SubOpIn::SubOpIn (OpBasic& op, bool _activate)
    : SubOpBasic (op, _activate),
-     inFile (nullptr), pInRF (nullptr),
+     inFile (nullptr), inPacked (false), pInRF (nullptr),
      inAddType (dgg::addtype::InvalidAddressType), isPointInput (false),
      inSeqNum (false), inputDelimiter (' ')
 {
@@ -197,7 +199,20 @@ SubOpIn::makeNewInFile (const DgRFBase& rfIn, const string* fileNameIn,
            DgBase::DgReportLevel failLevel)
 {
    DgInLocStreamFile* newFile = nullptr;
-   if (pointInputFileType == "TEXT") {
+   inPacked = fileNameIn && op.packedPointData.count(*fileNameIn);
+   if (inPacked) {
+      // packed points are coordinates, only coordinate input RF's (GEO)
+      // build locations from them
+      DgLocation* probe = rfIn.vecLocation(DgDVec2D(0.0, 0.0));
+      if (!probe)
+         throw DgPackedInputError(
+               "SubOpIn::makeNewInFile(): packed points require GEO input addresses");
+      delete probe;
+
+      // packed payloads are read in place whatever the point file type
+      newFile = new DgInLocPackedFile(rfIn, op.packedPointData[*fileNameIn],
+                                      fileNameIn, failLevel);
+   } else if (pointInputFileType == "TEXT") {
      newFile = new DgInLocTextFile(rfIn,
                                    op.stringStreamData[fileNameIn->c_str()],
                                    fileNameIn,
@@ -230,7 +245,17 @@ SubOpIn::getNextLoc (void) {
       return loc;
 
    while (1) {
-      if (pointInputFileType == "TEXT") {
+      if (inPacked) {
+         DgInLocPackedFile* packedFile = static_cast<DgInLocPackedFile*>(inFile);
+         DgDVec2D coord;
+         double val = 0.0;
+         if (packedFile->nextPoint(coord, val)) {
+            // we have an input point
+            loc = op.primarySubOp->inVecToPointLoc(coord,
+                                    (packedFile->hasValue()) ? &val : nullptr);
+            break;
+         }
+      } else if (pointInputFileType == "TEXT") {
          const int maxLine = 2056;
          char buff[maxLine];
          inFile->getline(buff, maxLine);
@@ -64,6 +64,7 @@ struct SubOpIn : public SubOpBasic {
    unsigned int fileNum;    // current file if multiple files
    //DgInLocTextFile* inFile;
    DgInLocStreamFile* inFile;
+   bool inPacked;           // is inFile a packed point file?
    string inTextFileName;
    const DgRFBase* pInRF;   // RF for input addresses
    dgg::addtype::DgAddressType inAddType; // input address form
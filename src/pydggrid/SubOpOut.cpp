@@ -63,6 +63,8 @@
 #include <dglib/DgTriGrid2D.h>
 #include <dglib/DgOutRandPtsText.h>
 #include "DgHexSF.h"
+#include "DgOutArrow.h"
+#include "DgOutAdjacency.h"
 
 #include "OpBasic.h"
 #include "SubOpOut.h"
@@ -245,11 +247,14 @@ SubOpOut::outputCellAdd2D (const DgLocation& add2D, const string* labelIn,
 
    // create the output label
    string label;
-   if (labelIn)
+   unsigned long long int sn = 0;
+   if (labelIn) {
       label = *labelIn;
-   else {
+      if (outSeqNum && (cellArrow || ptArrow))
+         sn = op.dggOp.dgg().bndRF().seqNum(add2D);
+   } else {
       if (outSeqNum) {
-         unsigned long long int sn = op.dggOp.dgg().bndRF().seqNum(add2D);
+         sn = op.dggOp.dgg().bndRF().seqNum(add2D);
          label = dgg::util::to_string(sn);
       } else if (useEnumLbl)
          label = dgg::util::to_string(nCellsAccepted);
@@ -332,6 +337,16 @@ SubOpOut::outputCellAdd2D (const DgLocation& add2D, const string* labelIn,
       *ptOut << cell;
    }
 
+   if (cellArrow)
+      cellArrow->insert(cell, sn);
+
+   if (ptArrow)
+      ptArrow->insert(cell, sn);
+
+   if (arrowSink && ((cellArrow && cellArrow->size() >= arrowChunkSize) ||
+                     (ptArrow && ptArrow->size() >= arrowChunkSize)))
+      flushArrow();
+
    ///// generate random points if applicable ///
    if (doRandPts)
       genRandPts(*dgg.getAddress(add2D), cell.label());
@@ -349,6 +364,9 @@ SubOpOut::outputCellAdd2D (const DgLocation& add2D, const string* labelIn,
       if (nbrOut)
          nbrOut->insert(add2D, neighbors);
 
+      if (nbrArrow)
+         nbrArrow->insert(dgg.bndRF().seqNum(add2D), neighbors);
+
       for (int i = 0; i < neighbors.size(); i++)
          runStats.push(dgg.geoRF().dist(ctrGeo, neighbors[i]));
    }
@@ -362,6 +380,9 @@ SubOpOut::outputCellAdd2D (const DgLocation& add2D, const string* labelIn,
 
       if (chdOut)
          chdOut->insert(add2D, children);
+
+      if (chdArrow)
+         chdArrow->insert(dgg.bndRF().seqNum(add2D), children);
    }
 
    if (collectOut) {
@@ -389,6 +410,7 @@ SubOpOut::SubOpOut (OpBasic& op, bool _activate)
      nCellsTested(0), nCellsAccepted (0),
      dataOut (0), cellOut (0), ptOut (0), collectOut (0), randPtsOut (0),
      cellOutShp (0), ptOutShp (0), prCellOut (0), nbrOut (0), chdOut (0),
+     cellArrow (0), ptArrow (0), nbrArrow (0), chdArrow (0), arrowChunkSize (0),
      concatPtOut (true), useEnumLbl (false),
      nOutputFile (0), nCellsOutputToFile (0)
 { }
@@ -459,7 +481,7 @@ SubOpOut::initializeOp (void)
 
    ////// output parameters //////
 
-   // cell_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | GDAL_COLLECTION>
+   // cell_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | GDAL_COLLECTION | ARROW>
    choices.push_back(new string("NONE"));
    choices.push_back(new string("AIGEN"));
 #ifdef USE_GDAL
@@ -469,12 +491,13 @@ SubOpOut::initializeOp (void)
    choices.push_back(new string("GEOJSON"));
    choices.push_back(new string("SHAPEFILE"));
    choices.push_back(new string("GDAL_COLLECTION"));
+   choices.push_back(new string("ARROW"));
    //choices.push_back(new string("TEXT"));
    def = ((op.mainOp.operation == "GENERATE_GRID") ? "AIGEN" : "NONE");
    pList().insertParam(new DgStringChoiceParam("cell_output_type", def, &choices));
    dgg::util::release(choices);
 
-   // point_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | TEXT | GDAL_COLLECTION>
+   // point_output_type <NONE | AIGEN | GDAL | KML | GEOJSON | SHAPEFILE | TEXT | GDAL_COLLECTION | ARROW>
    choices.push_back(new string("NONE"));
    choices.push_back(new string("AIGEN"));
 #ifdef USE_GDAL
@@ -485,6 +508,7 @@ SubOpOut::initializeOp (void)
    choices.push_back(new string("SHAPEFILE"));
    choices.push_back(new string("TEXT"));
    choices.push_back(new string("GDAL_COLLECTION"));
+   choices.push_back(new string("ARROW"));
    pList().insertParam(new DgStringChoiceParam("point_output_type", "NONE", &choices));
    dgg::util::release(choices);
 
@@ -550,10 +574,11 @@ SubOpOut::initializeOp (void)
 
    ///// PlanetRisk output formats /////
 
-   // neighbor_output_type <NONE | TEXT | GEOJSON_COLLECTION>
+   // neighbor_output_type <NONE | TEXT | GDAL_COLLECTION | ARROW>
    choices.push_back(new string("NONE"));
    choices.push_back(new string("TEXT"));
    choices.push_back(new string("GDAL_COLLECTION"));
+   choices.push_back(new string("ARROW"));
    pList().insertParam(new DgStringChoiceParam("neighbor_output_type", "NONE",
                &choices));
    dgg::util::release(choices);
@@ -561,10 +586,11 @@ SubOpOut::initializeOp (void)
    // neighbor_output_file_name <outputFileName>
    pList().insertParam(new DgStringParam("neighbor_output_file_name", "nbr"));
 
-   // children_output_type <NONE | TEXT | GDAL_COLLECTION>
+   // children_output_type <NONE | TEXT | GDAL_COLLECTION | ARROW>
    choices.push_back(new string("NONE"));
    choices.push_back(new string("TEXT"));
    choices.push_back(new string("GDAL_COLLECTION"));
+   choices.push_back(new string("ARROW"));
    pList().insertParam(new DgStringChoiceParam("children_output_type", "NONE",
                &choices));
    dgg::util::release(choices);
@@ -831,11 +857,66 @@ std::vector<unsigned char> SubOpOut::getDataOut()
     return std::vector<unsigned char>{};
 }
 
+std::vector<unsigned char> SubOpOut::getCellArrow(const string& column)
+{
+    return (this->cellArrow != nullptr) ?
+           this->cellArrow->take(column) : std::vector<unsigned char>{};
+}
+
+std::vector<unsigned char> SubOpOut::getPointArrow(const string& column)
+{
+    return (this->ptArrow != nullptr) ?
+           this->ptArrow->take(column) : std::vector<unsigned char>{};
+}
+
+std::vector<unsigned char> SubOpOut::getNeighborArrow(const string& column)
+{
+    return (this->nbrArrow != nullptr) ?
+           this->nbrArrow->take(column) : std::vector<unsigned char>{};
+}
+
+std::vector<unsigned char> SubOpOut::getChildrenArrow(const string& column)
+{
+    return (this->chdArrow != nullptr) ?
+           this->chdArrow->take(column) : std::vector<unsigned char>{};
+}
+
+////////////////////////////////////////////////////////////////////////////////
+void
+SubOpOut::flushArrow (void)
+{
+   if (!arrowSink) return;
+   if ((!cellArrow || !cellArrow->size()) && (!ptArrow || !ptArrow->size()))
+      return;
+
+   std::map<std::string, std::vector<unsigned char> > chunk;
+   for (const auto& column : DgOutArrow::columns) {
+      if (cellArrow) chunk["cells." + column] = cellArrow->take(column);
+      if (ptArrow) chunk["points." + column] = ptArrow->take(column);
+   }
+
+   // the adjacency lists of the chunk cells go with them
+   for (const auto& column : DgOutAdjacency::columns) {
+      if (nbrArrow) chunk["neighbors." + column] = nbrArrow->take(column);
+      if (chdArrow) chunk["children." + column] = chdArrow->take(column);
+   }
+
+   if (cellArrow) cellArrow->clear();
+   if (ptArrow) ptArrow->clear();
+   if (nbrArrow) nbrArrow->clear();
+   if (chdArrow) chdArrow->clear();
+
+   arrowSink(chunk);
+
+} // void SubOpOut::flushArrow
 
 ////////////////////////////////////////////////////////////////////////////////
 void
 SubOpOut::resetFiles (void) {
 
+   // hand over the cells of a streamed output before its buffers go away
+   flushArrow();
+
    // reset the file names
    dataOutFileName = dataOutFileNameBase;
    cellOutFileName = cellOutFileNameBase;
@@ -856,6 +937,10 @@ SubOpOut::resetFiles (void) {
    delete prCellOut; prCellOut = NULL;
    delete nbrOut; nbrOut = NULL;
    delete chdOut; chdOut = NULL;
+   delete cellArrow; cellArrow = NULL;
+   delete ptArrow; ptArrow = NULL;
+   delete nbrArrow; nbrArrow = NULL;
+   delete chdArrow; chdArrow = NULL;
 
    cellOutShp = NULL; // this is a ptr to cellOut so don't delete
    ptOutShp = NULL; // this is a ptr to ptOut so don't delete
@@ -956,7 +1041,9 @@ SubOpOut::executeOp (void) {
              kmlColor, kmlWidth, kmlName, kmlDescription);
    }
 
-   if (cellOutType == "TEXT") {
+   if (cellOutType == "ARROW") {
+      cellArrow = new DgOutArrow(op.dggOp.deg(), outSeqNum, false);
+   } else if (cellOutType == "TEXT") {
       prCellOut = new DgOutPRCellsFile(op.dggOp.deg(), cellOutFileName, op.mainOp.precision);
    } else if (cellOutType != "GDAL_COLLECTION") {
       cellOut = DgOutLocFile::makeOutLocFile(cellOutType, cellOutFileName,
@@ -972,7 +1059,9 @@ SubOpOut::executeOp (void) {
       }
    }
 
-   if (pointOutType != "GDAL_COLLECTION") {
+   if (pointOutType == "ARROW") {
+      ptArrow = new DgOutArrow(op.dggOp.deg(), outSeqNum, true);
+   } else if (pointOutType != "GDAL_COLLECTION") {
       ptOut = DgOutLocFile::makeOutLocFile(pointOutType,
            ptOutFileName, gdalPointDriver, op.dggOp.deg(), true, op.mainOp.precision,
            DgOutLocFile::Point, shapefileIdLen,
@@ -1008,11 +1097,19 @@ SubOpOut::executeOp (void) {
 
       nbrOut = new DgOutNeighborsFile(neighborsOutFileName, dgg,
              ((outSeqNum || useEnumLbl) ? NULL : pOutRF), "nbr");
+   } else if (neighborsOutType == "ARROW") {
+
+      if (op.dggOp.gridTopo == Triangle)
+         ::report("Neighbors not implemented for Triangle grids", DgBase::Fatal);
+
+      nbrArrow = new DgOutAdjacency(dgg);
    }
 
    if (childrenOutType == "TEXT") {
       chdOut = new DgOutChildrenFile(childrenOutFileName, dgg, op.dggOp.chdDgg(),
                ((outSeqNum || useEnumLbl) ? NULL : pOutRF), pChdOutRF, "chd");
+   } else if (childrenOutType == "ARROW") {
+      chdArrow = new DgOutAdjacency(op.dggOp.chdDgg());
    }
    return 0;
 
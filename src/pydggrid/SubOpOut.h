@@ -25,6 +25,11 @@
 #ifndef SUBOPOUT_H
 #define SUBOPOUT_H
 
+#include <functional>
+#include <map>
+#include <string>
+#include <vector>
+
 #include <dglib/DgGeoSphRF.h>
 #include <dglib/DgInShapefileAtt.h>
 #include <dglib/DgAddressType.h>
@@ -44,6 +49,8 @@ class DgOutPRCellsFile;
 class DgOutPRPtsFile;
 class DgOutNeighborsFile;
 class DgOutChildrenFile;
+class DgOutArrow;
+class DgOutAdjacency;
 class DgRandom;
 class DgDataList;
 
@@ -75,6 +82,13 @@ struct SubOpOut : public SubOpBasic {
    std::vector<unsigned char> getCollection();
    std::vector<unsigned char> getTextOut();
    std::vector<unsigned char> getDataOut();
+   std::vector<unsigned char> getCellArrow(const string& column);
+   std::vector<unsigned char> getPointArrow(const string& column);
+   std::vector<unsigned char> getNeighborArrow(const string& column);
+   std::vector<unsigned char> getChildrenArrow(const string& column);
+
+   // hands the buffered ARROW cells/points to arrowSink, if set
+   void flushArrow (void);
 
    // the parameters
    const DgRFBase* pOutRF;     // RF for output addresses
@@ -140,6 +154,14 @@ struct SubOpOut : public SubOpBasic {
    DgOutPRCellsFile *prCellOut;
    DgOutNeighborsFile *nbrOut;
    DgOutChildrenFile *chdOut;
+   DgOutArrow *cellArrow, *ptArrow;
+   DgOutAdjacency *nbrArrow, *chdArrow;
+
+   // streaming ARROW output; when set, every arrowChunkSize cells the
+   // "cells.<column>"/"points.<column>" buffers are passed to arrowSink
+   // instead of being kept until the end of the run
+   std::function<void (std::map<std::string, std::vector<unsigned char> >&)> arrowSink;
+   unsigned long long int arrowChunkSize;
 
    bool concatPtOut;
    char formatStr[50];
@@ -27,6 +27,8 @@
 
 #include <iostream>
 
+#include "dglib/DgFreeList.h"
+
 using namespace std;
 
 class DgDistanceBase;
@@ -36,6 +38,8 @@ class DgAddressBase {
 
    public:
 
+      DG_FREELIST_OPERATORS
+
       virtual ~DgAddressBase (void);
 
    protected:
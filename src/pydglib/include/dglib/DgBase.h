@@ -25,7 +25,9 @@
 #ifndef DGBASE_H
 #define DGBASE_H
 
+#include <atomic>
 #include <iostream>
+#include <mutex>
 #include <string>
 
 using namespace std;
@@ -67,7 +69,7 @@ class DgBase {
    private:
 
       static const string defaultName;
-      static DgReportLevel minReportLevel_;
+      static atomic<DgReportLevel> minReportLevel_;
 
    public:
 
@@ -78,6 +80,9 @@ class DgBase {
 
       static DgReportLevel minReportLevel (void) { return minReportLevel_; }
 
+      // serializes dgcout/dgcerr reporting across threads running queries
+      static mutex& reportMutex (void);
+
       static bool testArgEqual (int argc, int expected,
                      const string& message = string("invalid argument count"),
                      DgReportLevel level = Fatal);
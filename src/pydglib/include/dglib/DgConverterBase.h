@@ -25,6 +25,7 @@
 #ifndef DGCONVERTERBASE_H
 #define DGCONVERTERBASE_H
 
+#include <atomic>
 #include <vector>
 
 using namespace std;
@@ -67,7 +68,7 @@ class DgConverterBase {
       virtual DgAddressBase* createConvertedAddress
                               (const DgAddressBase& addIn) const = 0;
 
-      static bool isTraceOn_;
+      static atomic<bool> isTraceOn_;
       static ostream* traceStream_;
 
       DgRFBase* fromFrame_;
@@ -27,6 +27,8 @@
 
 #include <iostream>
 
+#include "dglib/DgFreeList.h"
+
 using namespace std;
 
 class DgDistanceBase;
@@ -57,6 +59,8 @@ class DgDataFieldBase {
 
    public:
 
+      DG_FREELIST_OPERATORS
+
       DgDataFieldBase (string _name, DgDataType _fieldType = FIELD_DOUBLE)
          : name_ (_name), fieldType_ (_fieldType)
       { }
@@ -30,12 +30,15 @@
 #include <unordered_map>
 
 #include "dglib/DgDataFieldBase.h"
+#include "dglib/DgFreeList.h"
 
 ////////////////////////////////////////////////////////////////////////////////
 class DgDataList {
 
    public:
 
+      DG_FREELIST_OPERATORS
+
       DgDataList (void) {}
 
       virtual ~DgDataList (void);
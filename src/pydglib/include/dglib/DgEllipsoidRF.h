@@ -527,8 +527,8 @@ void sphTriInit(SphTri *tri); /* initialize with UNDEFVAL values */
 
 void planeTriInit(PlaneTri *tri); /* initialize with UNDEFVAL values */
 
-/* solve for three sides,three angles and area */
-void sphTriSolve(SphTri *tri);
+/* solve for three sides,three angles and area on a sphere of the given radius */
+void sphTriSolve(SphTri *tri, long double earthRadiusKM = DEFAULT_RADIUS_KM);
 
 /* calculate the center point of a sphere triangle */
 GeoCoord sphTricenpoint(GeoCoord sp[3]);
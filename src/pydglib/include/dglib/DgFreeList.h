@@ -0,0 +1,68 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgFreeList.h: DgFreeList class definitions
+//
+//   Per-thread free lists of small fixed-size blocks. Locations, addresses
+//   and data fields are created and deleted once per processed point or
+//   cell; their classes allocate through DgFreeList so the blocks released
+//   by one iteration are reused by the next instead of going back to the
+//   system allocator.
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGFREELIST_H
+#define DGFREELIST_H
+
+#include <cstddef>
+
+////////////////////////////////////////////////////////////////////////////////
+class DgFreeList {
+
+   public:
+
+      // blocks are rounded up to blockAlign; larger requests and blocks
+      // beyond maxFreeBlocks per size go straight to the system allocator
+      static const size_t blockAlign = 16;
+      static const size_t maxBlockSize = 256;
+      static const size_t maxFreeBlocks = 4096;
+
+      static void* allocate (size_t size);
+
+      static void release (void* ptr, size_t size);
+
+      // process wide counters: blocks requested, and blocks that had to be
+      // taken from the system allocator
+      static unsigned long long int requests (void);
+      static unsigned long long int allocations (void);
+
+};
+
+////////////////////////////////////////////////////////////////////////////////
+// class-specific operators of the recycled classes
+#define DG_FREELIST_OPERATORS \
+      static void* operator new (size_t size) \
+               { return DgFreeList::allocate(size); } \
+      static void operator delete (void* ptr, size_t size) \
+               { DgFreeList::release(ptr, size); }
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
@@ -44,7 +44,13 @@ class DgGeoSphRF : public DgEllipsoidRF {
          { return new DgGeoSphRF (networkIn, nameIn, earthRadiusKMin); }
 
       DgGeoSphRF& operator= (const DgGeoSphRF& rf)
-         { DgEllipsoidRF::operator=(rf); return *this; }
+         {
+            DgEllipsoidRF::operator=(rf);
+            earthRadiusKM_ = rf.earthRadiusKM_;
+            icosaEdgeKM_ = rf.icosaEdgeKM_;
+            totalAreaKM_ = rf.totalAreaKM_;
+            return *this;
+         }
 
       // distance between locations in radians
       virtual long double gcDist (const DgLocation& loc1, const DgLocation& loc2) const
@@ -64,11 +70,11 @@ class DgGeoSphRF : public DgEllipsoidRF {
       virtual long double dist (const DgGeoCoord& add1, const DgGeoCoord& add2) const
          { return earthRadiusKM() * DgGeoCoord::gcDist(add1, add2); }
 
-      static long double earthRadiusKM (void) { return earthRadiusKM_; }
-      static long double icosaEdgeKM   (void) { return icosaEdgeKM_; }
-      static long double icosaEdgeDegs (void) { return icosaEdgeDegs_; }
-      static long double icosaEdgeRads (void) { return icosaEdgeRads_; }
-      static long double totalAreaKM   (void) { return totalAreaKM_; }
+      long double earthRadiusKM (void) const { return earthRadiusKM_; }
+      long double icosaEdgeKM   (void) const { return icosaEdgeKM_; }
+      static long double icosaEdgeDegs (void) { return M_ATAN2 * M_180_PI; }
+      static long double icosaEdgeRads (void) { return M_ATAN2; }
+      long double totalAreaKM   (void) const { return totalAreaKM_; }
 
       // midpoint of great circle connecting two points
       static DgGeoCoord midPoint(const DgGeoCoord& p1, const DgGeoCoord& p2);
@@ -96,25 +102,23 @@ class DgGeoSphRF : public DgEllipsoidRF {
       DgGeoSphRF (DgRFNetwork& networkIn, const string& nameIn = "GeodeticSph",
                   long double earthRadiusKMin = DEFAULT_RADIUS_KM)
          : DgEllipsoidRF (networkIn, nameIn, earthRadiusKMin * 1000L,
-                earthRadiusKMin * 1000L)
-           {
-              earthRadiusKM_ = earthRadiusKMin;
-              icosaEdgeRads_ = M_ATAN2;
-              icosaEdgeDegs_ = icosaEdgeRads_ * M_180_PI;
-              icosaEdgeKM_ = icosaEdgeRads_ * earthRadiusKM_;
-              totalAreaKM_ = 4.0L * M_PI * earthRadiusKM_ * earthRadiusKM_;
-           }
+                earthRadiusKMin * 1000L),
+           earthRadiusKM_ (earthRadiusKMin),
+           icosaEdgeKM_ (M_ATAN2 * earthRadiusKMin),
+           totalAreaKM_ (4.0L * M_PI * earthRadiusKMin * earthRadiusKMin)
+           { }
 
       DgGeoSphRF (const DgGeoSphRF& rf)
-         : DgEllipsoidRF(rf) { /* earthRadius_ = rf.earthRadius(); */ }
+         : DgEllipsoidRF(rf), earthRadiusKM_ (rf.earthRadiusKM_),
+           icosaEdgeKM_ (rf.icosaEdgeKM_), totalAreaKM_ (rf.totalAreaKM_) { }
 
    private:
 
-      static long double earthRadiusKM_;  // earth radius in km
-      static long double icosaEdgeKM_;    // spherical icosahedron edge length
-      static long double icosaEdgeDegs_;  // spherical icosahedron edge length
-      static long double icosaEdgeRads_;  // spherical icosahedron edge length
-      static long double totalAreaKM_;    // spherical icosahedron edge length
+      // per datum, grids built with different radii may coexist (grid cache)
+      // and be built or read concurrently by GIL free queries
+      long double earthRadiusKM_;  // earth radius in km
+      long double icosaEdgeKM_;    // spherical icosahedron edge length
+      long double totalAreaKM_;    // spherical surface area
 };
 
 ////////////////////////////////////////////////////////////////////////////////
@@ -28,6 +28,8 @@
 #include <iostream>
 #include <string>
 
+#include "dglib/DgFreeList.h"
+
 using namespace std;
 
 class DgRFBase;
@@ -37,6 +39,8 @@ class DgLocBase {
 
    public:
 
+      DG_FREELIST_OPERATORS
+
       virtual ~DgLocBase (void);
 
       const DgRFBase& rf (void) const { return *rf_; }
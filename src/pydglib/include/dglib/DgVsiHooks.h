@@ -0,0 +1,100 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgVsiHooks.h: shapelib I/O hooks routed through the GDAL virtual file
+//               system, so shapefiles can be read from and written to
+//               /vsimem/ buffers as well as regular files
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#ifndef DGVSIHOOKS_H
+#define DGVSIHOOKS_H
+
+#include "shapelib/shapefil.h"
+
+#ifdef USE_GDAL
+#include <cpl_conv.h>
+#include <cpl_error.h>
+#include <cpl_vsi.h>
+#endif
+
+namespace dgg { namespace vsi {
+
+#ifdef USE_GDAL
+
+////////////////////////////////////////////////////////////////////////////////
+inline SAFile fOpen (const char* fileName, const char* access)
+{ return (SAFile) VSIFOpenL(fileName, access); }
+
+inline SAOffset fRead (void* p, SAOffset size, SAOffset nmemb, SAFile file)
+{ return (SAOffset) VSIFReadL(p, (size_t) size, (size_t) nmemb, (VSILFILE*) file); }
+
+inline SAOffset fWrite (void* p, SAOffset size, SAOffset nmemb, SAFile file)
+{ return (SAOffset) VSIFWriteL(p, (size_t) size, (size_t) nmemb, (VSILFILE*) file); }
+
+inline SAOffset fSeek (SAFile file, SAOffset offset, int whence)
+{ return (SAOffset) VSIFSeekL((VSILFILE*) file, (vsi_l_offset) offset, whence); }
+
+inline SAOffset fTell (SAFile file)
+{ return (SAOffset) VSIFTellL((VSILFILE*) file); }
+
+inline int fFlush (SAFile file) { return VSIFFlushL((VSILFILE*) file); }
+
+inline int fClose (SAFile file) { return VSIFCloseL((VSILFILE*) file); }
+
+inline int fRemove (const char* fileName) { return VSIUnlink(fileName); }
+
+inline void error (const char* message) { CPLError(CE_Failure, CPLE_FileIO, "%s", message); }
+
+inline double toFloat (const char* str) { return CPLAtof(str); }
+
+#endif
+
+////////////////////////////////////////////////////////////////////////////////
+// returns the hooks to pass to the shapelib *LL open/create functions
+inline SAHooks* hooks (void)
+{
+   static SAHooks hooks_ = [] {
+      SAHooks h;
+      SASetupDefaultHooks(&h);
+#ifdef USE_GDAL
+      h.FOpen  = fOpen;
+      h.FRead  = fRead;
+      h.FWrite = fWrite;
+      h.FSeek  = fSeek;
+      h.FTell  = fTell;
+      h.FFlush = fFlush;
+      h.FClose = fClose;
+      h.Remove = fRemove;
+      h.Error  = error;
+      h.Atof   = toFloat;
+#endif
+      return h;
+   }();
+
+   return &hooks_;
+
+} // SAHooks* hooks
+
+}} // namespace dgg::vsi
+
+////////////////////////////////////////////////////////////////////////////////
+
+#endif
@@ -29,7 +29,16 @@
 ////////////////////////////////////////////////////////////////////////////////
 
 const string DgBase::defaultName = "UNDEFNAME";
-DgBase::DgReportLevel DgBase::minReportLevel_ = DgBase::Info;
+atomic<DgBase::DgReportLevel> DgBase::minReportLevel_(DgBase::Info);
+
+////////////////////////////////////////////////////////////////////////////////
+mutex&
+DgBase::reportMutex (void)
+{
+   static mutex reportMutex_;
+   return reportMutex_;
+
+} // mutex& DgBase::reportMutex
 
 ////////////////////////////////////////////////////////////////////////////////
 ////////////////////////////////////////////////////////////////////////////////
@@ -46,6 +55,8 @@ void report (const string& message, DgBase::DgReportLevel level)
 {
    if (level < DgBase::minReportLevel()) return;
 
+   lock_guard<mutex> lock(DgBase::reportMutex());
+
    switch (level)
    {
       case DgBase::Debug0:
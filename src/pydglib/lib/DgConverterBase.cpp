@@ -27,9 +27,9 @@
 #include "dglib/DgConverterBase.h"
 
 #if DGDEBUG
-bool DgConverterBase::isTraceOn_ = true;
+atomic<bool> DgConverterBase::isTraceOn_(true);
 #else
-bool DgConverterBase::isTraceOn_ = false;
+atomic<bool> DgConverterBase::isTraceOn_(false);
 #endif
 
 ostream* DgConverterBase::traceStream_ = &dgcout;
@@ -143,16 +143,16 @@ DgDmdIDGG::initialize (void)
 
    gridStats_.setPrecision(precision());
 
-   long double tmpLen = DgGeoSphRF::icosaEdgeKM();
+   long double tmpLen = geoRF().icosaEdgeKM();
 ////// NEEDS UPDATING
    gridStats_.setCellDistKM(tmpLen / pow(sqrt((long double) aperture()), res()));
 
       // a = globeArea / (#cells - 2);
-      gridStats_.setCellAreaKM(DgGeoSphRF::totalAreaKM() / gridStats_.nCells());
+      gridStats_.setCellAreaKM(geoRF().totalAreaKM() / gridStats_.nCells());
 
-   gridStats_.setCLS(2.0L * 2.0L * DgGeoSphRF::earthRadiusKM() *
+   gridStats_.setCLS(2.0L * 2.0L * geoRF().earthRadiusKM() *
                      asinl(sqrt(gridStats_.cellAreaKM() / M_PI) /
-                     (2.0L * DgGeoSphRF::earthRadiusKM())));
+                     (2.0L * geoRF().earthRadiusKM())));
 
 } // DgDmdIDGG::initialize
 
@@ -459,16 +459,16 @@ long double vecDot(const Vec3D &A, const Vec3D &B)
 } /*  long double vecDot */
 
 /******************************************************************************/
-long double sqrMetersToExcessD(long double area) {
-  return area * 360.0L /
-         (4.0L * M_PI * DgGeoSphRF::earthRadiusKM() *
-          DgGeoSphRF::earthRadiusKM());
+long double sqrMetersToExcessD(long double area,
+                               long double earthRadiusKM = DEFAULT_RADIUS_KM) {
+  return area * 360.0L / (4.0L * M_PI * earthRadiusKM * earthRadiusKM);
 
 } /* long double metersToExcessD */
 
 /******************************************************************************/
-long double metersToGCDegrees(long double meters) {
-  long double earthCircum = (2.0L * M_PI * DgGeoSphRF::earthRadiusKM());
+long double metersToGCDegrees(long double meters,
+                              long double earthRadiusKM = DEFAULT_RADIUS_KM) {
+  long double earthCircum = (2.0L * M_PI * earthRadiusKM);
   return meters * 360.0L / earthCircum;
 
 } /* long double metersToGCDegrees */
@@ -615,7 +615,7 @@ long double spheredist(const GeoCoord &ll1, const GeoCoord &ll2)
 } /* long double spheredist */
 
 /******************************************************************************/
-void sphTriSolve(SphTri *tri)
+void sphTriSolve(SphTri *tri, long double earthRadiusKM)
 /*
    Input:  three vertices's lat and lon in radius.
    Output: three edges, three angles, area.
@@ -651,14 +651,14 @@ void sphTriSolve(SphTri *tri)
       acosl((cosl(tri->edges[2]) - cosl(tri->edges[0]) * cosl(tri->edges[1])) /
             (sinl(tri->edges[0]) * sinl(tri->edges[1])));
   for (i = 0; i < 3; i++)
-    tri->edges[i] = tri->edges[i] * DgGeoSphRF::earthRadiusKM();
+    tri->edges[i] = tri->edges[i] * earthRadiusKM;
   if (tri->edges[0] < mindist) {
     p = (tri->edges[0] + tri->edges[1] + tri->edges[2]) / 2;
     tri->area = sqrtl(p * (p - tri->edges[0]) * (p - tri->edges[1]) *
                       (p - tri->edges[2]));
   } else
     tri->area = (tri->angles[0] + tri->angles[1] + tri->angles[2] - M_PI) *
-                DgGeoSphRF::earthRadiusKM() * DgGeoSphRF::earthRadiusKM();
+                earthRadiusKM * earthRadiusKM;
 
 } /* void sphTriSolve(SphTri* tri) */
 
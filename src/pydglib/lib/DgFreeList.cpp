@@ -0,0 +1,135 @@
+/*******************************************************************************
+    Copyright (C) 2023 Kevin Sahr
+
+    This file is part of DGGRID.
+
+    DGGRID is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    DGGRID is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*******************************************************************************/
+////////////////////////////////////////////////////////////////////////////////
+//
+// DgFreeList.cpp: DgFreeList class implementation
+//
+////////////////////////////////////////////////////////////////////////////////
+
+#include <atomic>
+#include <new>
+
+#include "dglib/DgFreeList.h"
+
+namespace {
+
+   const size_t numSizes = DgFreeList::maxBlockSize / DgFreeList::blockAlign;
+
+   struct FreeBlock {
+      FreeBlock* next;
+   };
+
+   // trivially destructible so the lists stay usable while other thread
+   // locals and statics are being destroyed
+   struct FreeLists {
+      FreeBlock* heads[numSizes];
+      size_t counts[numSizes];
+      bool drained;
+   };
+
+   thread_local FreeLists freeLists = { { nullptr }, { 0 }, false };
+
+   // returns the blocks of a thread to the system when the thread exits
+   struct FreeListsGuard {
+
+      ~FreeListsGuard (void)
+      {
+         for (size_t i = 0; i < numSizes; i++) {
+            while (freeLists.heads[i]) {
+               FreeBlock* block = freeLists.heads[i];
+               freeLists.heads[i] = block->next;
+               ::operator delete(block);
+            }
+            freeLists.counts[i] = 0;
+         }
+         freeLists.drained = true;
+      }
+   };
+
+   thread_local FreeListsGuard freeListsGuard;
+
+   std::atomic<unsigned long long int> nRequests(0);
+   std::atomic<unsigned long long int> nAllocations(0);
+
+} // namespace
+
+////////////////////////////////////////////////////////////////////////////////
+void*
+DgFreeList::allocate (size_t size)
+{
+   nRequests.fetch_add(1, std::memory_order_relaxed);
+   if (size == 0 || size > maxBlockSize) {
+      nAllocations.fetch_add(1, std::memory_order_relaxed);
+      return ::operator new(size);
+   }
+
+   // odr-use the guard so it is constructed on this thread
+   (void) &freeListsGuard;
+
+   size_t ndx = (size - 1) / blockAlign;
+   FreeBlock* block = freeLists.heads[ndx];
+   if (block) {
+      freeLists.heads[ndx] = block->next;
+      freeLists.counts[ndx]--;
+      return block;
+   }
+
+   nAllocations.fetch_add(1, std::memory_order_relaxed);
+   return ::operator new((ndx + 1) * blockAlign);
+
+} // void* DgFreeList::allocate
+
+////////////////////////////////////////////////////////////////////////////////
+void
+DgFreeList::release (void* ptr, size_t size)
+{
+   if (!ptr) return;
+
+   size_t ndx = (size - 1) / blockAlign;
+   if (size == 0 || size > maxBlockSize || freeLists.drained ||
+          freeLists.counts[ndx] >= maxFreeBlocks) {
+      ::operator delete(ptr);
+      return;
+   }
+
+   FreeBlock* block = static_cast<FreeBlock*>(ptr);
+   block->next = freeLists.heads[ndx];
+   freeLists.heads[ndx] = block;
+   freeLists.counts[ndx]++;
+
+} // void DgFreeList::release
+
+////////////////////////////////////////////////////////////////////////////////
+unsigned long long int
+DgFreeList::requests (void)
+{
+   return nRequests.load(std::memory_order_relaxed);
+
+} // unsigned long long int DgFreeList::requests
+
+////////////////////////////////////////////////////////////////////////////////
+unsigned long long int
+DgFreeList::allocations (void)
+{
+   return nAllocations.load(std::memory_order_relaxed);
+
+} // unsigned long long int DgFreeList::allocations
+
+////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////
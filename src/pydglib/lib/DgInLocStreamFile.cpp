@@ -59,6 +59,8 @@ DgInLocStreamFile::open (const string *fileNameIn, DgReportLevel failLevel)
 {
     if (fileNameIn)
         fileName_ = *fileNameIn;
+   // virtual file system paths (/vsimem/ etc.) are read by the GDAL readers directly
+   if (this->DATA.empty() && (fileName_.rfind("/vsi", 0) == 0)) { return true; }
    // make sure we are not already open
    if (this->DATA.empty())
    {
@@ -32,6 +32,7 @@
 #include "dglib/DgCell.h"
 #include "dglib/DgContCartRF.h"
 #include "dglib/DgGeoSphRF.h"
+#include "dglib/DgVsiHooks.h"
 
 ////////////////////////////////////////////////////////////////////////////////
 DgInShapefile::DgInShapefile (const DgGeoSphRF& geoRFIn,
@@ -62,7 +63,7 @@ DgInShapefile::open (const string* fileNameIn, DgReportLevel failLevelIn)
    nextPart_ = 0;
    isEOF_ = false;
 
-   shpFile_ = SHPOpen(fileName_.c_str(), "rb");
+   shpFile_ = SHPOpenLL(fileName_.c_str(), "rb", dgg::vsi::hooks());
    if (shpFile_ == NULL)
       report("DgInShapefile::open() unable to open shapefile " +
              fileName_, failLevelIn);
@@ -31,6 +31,7 @@
 #include "dglib/DgLocation.h"
 #include "dglib/DgCell.h"
 #include "dglib/DgContCartRF.h"
+#include "dglib/DgVsiHooks.h"
 
 ////////////////////////////////////////////////////////////////////////////////
 DgInShapefileAtt::DgInShapefileAtt (const DgGeoSphRF& geoRFIn,
@@ -52,7 +53,7 @@ DgInShapefileAtt::open (const string* fileNameIn, DgReportLevel failLevelIn)
    if (!DgInShapefile::open(fileNameIn, failLevelIn))
       return false;
 
-   dbfFile_ = DBFOpen(fileName_.c_str(), "rb");
+   dbfFile_ = DBFOpenLL(fileName_.c_str(), "rb", dgg::vsi::hooks());
    if (dbfFile_ == NULL)
    {
       report("DgInShapefileAtt::open() unable to open dbf file " +
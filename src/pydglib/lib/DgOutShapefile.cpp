@@ -33,6 +33,7 @@
 #include "dglib/DgLocation.h"
 #include "dglib/DgCell.h"
 #include "dglib/DgGeoSphRF.h"
+#include "dglib/DgVsiHooks.h"
 
 ////////////////////////////////////////////////////////////////////////////////
 ////////////////////////////////////////////////////////////////////////////////
@@ -63,7 +64,7 @@ DgOutShapefile::open (const string& fileName, DgReportLevel failLevel)
    // create the database file
 
    dbFileName_ = fileName + ".dbf";
-   dbFile_ = DBFCreate(dbFileName_.c_str());
+   dbFile_ = DBFCreateLL(dbFileName_.c_str(), "LDID/87", dgg::vsi::hooks());
    if (dbFile_ == NULL)
    {
       report("DgOutShapefile::open() unable to create database file " +
@@ -83,7 +84,7 @@ DgOutShapefile::open (const string& fileName, DgReportLevel failLevel)
 
    DBFClose(dbFile_);
 
-   dbFile_ = DBFOpen(dbFileName_.c_str(), "rb+");
+   dbFile_ = DBFOpenLL(dbFileName_.c_str(), "rb+", dgg::vsi::hooks());
    if (!dbFile_)
       report("DgOutShapefile::open() unable to open database file " +
              dbFileName_, failLevel);
@@ -94,9 +95,9 @@ DgOutShapefile::open (const string& fileName, DgReportLevel failLevel)
 
    shpFileName_ = fileName + ".shp";
    if (isPointFile())
-      shpFile_ = SHPCreate(shpFileName_.c_str(), SHPT_POINT);
+      shpFile_ = SHPCreateLL(shpFileName_.c_str(), SHPT_POINT, dgg::vsi::hooks());
    else
-      shpFile_ = SHPCreate(shpFileName_.c_str(), SHPT_POLYGON);
+      shpFile_ = SHPCreateLL(shpFileName_.c_str(), SHPT_POLYGON, dgg::vsi::hooks());
 
    if (!shpFile_)
       report("DgOutShapefile::open() unable to create shapefile " +
@@ -106,13 +107,7 @@ DgOutShapefile::open (const string& fileName, DgReportLevel failLevel)
 
    // create the projection file
    string prjFileName = fileName + ".prj";
-   ofstream prjFile;
-   prjFile.open(prjFileName.c_str(), ios::out);
-   if (!prjFile.good())
-      report("DgOutShapefile::open() unable to open file " + prjFileName,
-             failLevel);
-   else
-      debug("DgOutShapefile::open() opened file " + prjFileName);
+   ostringstream prjFile;
 
    int precision = 0;
    string datumName;
@@ -141,7 +136,19 @@ DgOutShapefile::open (const string& fileName, DgReportLevel failLevel)
    prjFile << std::fixed << setprecision(precision) << earthRadiusM;
    prjFile << ",0]],PRIMEM[\"Greenwich\",0],";
    prjFile << "UNIT[\"Degree\",0.017453292519943295]]\n";
-   prjFile.close();
+
+   SAHooks* hooks = dgg::vsi::hooks();
+   SAFile prjOut = hooks->FOpen(prjFileName.c_str(), "wb");
+   if (!prjOut)
+      report("DgOutShapefile::open() unable to open file " + prjFileName,
+             failLevel);
+   else
+   {
+      string prjText = prjFile.str();
+      hooks->FWrite((void*) prjText.data(), 1, (SAOffset) prjText.size(), prjOut);
+      hooks->FClose(prjOut);
+      debug("DgOutShapefile::open() wrote file " + prjFileName);
+   }
 
    return (dbFile_ && shpFile_);
 
@@ -171,7 +178,7 @@ DgOutShapefile::addFields (const set<DgDBFfield>& fields)
 
    DBFClose(dbFile_);
 
-   dbFile_ = DBFOpen(dbFileName_.c_str(), "rb+");
+   dbFile_ = DBFOpenLL(dbFileName_.c_str(), "rb+", dgg::vsi::hooks());
    if (!dbFile_)
       report("DgOutShapefile::addFields() unable to reopen database file " +
              dbFileName_, DgBase::Fatal);
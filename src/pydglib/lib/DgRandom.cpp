@@ -53,9 +53,10 @@ DgRandMother::nextRand (void)
 
 #include <string.h>
 
-static short mother1[10];
-static short mother2[10];
-static short mStart=1;
+// generator state is per thread so concurrent queries do not race on it
+static thread_local short mother1[10];
+static thread_local short mother2[10];
+static thread_local short mStart=1;
 
 #define m16Long 65536L				/* 2^16 */
 #define m16Mask 0xFFFF          /* mask for lower 16 bits */
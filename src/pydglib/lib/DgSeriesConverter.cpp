@@ -219,7 +219,7 @@ DgAddressBase*
 DgSeriesConverter::createConvertedAddress (const DgAddressBase& addIn) const
 {
    // keep track of nested series depth for formatting output
-   static int seriesDepth = 0;
+   static thread_local int seriesDepth = 0;
    seriesDepth++;
 
    if (isTraceOn())